@@ -10,6 +10,7 @@ import yaml
 
 from apier.core.api.merge import merge_spec_files, MergeWarning
 from apier.core.build import build as build_api_client
+from apier.core.output import MANIFEST_FILENAME
 from apier.core.renderer import builtin_template_map
 
 # Global variable to control the verbosity of the warning messages
@@ -76,8 +77,52 @@ def cli(ctx):
     is_flag=True,
     help="Overwrite the output directory if it already exists.",
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only rewrite the files that changed since the previous incremental "
+    "build, and remove the files of that build that are no longer generated.",
+)
+@click.option(
+    "--no-format",
+    is_flag=True,
+    help="Do not format the generated code (faster, e.g., for CI pipelines).",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to render the client files.",
+)
+@click.option(
+    "--parse-jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to parse the endpoints of large definitions "
+    "(at most one per CPU).",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True),
+    help="Directory used to cache the compiled templates between builds.",
+)
 @click.pass_context
-def build(ctx, input_, output, template, custom_template, overwrite):
+def build(
+    ctx,
+    input_,
+    output,
+    template,
+    custom_template,
+    overwrite,
+    incremental,
+    no_format,
+    jobs,
+    parse_jobs,
+    cache_dir,
+):
     """
     Generate an API client from OpenAPI files.
 
@@ -104,7 +149,11 @@ def build(ctx, input_, output, template, custom_template, overwrite):
 
     input_files = _get_file_list(input_)
 
-    if not overwrite and os.path.exists(output):
+    # Incremental builds only update directories written by a previous one
+    previous_build = incremental and os.path.exists(
+        os.path.join(output, MANIFEST_FILENAME)
+    )
+    if not overwrite and not previous_build and os.path.exists(output):
         raise click.UsageError(
             f"Output directory '{output}' already "
             f"exists. Use --overwrite to replace it.",
@@ -5,15 +5,22 @@ and their associated operations, parameters, and content schemas.
 
 from __future__ import annotations
 
+import gc
+import io
+import math
+import multiprocessing
+import os
+import pickle
 import re
 import uuid
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List, Tuple
 
 from apier.core.api.openapi import Definition
 from apier.core.consts import NO_RESPONSE_ID
-from apier.extensions.extensions import Extensions, parse_extensions
+from apier.extensions.extensions import Extensions, parse_operation_extensions
 from apier.utils.dicts import get_multi_key
 from apier.utils.strings import to_pascal_case
 
@@ -146,6 +153,12 @@ class EndpointsParser:
     def __init__(self, definition: Definition = None):
         self.definition = definition
         self._schemas = {}
+        self._schema_name_suffixes = {}
+
+        # Content schemas whose names are allocated after parsing (used when
+        # endpoints are parsed in worker processes)
+        self._deferred_schemas = None
+
         if definition:
             self._init_schemas()
 
@@ -162,17 +175,36 @@ class EndpointsParser:
         OpenAPI definition under the 'components.schemas' section.
         """
         self._schemas = {}
+        self._schema_name_suffixes = {}
         schemas = self.definition.get_value("components.schemas", default={})
         for schema_name, schema_def in schemas.items():
             self._schemas[schema_name] = schema_def
 
     def parse_endpoint(self, path: str) -> Endpoint:
         endpoint = Endpoint(path=path, definition=self.definition)
-        split_endpoint_layers(endpoint)
-        if self.definition is not None:
-            parse_parameters(endpoint)
-            self.parse_content_schemas(endpoint)
-            parse_extensions(endpoint)
+        if self.definition is None:
+            split_endpoint_layers(endpoint)
+            return endpoint
+
+        # The path item is visited once, and its parameters are indexed so
+        # that they are found without scanning all the operations again
+        path_item = self.definition.paths[path]
+        split_endpoint_layers(endpoint, index_parameters(self.definition, path_item))
+
+        path_parameters = parse_path_item_parameters(self.definition, path_item)
+        for method_name, operation in path_item.items():
+            if method_name.lower() not in _ALLOWED_OPERATIONS:
+                continue
+
+            endpoint_operation = parse_operation(
+                self.definition, method_name, operation, path_parameters
+            )
+            endpoint.operations.append(endpoint_operation)
+            self.parse_operation_content_schemas(
+                endpoint, endpoint_operation, operation
+            )
+            parse_operation_extensions(self.definition, endpoint_operation)
+
         return endpoint
 
     def parse_content_schemas(self, endpoint: Endpoint):
@@ -187,52 +219,64 @@ class EndpointsParser:
                 continue
 
             endpoint_operation = endpoint.layers[-1].get_operation(method_name)
+            self.parse_operation_content_schemas(
+                endpoint, endpoint_operation, operation
+            )
 
-            req_schemas = []
-            req_definition = get_multi_key(operation, "requestBody.content", ".", {})
-            for content_type, content_type_definition in req_definition.items():
+    def parse_operation_content_schemas(
+        self,
+        endpoint: Endpoint,
+        endpoint_operation: EndpointOperation,
+        operation: dict,
+    ):
+        """
+        Parses the request and response content schemas of an operation of the
+        given Endpoint and adds them to the EndpointOperation instance.
+
+        :param endpoint: The Endpoint of the operation.
+        :param endpoint_operation: The EndpointOperation instance.
+        :param operation: The operation definition.
+        """
+        req_schemas = []
+        req_definition = get_multi_key(operation, "requestBody.content", ".", {})
+        for content_type, content_type_definition in req_definition.items():
+            schema = content_type_definition.get("schema", {})
+            req_schemas.append(
+                self.parse_schema(endpoint, endpoint_operation, schema, content_type)
+            )
+
+        resp_schemas = []
+        resp_definition = operation.get("responses", {})
+        for resp_code, resp_definition in resp_definition.items():
+            resp_code = int(resp_code if resp_code != "default" else 0)
+            if "$ref" in resp_definition:
+                resp_definition = endpoint.definition.solve_ref(resp_definition["$ref"])
+            resp_definition = resp_definition.get("content", {})
+            for content_type, content_type_definition in resp_definition.items():
                 schema = content_type_definition.get("schema", {})
-                req_schemas.append(
+                resp_schemas.append(
                     self.parse_schema(
-                        endpoint, endpoint_operation, schema, content_type
+                        endpoint,
+                        endpoint_operation,
+                        schema,
+                        content_type,
+                        resp_code,
                     )
                 )
 
-            resp_schemas = []
-            resp_definition = operation.get("responses", {})
-            for resp_code, resp_definition in resp_definition.items():
-                resp_code = int(resp_code if resp_code != "default" else 0)
-                if "$ref" in resp_definition:
-                    resp_definition = endpoint.definition.solve_ref(
-                        resp_definition["$ref"]
-                    )
-                resp_definition = resp_definition.get("content", {})
-                for content_type, content_type_definition in resp_definition.items():
-                    schema = content_type_definition.get("schema", {})
-                    resp_schemas.append(
-                        self.parse_schema(
-                            endpoint,
-                            endpoint_operation,
-                            schema,
-                            content_type,
-                            resp_code,
-                        )
-                    )
-
-                if len(resp_definition) == 0:
-                    resp_schemas.append(
-                        ContentSchema(
-                            name=NO_RESPONSE_ID,
-                            code=resp_code,
-                            content_type="",
-                            schema=resp_definition,
-                            is_inline=True,
-                        )
+            if len(resp_definition) == 0:
+                resp_schemas.append(
+                    ContentSchema(
+                        name=NO_RESPONSE_ID,
+                        code=resp_code,
+                        content_type="",
+                        schema=resp_definition,
+                        is_inline=True,
                     )
+                )
 
-            operation = endpoint.layers[-1].get_operation(method_name)
-            operation.request_schemas = req_schemas
-            operation.response_schemas = resp_schemas
+        endpoint_operation.request_schemas = req_schemas
+        endpoint_operation.response_schemas = resp_schemas
 
     def parse_schema(
         self,
@@ -244,7 +288,7 @@ class EndpointsParser:
     ) -> ContentSchema:
         """
         Parses a content schema and inserts it to the global dictionary of schemas
-        if it's missing.
+        if it's missing (see `_register_schema()`).
 
         If the given schema is defined inline, the name will be taken from the
         'title' attribute. Otherwise, the name will be generated automatically.
@@ -266,16 +310,14 @@ class EndpointsParser:
             warnings.warn(f"Unsupported Content-Type: {content_type}")
 
         is_inline = False
+        title = None
         if "$ref" in schema_def:
             schema_name = schema_def["$ref"].split("/")[-1]
             schema_def = endpoint.definition.solve_ref(schema_def["$ref"])
         else:
             is_inline = True
-            schema_name = schema_def.get("title")
-            if schema_name:
-                if schema_name in self._schemas:
-                    raise Exception(f"Schema name '{schema_name}' is already taken")
-            else:
+            schema_name = title = schema_def.get("title")
+            if not schema_name:
                 schema_name = endpoint_operation.definition.get(
                     "operationId", endpoint.path
                 )
@@ -286,30 +328,94 @@ class EndpointsParser:
                 else:
                     schema_name += "Request"
 
-        schema_name = to_pascal_case(schema_name)
-
-        # Generate a new schema name if the current is already taken
-        i = 1
-        original_schema_name = schema_name
-        while is_inline and schema_name in self._schemas:
-            i += 1
-            schema_name = to_pascal_case(original_schema_name + str(i))
-
-        self._schemas[schema_name] = schema_def
-        return ContentSchema(
-            name=schema_name,
+        content_schema = ContentSchema(
+            name=to_pascal_case(schema_name),
             code=resp_code,
             content_type=content_type,
             schema=schema_def,
             is_inline=is_inline,
         )
 
+        if self._deferred_schemas is not None:
+            self._deferred_schemas.append((content_schema, title))
+        else:
+            self._register_schema(content_schema, title)
+        return content_schema
+
+    def _register_schema(self, content_schema: ContentSchema, title: str = None):
+        """
+        Inserts the given content schema to the global dictionary of schemas,
+        renaming it if it is defined inline and its name is already taken.
+
+        :param content_schema: The ContentSchema to register.
+        :param title: The title of the schema, if it is defined inline.
+        """
+        if title and title in self._schemas:
+            raise Exception(f"Schema name '{title}' is already taken")
+
+        # Generate a new schema name if the current is already taken. The
+        # last suffix used for each name is kept, since the previous ones are
+        # already taken
+        schema_name = original_schema_name = content_schema.name
+        i = self._schema_name_suffixes.get(original_schema_name, 1)
+        while content_schema.is_inline and schema_name in self._schemas:
+            i += 1
+            schema_name = to_pascal_case(original_schema_name + str(i))
+        if schema_name != original_schema_name:
+            self._schema_name_suffixes[original_schema_name] = i
+
+        self._schemas[schema_name] = content_schema.schema
+        content_schema.name = schema_name
+
+    def parse_endpoints(self, paths: List[str] = None, jobs: int = 1) -> List[Endpoint]:
+        """
+        Parses the endpoints of the given paths (all the paths of the
+        definition by default).
+
+        If more than one job is given and there are enough paths, groups of
+        paths are parsed concurrently by a pool of forked processes (at most
+        one per CPU). The names of the schemas are then allocated in the order
+        of the paths, so the result is the same as if they were parsed
+        sequentially.
+
+        :param paths: The paths of the endpoints.
+        :param jobs: The maximum number of processes used to parse the
+                     endpoints.
+        :return: The list of parsed endpoints.
+        """
+        if paths is None:
+            paths = list(self.definition.paths) if self.definition else []
+
+        jobs = min(jobs, os.cpu_count() or 1, len(paths) // _MIN_PATHS_PER_JOB)
+        if jobs <= 1 or self.definition is None or not _can_fork():
+            return [self.parse_endpoint(path) for path in paths]
+
+        endpoints = []
+        for group_endpoints, deferred_schemas in _parse_endpoints_parallel(
+            self, paths, jobs
+        ):
+            endpoints += group_endpoints
+            for content_schema, title in deferred_schemas:
+                self._register_schema(content_schema, title)
+        return endpoints
+
 
-def split_endpoint_layers(endpoint: Endpoint):
+def split_endpoint_layers(endpoint: Endpoint, parameters_index: dict = None):
     """
     Splits the path of the given Endpoint into all their layers and adds them
     to the instance.
+
+    :param endpoint: The Endpoint to split.
+    :param parameters_index: The parameters of the endpoint indexed by
+                             location and name (see `index_parameters()`).
+                             If not given, it is built from the definition of
+                             the endpoint.
     """
+    if parameters_index is None and endpoint.definition is not None:
+        parameters_index = index_parameters(
+            endpoint.definition, endpoint.definition.paths[endpoint.path]
+        )
+
     path_levels = endpoint.path.split("/")
 
     # TODO: Review special cases (e.g. empty endpoints, trailing slash...)
@@ -323,7 +429,9 @@ def split_endpoint_layers(endpoint: Endpoint):
         elif re.match(r"^{.+}$", p):
             param_name = p[1 : len(p) - 1]
             endpoint_layer.path += f"/{p}"
-            param, _ = get_first_endpoint_param(endpoint, param_name, "path")
+            param, _ = get_first_endpoint_param(
+                endpoint, param_name, "path", parameters_index
+            )
             endpoint_layer.parameters.append(param)
         elif p.startswith("{") or p.endswith("}"):
             raise Exception("wrong parameter format in path")
@@ -337,8 +445,36 @@ def split_endpoint_layers(endpoint: Endpoint):
     endpoint.layers.append(endpoint_layer)
 
 
+def index_parameters(definition: Definition, path_item: dict) -> dict:
+    """
+    Returns the parameters defined in the given path item (both for the path
+    and for its operations) indexed by their location and name. If a parameter
+    is defined more than once, the first definition is kept.
+
+    :param definition: The OpenAPI definition.
+    :param path_item: The definition of the path.
+    :return: A dictionary of parameter definitions indexed by (in, name).
+    """
+    index = {}
+    for key, value in path_item.items():
+        if key in _ALLOWED_OPERATIONS:
+            value = value.get("parameters", [])
+        elif key != "parameters":
+            continue
+
+        for schema_def in value:
+            if "$ref" in schema_def:
+                schema_def = definition.solve_ref(schema_def["$ref"])
+            index.setdefault((schema_def.get("in"), schema_def.get("name")), schema_def)
+
+    return index
+
+
 def get_first_endpoint_param(
-    endpoint: Endpoint, param_name: str, in_location: str
+    endpoint: Endpoint,
+    param_name: str,
+    in_location: str,
+    parameters_index: dict = None,
 ) -> Tuple[EndpointParameter, bool]:
     """
     Return an EndpointParameter with the information of the first parameter
@@ -350,35 +486,22 @@ def get_first_endpoint_param(
     :param endpoint:    The Endpoint to search for the parameter.
     :param param_name:  The parameter name.
     :param in_location: The location of the parameter (path, query...).
+    :param parameters_index: The parameters of the endpoint indexed by
+                             location and name (see `index_parameters()`).
+                             If not given, it is built from the definition of
+                             the endpoint.
     :return: The parameter information and a boolean value indicating whether
              the parameter description has been found in the endpoint definition.
     """
-    schema_found = False
-    param_schema = {}
-    if endpoint.definition is not None:
-        for key, value in endpoint.definition.paths[endpoint.path].items():
-            if schema_found:
-                break
-
-            if key != "parameters" and key not in _ALLOWED_OPERATIONS:
-                continue
+    if parameters_index is None and endpoint.definition is not None:
+        parameters_index = index_parameters(
+            endpoint.definition, endpoint.definition.paths[endpoint.path]
+        )
 
-            if key in _ALLOWED_OPERATIONS:
-                if "parameters" in value:
-                    value = value["parameters"]
-                else:
-                    continue
-
-            for schema_def in value:
-                if "$ref" in schema_def:
-                    schema_def = endpoint.definition.solve_ref(schema_def["$ref"])
-                if (
-                    schema_def.get("in") == in_location
-                    and schema_def.get("name") == param_name
-                ):
-                    param_schema = schema_def
-                    schema_found = True
-                    break
+    param_schema = (parameters_index or {}).get((in_location, param_name))
+    schema_found = param_schema is not None
+    if not schema_found:
+        param_schema = {}
 
     return (
         EndpointParameter(
@@ -400,37 +523,64 @@ def parse_parameters(endpoint: Endpoint):
     Parses all the request parameters of the given Endpoint and adds them
     to the instance.
     """
-    parameters = {}  # type: dict[tuple, EndpointParameter]
     path_config = endpoint.definition.paths[endpoint.path]
-
-    if "parameters" in path_config:
-        for p in path_config["parameters"]:
-            parameter = parse_parameter(endpoint.definition, p)
-            parameters[(parameter.in_location, parameter.name)] = parameter
+    parameters = parse_path_item_parameters(endpoint.definition, path_config)
 
     for operation_name, operation in path_config.items():
         if operation_name.lower() not in _ALLOWED_OPERATIONS:
             continue
 
-        op_parameters = parameters.copy()
-
-        if "parameters" in operation:
-            for p in operation["parameters"]:
-                parameter = parse_parameter(endpoint.definition, p)
-                op_parameters[(parameter.in_location, parameter.name)] = parameter
-
         endpoint.operations.append(
-            EndpointOperation(
-                name=operation_name.lower(),
-                definition=operation,
-                description=operation.get("description"),
-                parameters=list(op_parameters.values()),
-            )
+            parse_operation(endpoint.definition, operation_name, operation, parameters)
         )
 
     return None
 
 
+def parse_path_item_parameters(definition: Definition, path_item: dict) -> dict:
+    """
+    Parses the parameters shared by all the operations of a path.
+
+    :param definition: The OpenAPI definition.
+    :param path_item: The definition of the path.
+    :return: A dictionary of EndpointParameter indexed by (in, name).
+    """
+    parameters = {}  # type: dict[tuple, EndpointParameter]
+    for p in path_item.get("parameters", []):
+        parameter = parse_parameter(definition, p)
+        parameters[(parameter.in_location, parameter.name)] = parameter
+    return parameters
+
+
+def parse_operation(
+    definition: Definition,
+    operation_name: str,
+    operation: dict,
+    path_parameters: dict,
+) -> EndpointOperation:
+    """
+    Parses an operation and its parameters, without its content schemas.
+
+    :param definition: The OpenAPI definition.
+    :param operation_name: The operation name (e.g. "get").
+    :param operation: The operation definition.
+    :param path_parameters: The parameters shared by all the operations of
+                            the path (see `parse_path_item_parameters()`).
+    :return: An EndpointOperation with the operation information.
+    """
+    op_parameters = path_parameters.copy()
+    for p in operation.get("parameters", []):
+        parameter = parse_parameter(definition, p)
+        op_parameters[(parameter.in_location, parameter.name)] = parameter
+
+    return EndpointOperation(
+        name=operation_name.lower(),
+        definition=operation,
+        description=operation.get("description"),
+        parameters=list(op_parameters.values()),
+    )
+
+
 def parse_parameter(definition: Definition, parameter_info: dict) -> EndpointParameter:
     """
     Parses a parameter definition.
@@ -451,3 +601,120 @@ def parse_parameter(definition: Definition, parameter_info: dict) -> EndpointPar
         required=info.get("required", False) if info["in"] != "path" else True,
         format=info.get("format", ""),
     )
+
+
+# Parser and index of the objects of its definition used by the worker
+# processes parsing endpoints
+_worker_state = None
+
+# Containers of the definition, which are sent by reference to the workers
+_CONTAINER_TYPES = (dict, list)
+
+# Minimum number of paths parsed by each process, since sending the parsed
+# endpoints back to the parent process is not much cheaper than parsing them
+_MIN_PATHS_PER_JOB = 250
+
+
+def _can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _definition_objects(definition: Definition) -> dict:
+    """
+    Returns the containers (dicts and lists) of the given definition indexed
+    by their ids.
+    """
+    objects = {}
+    stack = [definition.definition]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in objects:
+            continue
+        objects[id(obj)] = obj
+        values = obj.values() if type(obj) is dict else obj
+        stack += [v for v in values if type(v) in _CONTAINER_TYPES]
+    return objects
+
+
+class _DefinitionPickler(pickle.Pickler):
+    """
+    Pickler that serializes the definition and its objects by reference.
+
+    Worker processes are forked, so the objects of the definition have the
+    same ids in the worker and in the parent process. Parsed endpoints are
+    sent to the parent without copying the definition, and they keep
+    referencing the same objects as if they were parsed by the parent.
+    """
+
+    def __init__(self, file, definition: Definition, objects: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._definition = definition
+        self._objects = objects
+
+    def persistent_id(self, obj):
+        if obj is self._definition:
+            return "definition"
+        if type(obj) in _CONTAINER_TYPES and self._objects.get(id(obj)) is obj:
+            return id(obj)
+        return None
+
+
+class _DefinitionUnpickler(pickle.Unpickler):
+    def __init__(self, file, definition: Definition, objects: dict):
+        super().__init__(file)
+        self._definition = definition
+        self._objects = objects
+
+    def persistent_load(self, pid):
+        if pid == "definition":
+            return self._definition
+        return self._objects[pid]
+
+
+def _init_worker(parser: EndpointsParser, objects: dict):
+    global _worker_state
+    _worker_state = (parser, objects)
+
+
+def _parse_endpoints_in_worker(paths: List[str]) -> bytes:
+    parser, objects = _worker_state
+    parser._deferred_schemas = []
+    endpoints = [parser.parse_endpoint(path) for path in paths]
+
+    buffer = io.BytesIO()
+    _DefinitionPickler(buffer, parser.definition, objects).dump(
+        (endpoints, parser._deferred_schemas)
+    )
+    return buffer.getvalue()
+
+
+def _parse_endpoints_parallel(parser: EndpointsParser, paths: List[str], jobs: int):
+    """
+    Parses the endpoints of the given paths using a pool of processes,
+    yielding the endpoints of each group of paths and their content schemas
+    pending to be registered, in the same order as the paths.
+    """
+    objects = _definition_objects(parser.definition)
+    group_size = max(1, math.ceil(len(paths) / (jobs * 4)))
+    groups = [paths[i : i + group_size] for i in range(0, len(paths), group_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(parser, objects),
+    ) as executor:
+        for result in executor.map(_parse_endpoints_in_worker, groups):
+            unpickler = _DefinitionUnpickler(
+                io.BytesIO(result), parser.definition, objects
+            )
+            # The garbage collector would traverse the whole definition
+            # several times while the endpoints are being loaded
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                result = unpickler.load()
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            yield result
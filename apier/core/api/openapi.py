@@ -14,6 +14,18 @@ class Definition:
     def __init__(self, definition: dict):
         self.definition = definition
 
+    @property
+    def definition(self) -> dict:
+        """
+        Returns the content of this definition.
+        """
+        return self._definition
+
+    @definition.setter
+    def definition(self, definition: dict):
+        self._definition = definition
+        self.clear_refs()
+
     @staticmethod
     def load(filename):
         """
@@ -54,13 +66,31 @@ class Definition:
 
     def solve_ref(self, ref: str) -> Mapping[str, Any]:
         """
-        Returns the definition of the given reference ($ref).
+        Returns the definition of the given reference ($ref). References are
+        only solved the first time, since the same components are usually
+        referenced by many endpoints.
         :param ref: A definition reference (e.g. "#/components/schemas/Store").
         :return: The reference defintion. It raises a KeyError if the value
                  is not found.
         """
+        try:
+            return self._refs[ref]
+        except KeyError:
+            pass
+
         ref_clean = ref.replace("#/", "")
         try:
-            return self.get_value(ref_clean, "/")
+            value = self.get_value(ref_clean, "/")
         except KeyError:
             raise KeyError(f"Reference '{ref}' not found")
+
+        self._refs[ref] = value
+        return value
+
+    def clear_refs(self):
+        """
+        Clears the cache of solved references. Solved references are kept
+        until the definition is replaced, so this must be called if the
+        content of the definition is modified in place.
+        """
+        self._refs = {}
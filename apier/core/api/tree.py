@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import copy
+import dataclasses
 import itertools
 import uuid
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from apier.core.api.endpoints import EndpointLayer, Endpoint, EndpointsParser
+from apier.core.api.endpoints import EndpointLayer, Endpoint
 
 
 class PathNotFoundException(Exception):
@@ -23,6 +23,13 @@ class APITree:
 
     branches: List[APINode] = field(default_factory=list)
 
+    # Branches indexed by API level. Branches are only appended, so the ones
+    # not indexed yet are indexed on the next lookup.
+    _nodes: Dict[str, List[APINode]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _num_indexed: int = field(default=0, init=False, repr=False, compare=False)
+
     def node(self, api_level: str) -> APINode | None:
         """
         Returns the node of the tree with the given API level, or None if it is
@@ -32,10 +39,8 @@ class APITree:
         :return: Node of the tree with the given API level, or None if the level
                  is not found.
         """
-        for node in self.branches:
-            if node.api == api_level:
-                return node
-        return None
+        nodes = self._nodes_of(api_level)
+        return nodes[0] if nodes else None
 
     def search_path(self, search_path: str) -> (APITree, APINode, list[EndpointLayer]):
         """
@@ -46,29 +51,37 @@ class APITree:
         :raises PathNotFoundException: The path was not found in the tree.
         :return: The tree, node and endpoint layer found in the tree.
         """
-        search_endpoint = EndpointsParser().parse_endpoint(search_path)
         layers = []
 
         accumulated_path = ""
         tree = self
-        for search_layer in search_endpoint.layers:
-            accumulated_path += search_layer.path
-            node_matched = False
-            for node in tree.branches:
-                if node_matched:
-                    break
-                for layer in node.layers:
-                    if layer.path == search_layer.path:
-                        if layer not in layers:
-                            layers.append(layer)
-                        if accumulated_path.startswith(search_path):
-                            return tree, node, layers
-                        tree = node.next
-                        node_matched = True
-                        break
+        for layer_path, api_level in _split_path(search_path):
+            accumulated_path += layer_path
+            for node in tree._nodes_of(api_level):
+                layer = next((p for p in node.layers if p.path == layer_path), None)
+                if layer is None:
+                    continue
+
+                if not any(p is layer for p in layers):
+                    layers.append(layer)
+                if accumulated_path.startswith(search_path):
+                    return tree, node, layers
+                tree = node.next
+                break
 
         raise PathNotFoundException(f"path not found in api tree: {search_path}")
 
+    def _nodes_of(self, api_level: str) -> List[APINode]:
+        """
+        Returns the nodes of the tree with the given API level, in the order
+        of the branches.
+        """
+        if self._num_indexed < len(self.branches):
+            for node in self.branches[self._num_indexed :]:
+                self._nodes.setdefault(node.api, []).append(node)
+            self._num_indexed = len(self.branches)
+        return self._nodes.get(api_level, [])
+
 
 @dataclass
 class APINode:
@@ -94,8 +107,9 @@ def build_endpoints_tree(endpoints: List[Endpoint], deepcopy: bool = True) -> AP
     Builds an APITree from the given list of endpoints.
 
     :param endpoints: List of Endpoint instances to build the tree.
-    :param deepcopy: Whether to create a deep copy of the endpoints list before
-                     building the tree so the original list is not modified.
+    :param deepcopy: Whether to build the tree with copies of the endpoint
+                     layers so the given endpoints are not modified. The
+                     operations and schemas of the layers are not copied.
     :return: An API tree built from the given list of endpoints.
     """
     api_tree = APITree()
@@ -104,32 +118,142 @@ def build_endpoints_tree(endpoints: List[Endpoint], deepcopy: bool = True) -> AP
         return api_tree
 
     if deepcopy:
-        endpoints = copy.deepcopy(endpoints)
+        endpoints = [_copy_endpoint(e) for e in endpoints]
 
     config = endpoints[0].definition.get_value("info.x-apier", ".", {})
-    equivalent_paths = config.get("equivalent_paths", [])
-    targets = [eq_path["target"] for eq_path in equivalent_paths]
+    equivalent_paths = _EquivalentPaths(config.get("equivalent_paths", []))
 
     # Sort endpoints to process target paths first. This is necessary to prevent
     # source paths from being created before the target paths.
-    endpoints.sort(
+    endpoints = sorted(
+        endpoints,
         key=lambda endpoint: (
-            not any(endpoint.path.startswith(source) for source in targets),
+            not equivalent_paths.is_target(endpoint.path),
             endpoint.path,
-        )
+        ),
     )
 
+    # Pairs of ids of the layers and the nodes linked as their next nodes
+    links = set()
     for e in endpoints:
-        _build_recursive(api_tree, api_tree, e.layers, config)
+        _build_recursive(api_tree, api_tree, e.layers, equivalent_paths, links)
 
     return api_tree
 
 
+def _copy_endpoint(endpoint: Endpoint) -> Endpoint:
+    """
+    Returns a copy of the given endpoint with new layers, which can be
+    modified while building the tree. The rest of the data is shared.
+    """
+    layers = [
+        dataclasses.replace(
+            layer,
+            api_levels=list(layer.api_levels),
+            parameters=list(layer.parameters),
+            next=list(layer.next),
+            operations=list(layer.operations),
+        )
+        for layer in endpoint.layers
+    ]
+    return dataclasses.replace(endpoint, layers=layers)
+
+
+class _PrefixTrie:
+    """
+    A character trie of a list of prefixes, which finds the first prefix of
+    the list that a string starts with in a time proportional to the length
+    of the string.
+    """
+
+    _END = None
+
+    def __init__(self, prefixes: List[str]):
+        self._root = {}
+        for i, prefix in enumerate(prefixes):
+            trie_node = self._root
+            for char in prefix:
+                trie_node = trie_node.setdefault(char, {})
+            trie_node.setdefault(self._END, i)
+
+    def first_prefix(self, string: str) -> Optional[int]:
+        """
+        Returns the position in the list of the first prefix that the given
+        string starts with, or None if it does not start with any of them.
+        """
+        trie_node = self._root
+        first = trie_node.get(self._END)
+        for char in string:
+            trie_node = trie_node.get(char)
+            if trie_node is None:
+                break
+            i = trie_node.get(self._END)
+            if i is not None and (first is None or i < first):
+                first = i
+        return first
+
+
+class _EquivalentPaths:
+    """
+    The equivalent paths of the API configuration, with their sources and
+    targets indexed in prefix tries.
+    """
+
+    def __init__(self, equivalent_paths: List[dict]):
+        self._equivalent_paths = equivalent_paths
+        self._sources = _PrefixTrie([eq["source"] for eq in equivalent_paths])
+        self._targets = _PrefixTrie([eq["target"] for eq in equivalent_paths])
+
+    def is_target(self, path: str) -> bool:
+        """
+        Returns whether the given path starts with the target of an
+        equivalent path.
+        """
+        return self._targets.first_prefix(path) is not None
+
+    def equivalent(self, path: str) -> Optional[str]:
+        """
+        Returns the path equivalent to the given one using the first
+        equivalent path whose source is a prefix of it, or None if there is
+        no such equivalent path.
+        """
+        i = self._sources.first_prefix(path)
+        if i is None:
+            return None
+        eq_path = self._equivalent_paths[i]
+        return path.replace(eq_path["source"], eq_path["target"])
+
+
+def _split_path(path: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Splits the given path into the paths of its layers, in the same way as
+    `split_endpoint_layers()`, and returns them with their API levels (None
+    if the layer has no API level).
+    """
+    layers = []
+    layer_path, api_level = "", None
+    for i, p in enumerate(path.split("/")[1:]):
+        if len(p) == 0:
+            continue
+        elif len(p) > 2 and p.startswith("{") and p.endswith("}"):
+            layer_path += f"/{p}"
+        elif p.startswith("{") or p.endswith("}"):
+            raise Exception("wrong parameter format in path")
+        else:
+            if i > 0:
+                layers.append((layer_path, api_level))
+            layer_path, api_level = f"/{p}", p
+
+    layers.append((layer_path, api_level))
+    return layers
+
+
 def _build_recursive(
     api_tree: APITree,
     current_tree: APITree,
     layers: List[EndpointLayer],
-    config: dict,
+    equivalent_paths: _EquivalentPaths,
+    links: set,
     current_path: str = "",
 ) -> APINode | None:
     if len(layers) == 0:
@@ -142,19 +266,14 @@ def _build_recursive(
         # raise Exception("this layer does not have an api level!")
         return None
 
-    equivalent_paths = config.get("equivalent_paths", [])
-    for eq_path in equivalent_paths:
-        if current_path.startswith(eq_path["source"]):
-            eq_path = current_path.replace(eq_path["source"], eq_path["target"])
-            try:
-                tree, node, _ = api_tree.search_path(eq_path)
-                current_tree.branches.append(node)
-                current_tree = tree
-                break
-            except PathNotFoundException as e:
-                raise PathNotFoundException(
-                    f"equivalent endpoint not found in tree: {e}"
-                )
+    eq_path = equivalent_paths.equivalent(current_path)
+    if eq_path is not None:
+        try:
+            tree, node, _ = api_tree.search_path(eq_path)
+            current_tree.branches.append(node)
+            current_tree = tree
+        except PathNotFoundException as e:
+            raise PathNotFoundException(f"equivalent endpoint not found in tree: {e}")
 
     api_level = layer.api_levels[0]
     node = current_tree.node(api_level)
@@ -176,10 +295,11 @@ def _build_recursive(
 
     if len(layers[1:]) > 0:
         next_node = _build_recursive(
-            api_tree, node.next, layers[1:], config, current_path
+            api_tree, node.next, layers[1:], equivalent_paths, links, current_path
         )
         if next_node is not None:
-            if next_node not in layer.next:
+            if (id(layer), id(next_node)) not in links:
+                links.add((id(layer), id(next_node)))
                 layer.next.append(next_node)
             # if next_node not in current_tree.branches:
             #     current_tree.branches.append(next_node)
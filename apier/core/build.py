@@ -34,9 +34,6 @@ def build(
         definition = Definition(merged_spec)
 
     parser = EndpointsParser(definition)
-
-    endpoints = []
-    for path in definition.paths:
-        endpoints.append(parser.parse_endpoint(path))
+    endpoints = parser.parse_endpoints(jobs=(ctx or {}).get("parse_jobs") or 1)
 
     render_api(ctx, template, definition, parser.schemas, endpoints, output_path)
@@ -0,0 +1,306 @@
+"""
+This module provides functionality to write the files of a generated API
+client, optionally updating only the files whose inputs have changed since
+the previous build.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from typing import Callable, Iterator, Optional, Union
+
+MANIFEST_FILENAME = ".apier-manifest.json"
+STAGING_DIRNAME = ".apier-staging"
+
+
+def content_hash(*contents: Union[str, bytes]) -> str:
+    """
+    Returns the SHA-256 hash of the given contents.
+    """
+    sha256 = hashlib.sha256()
+    for content in contents:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        sha256.update(len(content).to_bytes(8, "big"))
+        sha256.update(content)
+    return sha256.hexdigest()
+
+
+def directory_hash(path: str) -> str:
+    """
+    Returns the SHA-256 hash of the names and contents of the files in the
+    given directory.
+    """
+    contents = []
+    for rel_path in sorted(_walk_files(path)):
+        with open(os.path.join(path, rel_path), "rb") as f:
+            contents += [rel_path, f.read()]
+    return content_hash(*contents)
+
+
+def apier_version() -> str:
+    """
+    Returns the installed version of apier, or an empty string if it is not
+    installed as a package.
+    """
+    try:
+        return metadata.version("apier")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+class OutputWriter:
+    """
+    Writes the files of a generated API client in the output directory.
+
+    By default, the output directory is replaced. In incremental mode, the
+    hashes of the inputs and the contents of the written files are kept in a
+    manifest file in the output directory, and an output directory with the
+    manifest of a previous build is updated instead of replaced: the files
+    whose inputs and contents have not changed since the previous build are
+    not written again (so they keep their modification times), and the files
+    that are no longer generated are removed.
+
+    Files that must be formatted are first written in the build path, which is
+    a staging directory in incremental mode, and are only copied to the output
+    directory by `close()`, if their content has changed.
+    """
+
+    def __init__(self, output_path: str, fingerprint: str = "", incremental=False):
+        """
+        :param output_path: The output directory.
+        :param fingerprint: A hash of everything that affects the contents of
+                            all the files (e.g., the template and the apier
+                            version). The files of a previous build with a
+                            different fingerprint are always written again.
+        :param incremental: Whether only the changed files are written.
+        """
+        self.output_path = output_path
+        self.fingerprint = fingerprint
+        self.incremental = incremental
+        self.build_path = (
+            os.path.join(output_path, STAGING_DIRNAME) if incremental else output_path
+        )
+
+        # Manifest entries of the previous build and of the current one
+        self._previous = {}
+        self._previous_paths = set()
+        self._files = {}
+
+        # Input hash and group of the files written in the build path
+        self._pending = {}
+
+    def open(self):
+        """
+        Prepares the output directory before writing the files.
+        """
+        if self.incremental and self._load_manifest():
+            if os.path.exists(self.build_path):
+                shutil.rmtree(self.build_path)
+        elif os.path.exists(self.output_path):
+            shutil.rmtree(self.output_path)
+
+        os.makedirs(self.build_path, exist_ok=True)
+
+    def write(
+        self,
+        rel_path: str,
+        content: Union[str, bytes],
+        input_hash: Optional[str] = None,
+        formatted=True,
+    ):
+        """
+        Writes a file, unless it was written by the previous build from the
+        same inputs and has not been modified since then.
+
+        :param rel_path:   The path of the file relative to the output
+                           directory.
+        :param content:    The content of the file.
+        :param input_hash: The hash of the inputs of the file. By default,
+                           the hash of the given content.
+        :param formatted:  Whether the file is formatted before being moved to
+                           the output directory. Files that are not formatted
+                           are written immediately.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if input_hash is None:
+            input_hash = content_hash(content)
+
+        if self._is_up_to_date(rel_path, input_hash):
+            # The file may have been written by a previous call
+            self._pending.pop(rel_path, None)
+            return
+
+        if formatted:
+            _write_file(os.path.join(self.build_path, rel_path), content)
+            self._pending[rel_path] = (input_hash, None)
+        else:
+            self._pending.pop(rel_path, None)
+            self._commit_file(rel_path, content, input_hash)
+
+    def copy_tree(self, source_path: str):
+        """
+        Writes all the files of the given directory (excluding caches).
+        """
+        for rel_path in sorted(_walk_files(source_path)):
+            with open(os.path.join(source_path, rel_path), "rb") as f:
+                self.write(rel_path, f.read())
+
+    def generate(self, group: str, input_hash: str, generator: Callable[[str], None]):
+        """
+        Writes a group of files using the given generator, which receives the
+        build path. The generator is not called if the files of the group
+        were generated by the previous build from the same inputs and have not
+        been modified since then.
+
+        :param group:      The name of the group of files.
+        :param input_hash: The hash of the inputs of the generator.
+        :param generator:  The function that writes the files.
+        :return:           Whether the generator was called.
+        """
+        previous = {p: e for p, e in self._previous.items() if e.get("group") == group}
+        if previous and all(
+            e["input"] == input_hash and self._is_intact(p, e)
+            for p, e in previous.items()
+        ):
+            self._files.update(previous)
+            return False
+
+        existing_files = set(_walk_files(self.build_path))
+        generator(self.build_path)
+        for rel_path in set(_walk_files(self.build_path)) - existing_files:
+            self._pending[rel_path] = (input_hash, group)
+        return True
+
+    def format(self, formatter: Callable[[str], None]):
+        """
+        Formats the files written in the build path using the given formatter,
+        which receives the build path.
+        """
+        if self._pending:
+            formatter(self.build_path)
+
+    def close(self):
+        """
+        Copies the files written in the build path to the output directory,
+        and, in incremental mode, removes the files of the previous build that
+        are no longer generated and saves the manifest.
+        """
+        for rel_path, (input_hash, group) in sorted(self._pending.items()):
+            with open(os.path.join(self.build_path, rel_path), "rb") as f:
+                content = f.read()
+            self._commit_file(rel_path, content, input_hash, group)
+        self._pending = {}
+
+        if self.incremental:
+            shutil.rmtree(self.build_path)
+            for rel_path in sorted(self._previous_paths - self._files.keys()):
+                self._remove_file(rel_path)
+            self._save_manifest()
+
+    def _is_up_to_date(self, rel_path: str, input_hash: str) -> bool:
+        entry = self._previous.get(rel_path)
+        if entry is None or entry["input"] != input_hash:
+            return False
+        if not self._is_intact(rel_path, entry):
+            return False
+
+        self._files[rel_path] = entry
+        return True
+
+    def _is_intact(self, rel_path: str, entry: dict) -> bool:
+        """
+        Whether the file in the output directory has the content recorded in
+        the given manifest entry.
+        """
+        try:
+            with open(os.path.join(self.output_path, rel_path), "rb") as f:
+                return content_hash(f.read()) == entry["output"]
+        except OSError:
+            return False
+
+    def _commit_file(
+        self,
+        rel_path: str,
+        content: bytes,
+        input_hash: str,
+        group: Optional[str] = None,
+    ):
+        """
+        Writes the given file in the output directory if its content has
+        changed, and records it in the manifest.
+        """
+        filename = os.path.join(self.output_path, rel_path)
+        try:
+            with open(filename, "rb") as f:
+                changed = f.read() != content
+        except OSError:
+            changed = True
+
+        if changed:
+            _write_file(filename, content)
+
+        entry = {"input": input_hash, "output": content_hash(content)}
+        if group is not None:
+            entry["group"] = group
+        self._files[rel_path] = entry
+
+    def _remove_file(self, rel_path: str):
+        """
+        Removes a file of the output directory, and its parent directories if
+        they become empty.
+        """
+        filename = os.path.join(self.output_path, rel_path)
+        if os.path.exists(filename):
+            os.remove(filename)
+
+        directory = os.path.dirname(filename)
+        while directory != self.output_path and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+
+    def _load_manifest(self) -> bool:
+        """
+        Loads the manifest of the previous build, if any. The entries of its
+        files are only used if its fingerprint is the current one, but its
+        files are removed if they are no longer generated in any case.
+
+        :return: Whether the manifest was loaded.
+        """
+        try:
+            with open(os.path.join(self.output_path, MANIFEST_FILENAME)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        files = manifest.get("files", {})
+        self._previous_paths = set(files)
+        if manifest.get("fingerprint") == self.fingerprint:
+            self._previous = files
+        return True
+
+    def _save_manifest(self):
+        manifest = {"fingerprint": self.fingerprint, "files": self._files}
+        with open(os.path.join(self.output_path, MANIFEST_FILENAME), "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+def _walk_files(path: str) -> Iterator[str]:
+    """
+    Yields the paths (relative to the given directory) of the files in the
+    given directory, excluding caches and the staging directory.
+    """
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in ("__pycache__", STAGING_DIRNAME)]
+        for name in files:
+            yield os.path.relpath(os.path.join(root, name), path)
+
+
+def _write_file(filename: str, content: bytes):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "wb") as f:
+        f.write(content)
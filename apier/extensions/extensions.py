@@ -14,7 +14,8 @@ from .method_name import MethodNameDescription
 from .pagination import PaginationDescription
 
 if TYPE_CHECKING:
-    from apier.core.api.endpoints import Endpoint
+    from apier.core.api.endpoints import Endpoint, EndpointOperation
+    from apier.core.api.openapi import Definition
 
 
 class Extensions(BaseModel):
@@ -54,15 +55,29 @@ def parse_extensions(endpoint: Endpoint):
     :param endpoint: The endpoint to parse the extensions for.
     """
     for op in endpoint.operations:
-        endpoint_def = endpoint.definition.paths[endpoint.path][op.name]
-        extensions_def = endpoint_def.get("x-apier")
-        if not extensions_def:
-            continue
-
-        for extension_name, extension_def in extensions_def.items():
-            if isinstance(extension_def, dict) and "$ref" in extension_def:
-                extensions_def[extension_name] = endpoint.definition.solve_ref(
-                    extension_def["$ref"]
-                )
-
-        op.extensions = Extensions.parse_obj(extensions_def)
+        parse_operation_extensions(endpoint.definition, op)
+
+
+def parse_operation_extensions(definition: Definition, operation: EndpointOperation):
+    """
+    Parses the OpenAPI extensions defined in the given endpoint operation and
+    populates its `extensions` attribute.
+
+    :param definition: The OpenAPI definition.
+    :param operation:  The endpoint operation to parse the extensions for.
+    """
+    extensions_def = operation.definition.get("x-apier")
+    if not extensions_def:
+        return
+
+    # References are solved without modifying the definition
+    extensions_def = {
+        name: (
+            definition.solve_ref(d["$ref"])
+            if isinstance(d, dict) and "$ref" in d
+            else d
+        )
+        for name, d in extensions_def.items()
+    }
+
+    operation.extensions = Extensions.parse_obj(extensions_def)
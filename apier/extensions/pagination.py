@@ -15,6 +15,7 @@ class PaginationDescription(BaseModel):
     modifiers: List[PaginationModifier] = Field(default_factory=list)
     result: str
     has_more: str
+    total_pages: str = ""
 
     @root_validator
     def validate_fields(cls, values: dict):
@@ -1,20 +1,29 @@
-import json
 import mimetypes
 from dataclasses import dataclass, field
+from functools import lru_cache
 from io import IOBase
 from typing import Any, Optional, Union
-from urllib.parse import parse_qsl
 
 import xmltodict
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 from requests.structures import CaseInsensitiveDict
 
+from . import json_codec
 from ..models.basemodel import APIBaseModel
+from ..models.struct import APIStruct
 from ..models.primitives import FilePayload
 
+CONTENT_TYPES_CACHE_SIZE = 256
+"""Maximum number of parsed Content-Types (and comparisons) kept in the cache."""
+
 
 class ContentType:
     """
     Represents a Content-Type.
+
+    Instances returned by `get_content_type()` are shared, so they must not be
+    modified.
     """
 
     def __init__(self, content_type: str):
@@ -26,6 +35,11 @@ class ContentType:
         self.suffix = components["suffix"]
         self.parameters = components["parameters"]
 
+        # Media type used to check if two Content-Types match
+        self.match_key = content_type.lower().split(";")[0]
+        # Underlying format (e.g., json for application/json-patch+json)
+        self.format = self.suffix or self.subtype
+
     def __eq__(self, other):
         return content_types_match(self.content_type, other.content_type)
 
@@ -53,11 +67,13 @@ def parse_content_type(content_type):
     # Split the type and subtype
     main_type, _, subtype = base_type.partition("/")
 
-    # Parse parameters into a dictionary
-    parameters = {
-        key.strip(): value.strip()
-        for key, value in parse_qsl(";".join(params).replace(";", "&"))
-    }
+    # Parse parameters into a dictionary, ignoring parameters without value
+    parameters = {}
+    for param in params:
+        key, _, value = param.partition("=")
+        key, value = key.strip(), value.strip()
+        if key and value:
+            parameters[key] = value
 
     return {
         "media_type": media_type,  # Full media type (e.g., application/json-patch+json)
@@ -70,30 +86,39 @@ def parse_content_type(content_type):
     }
 
 
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
+def get_content_type(content_type: str) -> ContentType:
+    """
+    Returns the ContentType instance representing the given Content-Type.
+    Instances are cached, so each Content-Type is only parsed once.
+    """
+    return ContentType(content_type)
+
+
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
 def content_types_compatible(type1: str, type2: str):
     """
     Checks if two Content-Types are compatible (i.e., if they use the same
     underlying format).
     """
-    parsed_type1 = parse_content_type(type1)
-    parsed_type2 = parse_content_type(type2)
+    parsed_type1 = get_content_type(type1)
+    parsed_type2 = get_content_type(type2)
 
-    if parsed_type1["type"] != parsed_type2["type"]:
+    if parsed_type1.type != parsed_type2.type:
         return False
 
-    if "*" in [parsed_type1["subtype"], parsed_type2["subtype"]]:
+    if "*" in [parsed_type1.subtype, parsed_type2.subtype]:
         return True
 
-    suffix1 = parsed_type1["suffix"] or parsed_type1["subtype"]
-    suffix2 = parsed_type2["suffix"] or parsed_type2["subtype"]
-    return suffix1 == suffix2
+    return parsed_type1.format == parsed_type2.format
 
 
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
 def content_types_match(type1: str, type2: str) -> bool:
     """
     Returns whether the given Content-Types match.
     """
-    t1, t2 = type1.lower().split(";")[0], type2.lower().split(";")[0]
+    t1, t2 = get_content_type(type1).match_key, get_content_type(type2).match_key
     if "*/*" in [t1, t2]:
         return True
     return t1 == t2
@@ -141,8 +166,8 @@ def to_form_urlencoded(obj) -> ContentTypeValidationResult:
         result.data = str(obj)
     elif isinstance(obj, dict):
         result.data = obj
-    elif isinstance(obj, APIBaseModel):
-        result.data = json.loads(obj.json(by_alias=True))
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
+        result.data = json_codec.loads(obj.json(by_alias=True))
     else:
         raise ValueError(
             f'Value type "{type(obj).__name__}" cannot be converted to form-urlencoded'
@@ -151,6 +176,23 @@ def to_form_urlencoded(obj) -> ContentTypeValidationResult:
     return result
 
 
+def encode_json(obj) -> bytes:
+    """
+    Encodes the given JSON payload (a model or a JSON value) as UTF-8 bytes
+    with the JSON codec of the client. Models are encoded by alias, with the
+    same values as `model.json(by_alias=True)`.
+    """
+    if isinstance(obj, BaseModel):
+        # The values are built as in `BaseModel.json()`
+        data = dict(obj._iter(to_dict=True, by_alias=True))
+        if obj.__custom_root_type__:
+            data = data["__root__"]
+        return json_codec.dumps(data, default=obj.__json_encoder__)
+    if isinstance(obj, APIStruct):
+        return json_codec.dumps(obj.dict(by_alias=True), default=pydantic_encoder)
+    return json_codec.dumps(obj)
+
+
 def to_json(obj) -> ContentTypeValidationResult:
     """
     Returns the JSON representation of the given object.
@@ -162,13 +204,10 @@ def to_json(obj) -> ContentTypeValidationResult:
     )
 
     if isinstance(obj, (str, bytes)):
-        result.json = json.loads(obj)
-    elif isinstance(obj, (dict, list)):
-        result.json = obj
-    elif isinstance(obj, APIBaseModel):
-        # obj.dict() performs a shallow conversion, so a second conversion is
-        # used for a deeper JSON transformation
-        result.json = json.loads(obj.json(by_alias=True))
+        result.data = encode_json(json_codec.loads(obj))
+    elif isinstance(obj, (dict, list, APIBaseModel, APIStruct)):
+        # Payloads are serialized only once, and sent as they are
+        result.data = encode_json(obj)
     else:
         raise ValueError(
             f'Value type "{type(obj).__name__}" cannot be converted to JSON'
@@ -193,8 +232,8 @@ def to_xml(obj) -> ContentTypeValidationResult:
         return result
     elif isinstance(obj, dict):
         obj_dict = obj
-    elif isinstance(obj, APIBaseModel):
-        obj_dict = json.loads(obj.json(by_alias=True))
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
+        obj_dict = json_codec.loads(obj.json(by_alias=True))
     else:
         raise ValueError(
             f'Value type "{type(obj).__name__}" cannot be converted to XML'
@@ -212,7 +251,7 @@ def to_multipart(obj) -> ContentTypeValidationResult:
     """
     if isinstance(obj, dict):
         obj_dict = obj
-    elif isinstance(obj, APIBaseModel):
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
         obj_dict = obj.dict(by_alias=True)
     else:
         raise ValueError(
@@ -56,70 +56,87 @@ def eval_expr(expr, vars=None):
     Returns:
         The result of evaluating the expression.
     """
+    return compile_expr(expr)(vars)
+
+
+def compile_expr(expr):
+    """
+    Parses a compound expression supported by `eval_expr()` and returns a
+    function that evaluates it, so that it can be evaluated several times
+    without parsing it again.
+
+    Parameters:
+        expr (str): The expression string to compile.
+
+    Returns:
+        A function that receives an optional dictionary of variables and
+        returns the result of evaluating the expression.
+    """
     # Parse the expression into an AST
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as e:
         raise SyntaxError(f"Invalid expression syntax: {e.msg}") from e
 
-    vars = vars.copy() if vars is not None else {}
-    vars.update(allowed_constants)
-
-    def _eval(node: ast.AST):
-        """Recursively evaluate supported AST nodes."""
-
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, complex):
-                raise ValueError("Complex numbers are not supported.")
-            if node.value is True or node.value is False or node.value is None:
-                raise ValueError(f"Unsupported constant: {node.value}")
-            return node.value
-
-        elif isinstance(node, ast.Name):
-            # Variable reference
-            if vars is not None and node.id in vars:
-                return vars[node.id]
-            else:
-                raise ValueError(f"Variable not defined: {node.id}")
-
-        elif isinstance(node, ast.BinOp) and type(node.op) in allowed_operators:
-            left = _eval(node.left)
-            right = _eval(node.right)
-            return allowed_operators[type(node.op)](left, right)
-
-        elif isinstance(node, ast.UnaryOp) and type(node.op) in allowed_operators:
-            operand = _eval(node.operand)
-            return allowed_operators[type(node.op)](operand)
-
-        elif isinstance(node, ast.Call):
-            # Only allow calls to whitelisted functions
-            if isinstance(node.func, ast.Name) and node.func.id in allowed_functions:
-                func = allowed_functions[node.func.id]
-                args = [_eval(arg) for arg in node.args]
-                return func(*args)
-            else:
-                raise ValueError(f"Function not allowed: '{node.func.id}'")
-
-        elif isinstance(node, ast.List):
-            return [_eval(elt) for elt in node.elts]
-
-        elif isinstance(node, ast.Tuple):
-            return tuple(_eval(elt) for elt in node.elts)
-
-        elif isinstance(node, ast.Compare):
-            # Only support simple comparisons (not chained comparisons)
-            if len(node.ops) != 1 or len(node.comparators) != 1:
-                raise ValueError("Only simple comparisons are supported.")
-            op = node.ops[0]
-            if type(op) not in allowed_comparators:
-                raise ValueError(
-                    f"Comparison operator not allowed: {type(op).__name__}"
-                )
-            left = _eval(node.left)
-            right = _eval(node.comparators[0])
-            return allowed_comparators[type(op)](left, right)
+    def evaluate(vars=None):
+        vars = vars.copy() if vars is not None else {}
+        vars.update(allowed_constants)
+        return _eval(tree.body, vars)
 
-        else:
-            raise SyntaxError(f"Unsupported syntax: {type(node).__name__}")
+    return evaluate
+
+
+def _eval(node: ast.AST, vars: dict):
+    """Recursively evaluate supported AST nodes."""
 
-    return _eval(tree.body)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, complex):
+            raise ValueError("Complex numbers are not supported.")
+        if node.value is True or node.value is False or node.value is None:
+            raise ValueError(f"Unsupported constant: {node.value}")
+        return node.value
+
+    elif isinstance(node, ast.Name):
+        # Variable reference
+        if vars is not None and node.id in vars:
+            return vars[node.id]
+        else:
+            raise ValueError(f"Variable not defined: {node.id}")
+
+    elif isinstance(node, ast.BinOp) and type(node.op) in allowed_operators:
+        left = _eval(node.left, vars)
+        right = _eval(node.right, vars)
+        return allowed_operators[type(node.op)](left, right)
+
+    elif isinstance(node, ast.UnaryOp) and type(node.op) in allowed_operators:
+        operand = _eval(node.operand, vars)
+        return allowed_operators[type(node.op)](operand)
+
+    elif isinstance(node, ast.Call):
+        # Only allow calls to whitelisted functions
+        if isinstance(node.func, ast.Name) and node.func.id in allowed_functions:
+            func = allowed_functions[node.func.id]
+            args = [_eval(arg, vars) for arg in node.args]
+            return func(*args)
+        else:
+            raise ValueError(f"Function not allowed: '{node.func.id}'")
+
+    elif isinstance(node, ast.List):
+        return [_eval(elt, vars) for elt in node.elts]
+
+    elif isinstance(node, ast.Tuple):
+        return tuple(_eval(elt, vars) for elt in node.elts)
+
+    elif isinstance(node, ast.Compare):
+        # Only support simple comparisons (not chained comparisons)
+        if len(node.ops) != 1 or len(node.comparators) != 1:
+            raise ValueError("Only simple comparisons are supported.")
+        op = node.ops[0]
+        if type(op) not in allowed_comparators:
+            raise ValueError(f"Comparison operator not allowed: {type(op).__name__}")
+        left = _eval(node.left, vars)
+        right = _eval(node.comparators[0], vars)
+        return allowed_comparators[type(op)](left, right)
+
+    else:
+        raise SyntaxError(f"Unsupported syntax: {type(node).__name__}")
@@ -1,12 +1,13 @@
-import json
 import re
-from functools import reduce
-from typing import Union
+from functools import lru_cache, partial, reduce
+from typing import Callable, Union
 from urllib.parse import parse_qs, urlparse
 
 from requests import PreparedRequest, Request, Response
 
-from .evaluation import eval_expr
+from .evaluation import compile_expr, eval_expr
+from .. import json_codec
+from ..response_body import json_body
 
 
 class RuntimeExpressionError(Exception):
@@ -17,19 +18,81 @@ class RuntimeExpressionError(Exception):
         self.caused_by = caused_by
 
 
+EXPRESSIONS_CACHE_SIZE = 512
+"""Maximum number of compiled runtime expressions kept in the cache."""
+
+
+class RuntimeExpression:
+    """
+    A runtime expression parsed by `compile_expression()`, which can be
+    evaluated any number of times without parsing it again.
+    """
+
+    def __init__(self, expression: str, evaluate_func: Callable):
+        self.expression = expression
+        self._evaluate_func = evaluate_func
+
+    def evaluate(
+        self,
+        resp: Union[dict, Response],
+        path_values: dict = None,
+        query_param_types: dict = None,
+        header_param_types: dict = None,
+    ):
+        """
+        Evaluates this expression on the given response. See `evaluate()`.
+        """
+        try:
+            return self._evaluate_func(
+                resp, path_values, query_param_types, header_param_types
+            )
+        except RuntimeExpressionError as e:
+            raise e
+        except Exception as e:
+            raise RuntimeExpressionError(caused_by=e)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.expression!r})"
+
+
+@lru_cache(maxsize=EXPRESSIONS_CACHE_SIZE)
+def compile_expression(expression: str) -> RuntimeExpression:
+    """
+    Parses an OpenAPI runtime expression (https://swagger.io/docs/specification/links/)
+    or a dot-separated expression, and returns it as a RuntimeExpression that
+    can be evaluated several times.
+
+    The most recently used expressions are cached, so compiling the same
+    expression again returns the same instance.
+
+    It raises a RuntimeExpressionError if the expression is not valid.
+
+    :param expression:  An OpenAPI runtime expression or a dot-separated expression.
+    :return:            The compiled expression.
+    """
+    try:
+        return RuntimeExpression(expression, _compile(expression.strip()))
+    except RuntimeExpressionError as e:
+        raise e
+    except Exception as e:
+        raise RuntimeExpressionError(caused_by=e)
+
+
 def evaluate(
     resp: Union[dict, Response],
     expression: str,
     path_values: dict = None,
     query_param_types: dict = None,
     header_param_types: dict = None,
-    **kwargs,
 ):
     """
     Evaluates an OpenAPI runtime expression (https://swagger.io/docs/specification/links/).
     It also accepts a dot-separated expression to address an attribute of the
     response body.
 
+    The expression is compiled with `compile_expression()`, so it is only
+    parsed the first time it is evaluated.
+
     It raises a RuntimeExpressionError if the expression cannot be evaluated
     successfully.
 
@@ -48,188 +111,209 @@ def evaluate(
                         will be returned.
     :return:            The result of the evaluated expression.
     """
+    try:
+        compiled_expression = compile_expression(expression)
+    except TypeError as e:
+        # Unhashable expressions cannot be cached
+        raise RuntimeExpressionError(caused_by=e)
 
-    # The 'eval_variables'  is a dictionary used to store variables when
-    # evaluating expressions within an $eval() expression. The result of the
-    # evaluation will be stored in this dictionary. This parameter is intended
-    # for internal use only and is not meant to be accessed directly outside the
-    # function.
-    eval_variables = kwargs.get("eval_variables")
-    is_eval = eval_variables is not None
+    return compiled_expression.evaluate(
+        resp, path_values, query_param_types, header_param_types
+    )
 
-    try:
-        expression = expression.strip()
 
-        if expression.startswith("$eval("):
-            if is_eval:
-                raise RuntimeExpressionError(
-                    caused_by=ValueError(
-                        "Nested evaluation expressions are not supported"
-                    )
-                )
-
-            inner_expression = expression[len("$eval(") : -1].strip()
-            eval_variables = {}
-            expr = evaluate(
-                resp,
-                inner_expression,
-                path_values=path_values,
-                query_param_types=query_param_types,
-                header_param_types=header_param_types,
-                eval_variables=eval_variables,
-            )
+def _compile(expression: str) -> Callable:
+    """
+    Returns a function that evaluates the given (stripped) expression. The
+    function receives the response, the path values and the query and header
+    parameter types.
+    """
+    if expression.startswith("$eval("):
+        return _compile_eval(expression[len("$eval(") : -1].strip())
 
-            return eval_expr(expr, eval_variables)
-
-        if "{" in expression:
-
-            def replace_match(match):
-                default_value_defined = " ?? " in match
-
-                # Handle coalescing operator (??) to provide a default value
-                if default_value_defined:
-                    match, default_value = map(str.strip, match.split(" ?? ", 1))
-                    default_value = eval_expr(default_value)
-
-                try:
-                    group_result = evaluate(
-                        resp,
-                        match,
-                        path_values=path_values,
-                        query_param_types=query_param_types,
-                        header_param_types=header_param_types,
-                    )
-                except RuntimeExpressionError as e:
-                    if default_value_defined and isinstance(
-                        e.caused_by, (KeyError, IndexError)
-                    ):
-                        group_result = default_value
-                    else:
-                        raise e
-
-                # If inside an $eval(), the expression must be replaced with
-                # variables instead of the group result
-                if is_eval:
-                    var_name = f"var{len(eval_variables)}"
-                    eval_variables[var_name] = group_result
-                    return var_name
-
-                return group_result
-
-            parts = re.split(r"({\$?[^}]+})", expression)
-            parts = [part for part in parts if part]
-            for i, part in enumerate(parts):
-                if part.startswith("{") and part.endswith("}"):
-                    parts[i] = replace_match(part[1:-1])
-            return parts[0] if len(parts) == 1 else "".join(map(str, parts))
-
-        # If inside an $eval() expression, any subexpressions (enclosed in {})
-        # should already have been resolved, so the expression can be returned as is
-        if is_eval:
-            return expression
+    if "{" in expression:
+        parts = _compile_template(expression)
 
-        if expression.startswith("$"):
-            return _evaluate_runtime_expression(
-                resp,
-                expression,
-                path_values=path_values,
-                query_param_types=query_param_types,
-                header_param_types=header_param_types,
-            )
+        def evaluate_template(resp, *params):
+            values = [part(resp, *params) if callable(part) else part for part in parts]
+            return values[0] if len(values) == 1 else "".join(map(str, values))
+
+        return evaluate_template
+
+    if expression.startswith("$"):
+        return _compile_runtime_expression(expression)
 
-        if expression.startswith("#"):
-            # Dot-separated path
+    if expression.startswith("#"):
+        # Dot-separated path
+        key = expression[1:].strip()
+
+        def evaluate_path(resp, *params):
             if isinstance(resp, Response):
-                resp = resp.json()
+                resp = json_body(resp)
 
             if not isinstance(resp, dict):
                 raise ValueError("Invalid response format")
 
-            return _get_from_dict(resp, expression[1:].strip())
+            return _get_from_dict(resp, key)
 
-        # Return the expression as a literal value
-        return expression
+        return evaluate_path
 
-    except RuntimeExpressionError as e:
-        raise e
+    # Return the expression as a literal value
+    return lambda resp, *params: expression
 
-    except Exception as e:
-        raise RuntimeExpressionError(caused_by=e)
 
+def _compile_eval(expression: str) -> Callable:
+    """
+    Compiles the content of an $eval() expression. Any subexpressions (enclosed
+    in {}) are replaced with variables holding their values when the compound
+    expression is evaluated.
+    """
+    if expression.startswith("$eval("):
+        raise RuntimeExpressionError(
+            caused_by=ValueError("Nested evaluation expressions are not supported")
+        )
 
-def _evaluate_runtime_expression(
-    resp: Response,
-    expression: str,
-    path_values: dict = None,
-    query_param_types: dict = None,
-    header_param_types: dict = None,
-):
+    variables = {}
+    if "{" in expression:
+        parts = _compile_template(expression)
+        for i, part in enumerate(parts):
+            if callable(part):
+                var_name = f"var{len(variables)}"
+                variables[var_name] = part
+                parts[i] = var_name
+        expression = "".join(parts)
+
+    compiled_expr = compile_expr(expression)
+
+    def evaluate_eval(resp, *params):
+        return compiled_expr(
+            {name: part(resp, *params) for name, part in variables.items()}
+        )
+
+    return evaluate_eval
+
+
+def _compile_template(expression: str) -> list:
     """
-    Decodes the given runtime expression (according to
-    https://swagger.io/docs/specification/links/) and returns the evaluated value.
+    Splits an expression that includes subexpressions enclosed in curly braces.
+    Returns a list with the literal parts of the expression as strings and the
+    subexpressions as functions that evaluate them.
     """
-    if header_param_types is not None:
-        header_param_types = {k.lower(): v for k, v in header_param_types.items()}
+    parts = re.split(r"({\$?[^}]+})", expression)
+    parts = [part for part in parts if part]
+    for i, part in enumerate(parts):
+        if part.startswith("{") and part.endswith("}"):
+            parts[i] = _compile_subexpression(part[1:-1])
+    return parts
 
-    def to_string(obj):
-        return str(obj) if obj is not None else ""
 
-    def cast_value(name, value, type_dict):
-        if type_dict is not None and name in type_dict:
-            return type_dict[name](value)
-        return value
+def _compile_subexpression(expression: str) -> Callable:
+    """
+    Compiles a subexpression enclosed in curly braces, which may define a
+    default value with the coalescing operator (??).
+    """
+    default_value_defined = " ?? " in expression
 
-    def get_query_string(name):
-        parsed_url = urlparse(resp.request.url)
-        query_params = parse_qs(parsed_url.query)
-        value = query_params.get(name, [])
-        if len(value) == 0:
-            raise RuntimeExpressionError(
-                caused_by=KeyError(f"Query parameter '{name}' not found")
-            )
-        elif len(value) == 1:
-            return value[0]
-        else:
-            return value
+    # Handle coalescing operator (??) to provide a default value
+    default_value = None
+    if default_value_defined:
+        expression, default_value = map(str.strip, expression.split(" ?? ", 1))
+        default_value = eval_expr(default_value)
 
-    def get_path_value(name):
-        if path_values is not None and name in path_values:
-            return path_values[name]
-        raise RuntimeExpressionError(
-            caused_by=KeyError(f"Path parameter '{name}' not found")
-        )
+    compiled_expression = compile_expression(expression)
 
-    expression_funcs = {
-        "$url": lambda: resp.request.url,
-        "$method": lambda: resp.request.method,
-        "$request.query.*": lambda x: cast_value(
-            x, get_query_string(x), query_param_types
-        ),
-        "$request.path.*": lambda x: get_path_value(x),
-        "$request.header.*": lambda x: cast_value(
-            x, resp.request.headers.get(x), header_param_types
-        ),
-        "$request.body": lambda: to_string(resp.request.body),
-        "$request.body#/*": lambda x: _get_from_dict(
-            json.loads(resp.request.body), x, "/"
-        ),
-        "$statusCode": lambda: resp.status_code,
-        "$response.header.*": lambda x: resp.headers.get(x),
-        "$response.body": lambda: resp.text,
-        "$response.body#/*": lambda x: _get_from_dict(resp.json(), x, "/"),
-    }
+    def evaluate_subexpression(resp, *params):
+        try:
+            return compiled_expression.evaluate(resp, *params)
+        except RuntimeExpressionError as e:
+            if default_value_defined and isinstance(
+                e.caused_by, (KeyError, IndexError)
+            ):
+                return default_value
+            raise e
 
-    for expr, fn in expression_funcs.items():
+    return evaluate_subexpression
+
+
+def _compile_runtime_expression(expression: str) -> Callable:
+    """
+    Decodes the given runtime expression (according to
+    https://swagger.io/docs/specification/links/) and returns a function that
+    evaluates it.
+    """
+    for expr, fn in _RUNTIME_EXPRESSION_FUNCS.items():
         if expr.endswith("*"):
             expr_prefix = expr.rstrip("*")
             if expression.startswith(expr_prefix):
-                return fn(expression[len(expr_prefix) :])
+                return partial(fn, name=expression[len(expr_prefix) :])
         if expr == expression:
-            return fn()
+            return fn
 
     raise RuntimeExpressionError(caused_by=ValueError("Invalid runtime expression"))
 
 
+def _get_query_value(resp: Response, path_values, query_param_types, _, name: str):
+    parsed_url = urlparse(resp.request.url)
+    query_params = parse_qs(parsed_url.query)
+    value = query_params.get(name, [])
+    if len(value) == 0:
+        raise RuntimeExpressionError(
+            caused_by=KeyError(f"Query parameter '{name}' not found")
+        )
+    elif len(value) == 1:
+        value = value[0]
+
+    return _cast_value(name, value, query_param_types)
+
+
+def _get_path_value(resp: Response, path_values, _, __, name: str):
+    if path_values is not None and name in path_values:
+        return path_values[name]
+    raise RuntimeExpressionError(
+        caused_by=KeyError(f"Path parameter '{name}' not found")
+    )
+
+
+def _get_header_value(resp: Response, _, __, header_param_types, name: str):
+    if header_param_types is not None:
+        header_param_types = {k.lower(): v for k, v in header_param_types.items()}
+    return _cast_value(name, resp.request.headers.get(name), header_param_types)
+
+
+def _cast_value(name, value, type_dict):
+    if type_dict is not None and name in type_dict:
+        return type_dict[name](value)
+    return value
+
+
+def _to_string(obj):
+    return str(obj) if obj is not None else ""
+
+
+_RUNTIME_EXPRESSION_FUNCS = {
+    "$url": lambda resp, *_: resp.request.url,
+    "$method": lambda resp, *_: resp.request.method,
+    "$request.query.*": _get_query_value,
+    "$request.path.*": _get_path_value,
+    "$request.header.*": _get_header_value,
+    "$request.body": lambda resp, *_: _to_string(resp.request.body),
+    "$request.body#/*": lambda resp, *_, name: _get_from_dict(
+        json_codec.loads(resp.request.body), name, "/"
+    ),
+    "$statusCode": lambda resp, *_: resp.status_code,
+    "$response.header.*": lambda resp, *_, name: resp.headers.get(name),
+    "$response.body": lambda resp, *_: resp.text,
+    "$response.body#/*": lambda resp, *_, name: _get_from_dict(
+        json_body(resp), name, "/"
+    ),
+}
+"""
+Functions to evaluate each type of runtime expression, receiving the response,
+the path values and the query and header parameter types. Expressions ending
+with `*` receive the rest of the expression as the `name` argument.
+"""
+
+
 def prepare_request(req: Union[PreparedRequest, Request], expression: str, value):
     """
     Set the value of a request from an OpenAPI runtime expression
@@ -259,7 +343,7 @@ def prepare_request(req: Union[PreparedRequest, Request], expression: str, value
 
         if expression:
             if req.body:
-                body = json.loads(req.body)
+                body = json_codec.loads(req.body)
             else:
                 body = {}
 
@@ -267,7 +351,7 @@ def prepare_request(req: Union[PreparedRequest, Request], expression: str, value
         else:
             body = value
 
-        req.prepare_body(None, None, json=body)
+        _set_json_body(req, body)
         return req
 
     except RuntimeExpressionError as e:
@@ -295,9 +379,9 @@ def _set_expression_value(req: PreparedRequest, expression: str, value):
         "$method": lambda: req.prepare_method(value),
         "$request.query.*": lambda x: set_query_param(x),
         "$request.header.*": lambda x: req.headers.__setitem__(x, value),
-        "$request.body": lambda: req.prepare_body(None, None, value),
-        "$request.body#/*": lambda x: req.prepare_body(
-            None, None, _set_in_dict(json.loads(req.body or "{}"), x, value, "/")
+        "$request.body": lambda: _set_json_body(req, value),
+        "$request.body#/*": lambda x: _set_json_body(
+            req, _set_in_dict(json_codec.loads(req.body or "{}"), x, value, "/")
         ),
     }
 
@@ -312,6 +396,16 @@ def _set_expression_value(req: PreparedRequest, expression: str, value):
     raise RuntimeExpressionError("invalid runtime expression")
 
 
+def _set_json_body(req: PreparedRequest, body):
+    """
+    Sets the given object as the JSON body of the request, encoded with the
+    JSON codec of the client.
+    """
+    req.prepare_body(json_codec.dumps(body), None)
+    if "Content-Type" not in req.headers:
+        req.headers["Content-Type"] = "application/json"
+
+
 def _get_from_dict(d: dict, key: str, separator="."):
     if key == "":
         return d
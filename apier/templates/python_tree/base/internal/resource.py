@@ -3,6 +3,9 @@ This module defines the APIResource class, which is the base class for all API
 resources. It provides methods to build URLs, handle requests and responses,
 and manage the API call stack. It also includes methods for validating request
 payloads and handling pagination.
+
+The AsyncAPIResource class is the counterpart of APIResource used by the
+asynchronous API client.
 """
 
 from abc import ABC, abstractmethod
@@ -21,9 +24,13 @@ from .content_type import (
     content_types_compatible,
     ContentTypeValidationResult,
 )
+from .expected_responses import ExpectedResponses
 from .expressions.runtime import evaluate, prepare_request
+from .response_body import json_body
 from ..models.basemodel import APIBaseModel
+from ..models.construct import construct_model
 from ..models.exceptions import ExceptionList, ResponseError
+from ..models.struct import APIStruct
 from ..models.extensions.pagination import PaginationDescription
 
 
@@ -138,10 +145,13 @@ class APIResource(ABC):
         kwargs.pop("headers", None)  # Remove headers from kwargs to avoid duplication
 
         # If the Content-Type header is not explicitly provided, remove it from
-        # the headers for cases where it should be set automatically
+        # the headers for cases where it should be set automatically (payloads
+        # already serialized are sent as they are, so they keep it)
         if not forced_content_type:
             auto_content_types = ["application/json", "multipart/form-data"]
-            if results.type in auto_content_types:
+            if results.type in auto_content_types and not isinstance(
+                results.data, bytes
+            ):
                 results.headers.pop("Content-Type", None)
 
         return api.make_request(
@@ -157,69 +167,49 @@ class APIResource(ABC):
     def _handle_response(
         self,
         response: requests.Response,
-        expected_responses: list,
+        expected_responses: Union[ExpectedResponses, list],
         param_types: dict = None,
         pagination_info: PaginationDescription = None,
     ):
-        default_status_code = 0
-
-        # Send default expected response to the end of the list
-        expected_responses = sorted(expected_responses, key=lambda x: x[0] == 0)
+        if not isinstance(expected_responses, ExpectedResponses):
+            expected_responses = ExpectedResponses(expected_responses)
 
-        expected_status_codes = set([r[0] for r in expected_responses])
-        if (
-            response.status_code not in expected_status_codes
-            and default_status_code not in expected_status_codes
-        ):
+        if not expected_responses.is_expected(response.status_code):
             raise ResponseError(
                 response, f"Unexpected response status code ({response.status_code})"
             )
 
         resp_content_type = response.headers.get("content-type", "")
-        for r in expected_responses:
-            code, content_type, resp_class = r
-
-            if not content_type:
-                ret = resp_class()
-
-                ret._set_http_response(response)
-                self._handle_pagination(
-                    ret,
-                    response,
-                    pagination_info,
-                    self._path_values(),
-                    param_types,
-                    expected_responses,
-                )
-
-                return self._handle_error(ret)
-
-            if code not in [
-                response.status_code,
-                default_status_code,
-            ] or not content_types_match(resp_content_type, content_type):
-                continue
-
-            resp_payload = _parse_response_content(response, resp_class)
-
-            ret = resp_class.parse_obj(resp_payload)
-
-            ret._set_http_response(response)
-            self._handle_pagination(
-                ret,
-                response,
-                pagination_info,
-                self._path_values(),
-                param_types,
-                expected_responses,
+        expected_response = expected_responses.find(
+            response.status_code, resp_content_type
+        )
+        if expected_response is None:
+            raise ResponseError(
+                response, f"Unexpected response content type ({resp_content_type})"
             )
 
-            return self._handle_error(ret)
-
-        raise ResponseError(
-            response, f"Unexpected response content type ({resp_content_type})"
+        content_type, resp_class = expected_response
+        if content_type:
+            resp_payload = _parse_response_content(response, resp_class)
+            if self._api()._validate_responses:
+                ret = resp_class.parse_obj(resp_payload)
+            else:
+                ret = construct_model(resp_class, resp_payload)
+        else:
+            ret = resp_class()
+
+        ret._set_http_response(response)
+        self._handle_pagination(
+            ret,
+            response,
+            pagination_info,
+            self._path_values(),
+            param_types,
+            expected_responses,
         )
 
+        return self._handle_error(ret)
+
     def _handle_error(self, ret):
         api = self._stack[0]
         if api._raise_errors:
@@ -237,7 +227,7 @@ class APIResource(ABC):
         pagination_info: PaginationDescription,
         path_values: dict,
         params_info: dict,
-        expected_responses: list,
+        expected_responses: ExpectedResponses,
     ):
         """
         Add metadata to the returned model object to allow handling pagination.
@@ -260,19 +250,102 @@ class APIResource(ABC):
         if not has_more:
             return
 
-        req = PreparedRequest()
-        if pagination_info.reuse_previous_request:
-            req = resp.request
-        if pagination_info.url:
-            url = evaluate(
-                resp, pagination_info.url, path_values, query_params, headers
+        req = _next_page_request(
+            resp, pagination_info, path_values, query_params, headers
+        )
+
+        total_pages = None
+        if pagination_info.total_pages:
+            total_pages = int(
+                evaluate(
+                    resp,
+                    pagination_info.total_pages,
+                    path_values,
+                    query_params,
+                    headers,
+                )
             )
-            req.prepare_url(url, None)
-        if pagination_info.method:
-            req.prepare_method(pagination_info.method)
-        for modifier in pagination_info.modifiers:
-            value = evaluate(resp, modifier.value, path_values, query_params, headers)
-            prepare_request(req, modifier.param, value)
+            # The next pages must not derive the remaining pages again
+            pagination_info = pagination_info.copy(update={"total_pages": ""})
+
+        ret._pagination.iter_func = self._next_page_func(
+            req, expected_responses, params_info, pagination_info
+        )
+
+        if total_pages is None:
+            return
+
+        # If the request of a page derived from the previous one is the same
+        # (e.g., the modifiers only use a cursor of the response), the pages
+        # cannot be requested concurrently, so they are prefetched sequentially
+        if total_pages > 2:
+            derived_req = _next_page_request(
+                _with_request(resp, req.copy()),
+                pagination_info,
+                path_values,
+                query_params,
+                headers,
+            )
+            if _same_request(req, derived_req):
+                return
+
+        ret._pagination.page_funcs = self._page_funcs(
+            resp,
+            req,
+            total_pages - 1,
+            path_values,
+            expected_responses,
+            params_info,
+            pagination_info,
+        )
+
+    def _page_funcs(
+        self,
+        resp: Response,
+        req: PreparedRequest,
+        count: int,
+        path_values: dict,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        """
+        Yields the functions used to request the given number of pages
+        following the given response, so that they can be requested
+        concurrently.
+
+        The request of each page is derived from the request of the previous
+        one, evaluating the pagination modifiers as if the given response had
+        been received for it, so modifiers can only depend on the request and
+        on the size of a full page.
+        """
+        query_params = params_info.get("query")
+        headers = params_info.get("header")
+
+        for i in range(count):
+            yield self._next_page_func(
+                req, expected_responses, params_info, pagination_info
+            )
+
+            if i < count - 1:
+                req = _next_page_request(
+                    _with_request(resp, req.copy()),
+                    pagination_info,
+                    path_values,
+                    query_params,
+                    headers,
+                )
+
+    def _next_page_func(
+        self,
+        req: PreparedRequest,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        """
+        Returns the function used by the paginator to request the next page.
+        """
 
         def make_request():
             api = self._api()
@@ -283,7 +356,97 @@ class APIResource(ABC):
                 new_resp, expected_responses, params_info, pagination_info
             )
 
-        ret._pagination.iter_func = make_request
+        return make_request
+
+
+class AsyncAPIResource(APIResource):
+    """
+    Abstract class to represent a part of an API call of an asynchronous API
+    client. Requests are sent with the coroutine `make_request()` of the API
+    instance, while responses are handled the same way as in `APIResource`.
+    """
+
+    async def _make_request(
+        self, method="GET", body=None, req_content_types: list = None, **kwargs
+    ) -> Response:
+        return await super()._make_request(method, body, req_content_types, **kwargs)
+
+    async def _handle_response(
+        self,
+        response: requests.Response,
+        expected_responses: Union[ExpectedResponses, list],
+        param_types: dict = None,
+        pagination_info: PaginationDescription = None,
+    ):
+        return super()._handle_response(
+            response, expected_responses, param_types, pagination_info
+        )
+
+    def _next_page_func(
+        self,
+        req: PreparedRequest,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        async def make_request():
+            api = self._api()
+            new_resp = await api.make_request(
+                req.method, req.url, req.body, headers=req.headers
+            )
+            return await self._handle_response(
+                new_resp, expected_responses, params_info, pagination_info
+            )
+
+        return make_request
+
+
+def _next_page_request(
+    resp: Response,
+    pagination_info: PaginationDescription,
+    path_values: dict,
+    query_params: dict,
+    headers: dict,
+) -> PreparedRequest:
+    """
+    Prepares the request of the page following the given response.
+    """
+    req = PreparedRequest()
+    if pagination_info.reuse_previous_request:
+        req = resp.request
+    if pagination_info.url:
+        url = evaluate(resp, pagination_info.url, path_values, query_params, headers)
+        req.prepare_url(url, None)
+    if pagination_info.method:
+        req.prepare_method(pagination_info.method)
+    for modifier in pagination_info.modifiers:
+        value = evaluate(resp, modifier.value, path_values, query_params, headers)
+        prepare_request(req, modifier.param, value)
+
+    return req
+
+
+def _same_request(req1: PreparedRequest, req2: PreparedRequest) -> bool:
+    """
+    Returns whether the given requests would request the same page.
+    """
+    return (req1.method, req1.url, req1.body, req1.headers) == (
+        req2.method,
+        req2.url,
+        req2.body,
+        req2.headers,
+    )
+
+
+def _with_request(resp: Response, req: PreparedRequest) -> Response:
+    """
+    Returns a copy of the given response associated with another request.
+    The copy shares the body (and its decoded value) of the given response.
+    """
+    resp_copy = Response.__new__(Response)
+    resp_copy.__dict__.update(resp.__dict__)
+    resp_copy.request = req
+    return resp_copy
 
 
 def _parse_response_content(response: Response, resp_class: Type[APIBaseModel]):
@@ -294,7 +457,7 @@ def _parse_response_content(response: Response, resp_class: Type[APIBaseModel]):
     resp_content_type = response.headers.get("content-type", "")
 
     if content_types_match(resp_content_type, "application/json"):
-        return response.json()
+        return json_body(response)
 
     if content_types_match(resp_content_type, "application/xml"):
         import xmltodict
@@ -355,7 +518,9 @@ def _extract_subtypes(tp):
 
 
 def _validate_request_payload(
-    body: Union[str, bytes, dict, APIBaseModel], req_content_types: list, headers: dict
+    body: Union[str, bytes, dict, APIBaseModel, APIStruct],
+    req_content_types: list,
+    headers: dict,
 ) -> ContentTypeValidationResult:
     """
     Tries to parse the request body into one of the supported pairs of
@@ -389,7 +554,10 @@ def _validate_request_payload(
             ]
 
         for content_type, request_class in req_content_types:
-            if isinstance(body, APIBaseModel) and type(body) is not request_class:
+            if (
+                isinstance(body, (APIBaseModel, APIStruct))
+                and type(body) is not request_class
+            ):
                 continue
 
             for ct, conv_func in SUPPORTED_REQUEST_CONTENT_TYPES.items():
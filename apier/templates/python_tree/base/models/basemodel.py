@@ -4,6 +4,7 @@ from typing import Optional, Union
 import requests
 from pydantic import BaseModel, PrivateAttr, typing
 
+from ..internal import json_codec
 from .pagination import Paginator, _PaginationHelper
 
 
@@ -19,6 +20,13 @@ class IterBaseModel(BaseModel):
         if self._has_root(dict):
             object.__setattr__(self, "items", self._items)
 
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        m = super().construct(_fields_set, **values)
+        if m._has_root(dict):
+            object.__setattr__(m, "items", m._items)
+        return m
+
     def _has_root(self, types):
         return "__root__" in self.__dict__ and isinstance(self.__root__, types)
 
@@ -181,10 +189,23 @@ class PaginatorBaseModel(IterBaseModel, HTTPResponseModel, Paginator):
         else:
             return IterBaseModel.__next__(self)
 
+    def __aiter__(self):
+        if self._pagination.supported:
+            return Paginator.__aiter__(self)
+        else:
+            raise TypeError(f"'{type(self).__name__}' object is not async iterable")
+
+    async def __anext__(self):
+        if self._pagination.supported:
+            return await Paginator.__anext__(self)
+        else:
+            raise TypeError(f"'{type(self).__name__}' object is not async iterable")
+
 
 class APIBaseModel(PaginatorBaseModel):
     """
     The Pydantic base model used for API schema models.
     """
 
-    pass
+    class Config:
+        json_loads = json_codec.loads
@@ -1,4 +1,11 @@
-from dataclasses import dataclass, field
+import asyncio
+import queue
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
 
 from ..internal.expressions.runtime import evaluate
 
@@ -7,45 +14,369 @@ from ..internal.expressions.runtime import evaluate
 class _PaginationHelper:
     supported: bool = False
     results_attribute: str = ""
-    results: list = field(default_factory=list)
+    results: list = None
     iter_idx: int = 0
     iter_func: callable = None
+    prefetch: int = 0
+    prefetcher: object = None
+    prefetcher_finalizer: object = None
+    stream: bool = False
+    page_funcs: object = None
+
+
+class _PagePrefetcher:
+    """
+    Requests the next pages of a paginated response in a worker thread,
+    keeping up to `depth` pages requested ahead of the consumer.
+    """
+
+    def __init__(self, iter_func: callable, depth: int):
+        self._pages = queue.Queue()
+        self._slots = threading.Semaphore(depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(iter_func,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, iter_func: callable):
+        while iter_func is not None and self._acquire_slot():
+            try:
+                page = iter_func()
+            except Exception as e:
+                self._pages.put(e)
+                return
+
+            self._pages.put(page)
+            iter_func = page._pagination.iter_func
+
+    def _acquire_slot(self) -> bool:
+        # Wait for the consumer to take a page, unless the prefetcher is stopped
+        while not self._stop.is_set():
+            if self._slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def get(self):
+        """
+        Returns the next page, waiting for it to be received if necessary.
+        """
+        page = self._pages.get()
+        self._slots.release()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def done(self) -> bool:
+        # Pages are requested until the last one is reached
+        return False
+
+    def stop(self):
+        self._stop.set()
+
+
+class _ParallelPagePrefetcher:
+    """
+    Requests the pages of a paginated response whose requests are known in
+    advance using a pool of `workers` threads. Pages are returned in order.
+    """
+
+    def __init__(self, page_funcs, workers: int):
+        self._page_funcs = page_funcs
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = deque()
+        for _ in range(workers):
+            self._submit_next()
+
+    def _submit_next(self):
+        page_func = next(self._page_funcs, None)
+        if page_func is not None:
+            self._futures.append(self._executor.submit(page_func))
+        elif not self._futures:
+            self._executor.shutdown(wait=False)
+
+    def get(self):
+        """
+        Returns the next page, waiting for it to be received if necessary.
+        """
+        future = self._futures.popleft()
+        self._submit_next()
+        return future.result()
+
+    def done(self) -> bool:
+        """
+        Returns whether all the pages known in advance have been returned.
+        """
+        return not self._futures
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _AsyncPagePrefetcher:
+    """
+    Requests the next pages of a paginated response of an asynchronous client
+    in a background task, keeping up to `depth` pages requested ahead of the
+    consumer.
+    """
+
+    def __init__(self, iter_func: callable, depth: int):
+        self._pages = asyncio.Queue()
+        self._slots = asyncio.Semaphore(depth)
+        self._task = asyncio.ensure_future(self._run(iter_func))
+
+    async def _run(self, iter_func: callable):
+        while iter_func is not None:
+            await self._slots.acquire()
+            try:
+                page = await iter_func()
+            except Exception as e:
+                self._pages.put_nowait(e)
+                return
+
+            self._pages.put_nowait(page)
+            iter_func = page._pagination.iter_func
+
+    async def get(self):
+        """
+        Returns the next page, waiting for it to be received if necessary.
+        """
+        page = await self._pages.get()
+        self._slots.release()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def done(self) -> bool:
+        # Pages are requested until the last one is reached
+        return False
+
+    def stop(self):
+        self._task.cancel()
+
+
+class _AsyncParallelPagePrefetcher:
+    """
+    Requests the pages of a paginated response of an asynchronous client whose
+    requests are known in advance, running up to `workers` requests
+    concurrently. Pages are returned in order.
+    """
+
+    def __init__(self, page_funcs, workers: int):
+        self._page_funcs = page_funcs
+        self._tasks = deque()
+        for _ in range(workers):
+            self._submit_next()
+
+    def _submit_next(self):
+        page_func = next(self._page_funcs, None)
+        if page_func is not None:
+            self._tasks.append(asyncio.ensure_future(page_func()))
+
+    async def get(self):
+        """
+        Returns the next page, waiting for it to be received if necessary.
+        """
+        task = self._tasks.popleft()
+        self._submit_next()
+        return await task
+
+    def done(self) -> bool:
+        """
+        Returns whether all the pages known in advance have been returned.
+        """
+        return not self._tasks
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
 
 
-@dataclass
 class Paginator:
     """
     This class allows to paginate the results of an API response instance.
+    Subclasses must provide the `_pagination` attribute, with a
+    `_PaginationHelper` instance.
+
+    Responses of the asynchronous API client must be paginated with
+    `async for`, since the next pages are requested with a coroutine.
     """
 
-    _pagination: _PaginationHelper = field(
-        default_factory=_PaginationHelper, compare=False
-    )
+    __slots__ = ()
+
+    def paginate(self, prefetch: int = 0, stream: bool = False):
+        """
+        Sets how the results are paginated and returns this instance, so that
+        it can be iterated.
+
+        :param prefetch: The number of next pages that are requested in the
+                         background while the current page is consumed.
+                         If 0 (default), each page is requested once all the
+                         results of the previous page have been consumed.
+                         If the pagination description defines the total
+                         number of pages, these pages are requested
+                         concurrently.
+        :param stream:   If True, the results of each page are discarded once
+                         they have been consumed, so the memory used does not
+                         grow with the number of pages. A streamed response
+                         can only be iterated once.
+        :return:         This instance.
+        """
+        if prefetch < 0:
+            raise ValueError("The number of pages to prefetch cannot be negative")
+
+        self._pagination.prefetch = prefetch
+        self._pagination.stream = stream
+        return self
 
     def __iter__(self):
-        self._pagination.iter_idx = 0
+        if not self._pagination.stream:
+            self._pagination.iter_idx = 0
+        if self._pagination.prefetch > 0 and _is_sync_func(self._pagination.iter_func):
+            self._prefetcher(_PagePrefetcher, _ParallelPagePrefetcher)
         return self
 
     def __next__(self) -> bool:
-        if not self._pagination.results:
-            self._pagination.results = evaluate(
-                self.http_response(), self._pagination.results_attribute
-            )
+        if self._needs_next_page():
+            if iscoroutinefunction(self._pagination.iter_func):
+                raise TypeError(
+                    "Responses of an asynchronous client must be paginated "
+                    "using 'async for'"
+                )
 
-        results = self._pagination.results
-        if self._pagination.iter_idx >= len(results):
-            if self._pagination.iter_func:
+            if self._pagination.prefetch > 0:
+                prefetcher = self._prefetcher(_PagePrefetcher, _ParallelPagePrefetcher)
+                try:
+                    next_results = prefetcher.get()
+                except Exception:
+                    self._stop_prefetcher()
+                    raise
+                if prefetcher.done():
+                    self._stop_prefetcher()
+            else:
+                next_results = self._pagination.iter_func()
+
+            self._add_page(next_results)
+
+        return self._next_result(StopIteration)
+
+    def __aiter__(self):
+        if not self._pagination.stream:
+            self._pagination.iter_idx = 0
+        if self._pagination.prefetch > 0 and iscoroutinefunction(
+            self._pagination.iter_func
+        ):
+            self._prefetcher(_AsyncPagePrefetcher, _AsyncParallelPagePrefetcher)
+        return self
+
+    async def __anext__(self):
+        if self._needs_next_page():
+            if not iscoroutinefunction(self._pagination.iter_func):
                 next_results = self._pagination.iter_func()
-                self._pagination.iter_func = next_results._pagination.iter_func
-                self._pagination.results.extend(
-                    evaluate(
-                        next_results.http_response(), self._pagination.results_attribute
-                    )
+            elif self._pagination.prefetch > 0:
+                prefetcher = self._prefetcher(
+                    _AsyncPagePrefetcher, _AsyncParallelPagePrefetcher
                 )
+                try:
+                    next_results = await prefetcher.get()
+                except Exception:
+                    self._stop_prefetcher()
+                    raise
+                if prefetcher.done():
+                    self._stop_prefetcher()
+            else:
+                next_results = await self._pagination.iter_func()
 
+            self._add_page(next_results)
+
+        return self._next_result(StopAsyncIteration)
+
+    def _prefetcher(self, prefetcher_class, parallel_prefetcher_class):
+        """
+        Returns the prefetcher of the next pages, starting it if it is not
+        running.
+
+        If the requests of the next pages are known in advance, they are
+        requested concurrently by a `parallel_prefetcher_class` instance.
+        Otherwise, or once they have been consumed, the pages are requested
+        one after another by a `prefetcher_class` instance.
+        """
+        if self._pagination.prefetcher is None and self._pagination.page_funcs:
+            prefetcher = parallel_prefetcher_class(
+                self._pagination.page_funcs, self._pagination.prefetch
+            )
+            self._pagination.page_funcs = None
+            if not prefetcher.done():
+                self._set_prefetcher(prefetcher)
+
+        if self._pagination.prefetcher is None:
+            self._set_prefetcher(
+                prefetcher_class(self._pagination.iter_func, self._pagination.prefetch)
+            )
+
+        return self._pagination.prefetcher
+
+    def _set_prefetcher(self, prefetcher):
+        self._pagination.prefetcher = prefetcher
+        # Stop prefetching if the paginator is discarded before consuming all
+        # the pages
+        self._pagination.prefetcher_finalizer = weakref.finalize(
+            self._pagination, prefetcher.stop
+        )
+
+    def _stop_prefetcher(self):
+        """
+        Stops the current prefetcher, so that the next pages are requested by
+        a new one starting from the last page consumed.
+        """
+        self._pagination.prefetcher.stop()
+        self._pagination.prefetcher = None
+        # The finalizer of the stopped prefetcher is no longer needed
+        self._pagination.prefetcher_finalizer.detach()
+        self._pagination.prefetcher_finalizer = None
+
+    def _needs_next_page(self) -> bool:
+        """
+        Returns whether all the results fetched so far have been consumed and
+        there is a next page to request.
+        """
+        if self._pagination.results is None:
+            # The results are copied, since the evaluated value belongs to the
+            # decoded body of the response
+            self._pagination.results = list(
+                evaluate(self.http_response(), self._pagination.results_attribute)
+            )
+
+        return (
+            self._pagination.iter_idx >= len(self._pagination.results)
+            and self._pagination.iter_func is not None
+        )
+
+    def _add_page(self, next_results):
+        """
+        Adds the results of the given page to the paginated results.
+        """
+        results = evaluate(
+            next_results.http_response(), self._pagination.results_attribute
+        )
+        self._pagination.iter_func = next_results._pagination.iter_func
+
+        if self._pagination.stream:
+            # Only the results of the current page are kept
+            self._pagination.results = results
+            self._pagination.iter_idx = 0
+        else:
+            self._pagination.results.extend(results)
+
+    def _next_result(self, stop_exception):
+        results = self._pagination.results
         if self._pagination.iter_idx >= len(results):
-            raise StopIteration
+            raise stop_exception
 
         i = self._pagination.iter_idx
         self._pagination.iter_idx = self._pagination.iter_idx + 1
         return results[i]
+
+
+def _is_sync_func(func) -> bool:
+    return func is not None and not iscoroutinefunction(func)
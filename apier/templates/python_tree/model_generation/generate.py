@@ -6,16 +6,30 @@ import yaml
 from datamodel_code_generator import InputFileType, generate
 
 from apier.core.api.openapi import Definition
+from .split import split_models
+from .struct import STRUCT_BASE_CLASS, to_struct_models
 
+MODEL_BACKENDS = ("pydantic", "struct")
 
-def generate_models(definition: Definition, schemas: dict[str, dict], output_path: str):
+
+def generate_models(
+    definition: Definition,
+    schemas: dict[str, dict],
+    output_path: str,
+    split: bool = False,
+    backend: str = "pydantic",
+):
     """
-    Generate the Pydantic models for all the given schemas.
+    Generate the models for all the given schemas.
 
     :param definition:  The OpenAPI definition object.
     :param schemas:     The dictionary of schemas that will be generated as
                         models.
     :param output_path: The output directory.
+    :param split:       Whether the models are written as separate modules,
+                        imported the first time they are used.
+    :param backend:     The model backend: "pydantic" (Pydantic models) or
+                        "struct" (struct models, see `models/struct.py`).
     """
     openapi_output = copy.deepcopy(definition.definition)
     openapi_output["components"] = {"schemas": schemas}
@@ -29,12 +43,21 @@ def generate_models(definition: Definition, schemas: dict[str, dict], output_pat
     pkg_name = __name__.rsplit(".", 1)[0]
     custom_formatter = f"{pkg_name}.formatter"
 
+    struct = backend == "struct"
     generate(
         input_=Path(filename),
         input_file_type=InputFileType.OpenAPI,
         output=Path(f"{output_path}/models/models.py"),
-        base_class=".basemodel.APIBaseModel",
+        base_class=STRUCT_BASE_CLASS if struct else ".basemodel.APIBaseModel",
+        # Struct models check the constraints declared in their fields
+        field_constraints=struct,
         custom_formatters=[custom_formatter],
     )
 
+    if struct:
+        to_struct_models(f"{output_path}/models/models.py")
+
+    if split:
+        split_models(f"{output_path}/models/models.py")
+
     shutil.rmtree(f"{output_path}/_temp")
@@ -0,0 +1,242 @@
+"""
+This module splits the models generated by datamodel-code-generator into
+separate modules, so that the generated client only builds the models it
+actually uses.
+"""
+
+import ast
+import keyword
+from pathlib import Path
+
+from apier.utils.strings import to_snake_case
+
+SCHEMAS_PACKAGE = "schemas"
+
+
+def split_models(models_file: str):
+    """
+    Splits the models of the given module into one module per schema, written
+    in a `schemas` package next to it, and replaces the given module with an
+    index that imports each model the first time it is accessed.
+
+    Models that depend on each other (e.g., recursive schemas) are kept in the
+    same module. If the module contains statements that cannot be assigned to
+    a model, it is left as it is.
+
+    :param models_file: The path of the generated models module.
+    """
+    path = Path(models_file)
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+
+    imports = []
+    classes = {}
+    class_statements = {}
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+        elif isinstance(node, ast.ClassDef):
+            classes[node.name] = node
+            class_statements[node.name] = []
+        elif _statement_class(node) in classes:
+            # E.g., Model.update_forward_refs()
+            class_statements[_statement_class(node)].append(node)
+        else:
+            return
+
+    order = {name: i for i, name in enumerate(classes)}
+    dependencies = {
+        name: _referenced_names(node) & classes.keys() - {name}
+        for name, node in classes.items()
+    }
+    groups = _strongly_connected_components(order, dependencies)
+
+    module_names = {}
+    used_module_names = set()
+    for group in groups:
+        module_name = _module_name(group[0], used_module_names)
+        used_module_names.add(module_name)
+        for name in group:
+            module_names[name] = module_name
+
+    package_path = path.parent / SCHEMAS_PACKAGE
+    package_path.mkdir(exist_ok=True)
+    (package_path / "__init__.py").touch()
+
+    header = [_to_parent_package(node) for node in imports]
+    for group in groups:
+        body = list(header)
+
+        group_dependencies = sorted(
+            {d for name in group for d in dependencies[name]} - set(group),
+            key=order.get,
+        )
+        for dependency in group_dependencies:
+            body.append(
+                ast.ImportFrom(
+                    module=module_names[dependency],
+                    names=[ast.alias(name=dependency)],
+                    level=1,
+                )
+            )
+
+        # Statements such as update_forward_refs() follow all the classes
+        body.extend(classes[name] for name in group)
+        body.extend(stmt for name in group for stmt in class_statements[name])
+
+        module_path = package_path / f"{module_names[group[0]]}.py"
+        module_path.write_text(_unparse(body), encoding="utf-8")
+
+    path.write_text(_index_module(classes, module_names), encoding="utf-8")
+
+
+def _statement_class(node: ast.stmt):
+    """
+    Returns the name of the class whose method is called in the given
+    statement (e.g., `Model.update_forward_refs()`), or None.
+    """
+    if (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Attribute)
+        and isinstance(node.value.func.value, ast.Name)
+    ):
+        return node.value.func.value.id
+    return None
+
+
+def _referenced_names(node: ast.AST) -> set:
+    """
+    Returns the names referenced in the given node, including those in
+    string annotations (forward references).
+    """
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.AnnAssign):
+            for constant in ast.walk(child.annotation):
+                if isinstance(constant, ast.Constant) and isinstance(
+                    constant.value, str
+                ):
+                    try:
+                        expression = ast.parse(constant.value, mode="eval")
+                    except SyntaxError:
+                        continue
+                    names.update(_referenced_names(expression))
+    return names
+
+
+def _strongly_connected_components(order: dict, dependencies: dict) -> list:
+    """
+    Returns the groups of names that depend on each other (Tarjan's
+    algorithm), so that the dependencies between groups have no cycles.
+    Names are given as a dictionary with their position, which is kept in
+    each group.
+    """
+    index = {}
+    low_link = {}
+    stack = []
+    on_stack = set()
+    groups = []
+
+    for root in order:
+        if root in index:
+            continue
+
+        # Iterative depth-first search, to support long chains of models
+        work = [(root, iter(sorted(dependencies[root])))]
+        index[root] = low_link[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            name, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = low_link[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(dependencies[child]))))
+                elif child in on_stack:
+                    low_link[name] = min(low_link[name], index[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low_link[parent] = min(low_link[parent], low_link[name])
+
+            if low_link[name] == index[name]:
+                group = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    group.append(member)
+                    if member == name:
+                        break
+                groups.append(sorted(group, key=order.get))
+
+    return groups
+
+
+def _module_name(class_name: str, used_names: set) -> str:
+    """
+    Returns a unique module name for the given model.
+    """
+    base_name = to_snake_case(class_name).strip("_") or "model"
+    if keyword.iskeyword(base_name) or not base_name.isidentifier():
+        base_name = f"model_{base_name}" if base_name.isidentifier() else "model"
+
+    module_name = base_name
+    i = 0
+    while module_name in used_names:
+        i += 1
+        module_name = f"{base_name}{i}"
+    return module_name
+
+
+def _to_parent_package(node: ast.stmt) -> ast.stmt:
+    """
+    Returns the given import statement adapted to be used in a module of the
+    schemas package (i.e., relative imports refer to the parent package).
+    """
+    if not isinstance(node, ast.ImportFrom):
+        return node
+
+    if node.level > 0:
+        return ast.ImportFrom(
+            module=node.module, names=node.names, level=node.level + 1
+        )
+    if node.module and node.module.startswith("."):
+        return ast.ImportFrom(module="." + node.module, names=node.names, level=0)
+    return node
+
+
+def _unparse(statements: list) -> str:
+    return ast.unparse(ast.fix_missing_locations(ast.Module(statements, []))) + "\n"
+
+
+def _index_module(classes: dict, module_names: dict) -> str:
+    """
+    Returns the code of the module used as an index of the split models.
+    """
+    lines = [
+        "from typing import TYPE_CHECKING",
+        "",
+        "from ..internal.lazy import lazy_attributes",
+        "",
+        "if TYPE_CHECKING:",
+    ]
+    lines += [
+        f"    from .{SCHEMAS_PACKAGE}.{module_names[name]} import {name}"
+        for name in classes
+    ]
+    lines += ["", "__all__ = ["]
+    lines += [f'    "{name}",' for name in classes]
+    lines += ["]", "", "__getattr__, __dir__ = lazy_attributes(__name__, {"]
+    lines += [
+        f'    "{name}": ".{SCHEMAS_PACKAGE}.{module_names[name]}",' for name in classes
+    ]
+    lines += ["})", ""]
+    return "\n".join(lines)
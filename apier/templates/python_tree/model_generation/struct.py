@@ -0,0 +1,73 @@
+"""
+This module adapts the models generated by datamodel-code-generator to the
+struct model backend, whose models are based on `APIStruct` instead of
+pydantic models.
+"""
+
+import ast
+from pathlib import Path
+
+STRUCT_MODULE = "struct"
+STRUCT_BASE_CLASS = f".{STRUCT_MODULE}.APIStruct"
+
+# Names imported from pydantic that are replaced by those of the struct module
+_STRUCT_NAMES = {"Field"}
+
+
+def to_struct_models(models_file: str):
+    """
+    Adapts the given module of models, generated with `APIStruct` as their
+    base class, to the struct model backend:
+
+    - `Field` is imported from the struct module instead of pydantic.
+    - The bases of the classes with several bases are declared without
+      slots, since Python does not allow a class to inherit the slots of
+      several classes.
+
+    :param models_file: The path of the generated models module.
+    """
+    path = Path(models_file)
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+
+    struct_names = []
+    for i, node in enumerate(tree.body):
+        if isinstance(node, ast.ImportFrom) and node.module == "pydantic":
+            struct_names += [a for a in node.names if a.name in _STRUCT_NAMES]
+            node.names = [a for a in node.names if a.name not in _STRUCT_NAMES]
+            if struct_names:
+                tree.body[i + 1 : i + 1] = [
+                    ast.ImportFrom(module=STRUCT_MODULE, names=struct_names, level=1)
+                ]
+            if not node.names:
+                tree.body.remove(node)
+            break
+
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    for name in _bases_without_slots(classes):
+        classes[name].keywords.append(
+            ast.keyword(arg="slots", value=ast.Constant(value=False))
+        )
+
+    path.write_text(ast.unparse(ast.fix_missing_locations(tree)) + "\n")
+
+
+def _bases_without_slots(classes: dict) -> set:
+    """
+    Returns the names of the given classes that are (direct or indirect)
+    bases of a class with several bases.
+    """
+    bases = {
+        name: [b.id for b in node.bases if isinstance(b, ast.Name) and b.id in classes]
+        for name, node in classes.items()
+    }
+
+    names = set()
+    pending = [
+        b for class_bases in bases.values() if len(class_bases) > 1 for b in class_bases
+    ]
+    while pending:
+        name = pending.pop()
+        if name not in names:
+            names.add(name)
+            pending.extend(bases[name])
+    return names
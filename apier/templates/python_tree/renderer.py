@@ -1,7 +1,11 @@
+import json
+import multiprocessing
 import os
-import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from apier.core.api.endpoints import Endpoint
 from apier.core.api.openapi import Definition
@@ -10,8 +14,12 @@ from apier.templates.python_tree.functions import (
     payload_from_input_parameters,
     get_method_name,
 )
-from apier.templates.python_tree.model_generation.generate import generate_models
+from apier.templates.python_tree.model_generation.generate import (
+    MODEL_BACKENDS,
+    generate_models,
+)
 from apier.core.api.tree import APINode, build_endpoints_tree
+from apier.core.output import OutputWriter, apier_version, content_hash, directory_hash
 from apier.utils.path import abs_path_from_current_script as abs_path
 from apier.utils.strings import to_pascal_case, to_snake_case
 from .security import parse_security_schemes
@@ -45,92 +53,191 @@ class Renderer:
         self.output_path = output_path.rstrip("/")
         self.api_names = {}
         self.security_scheme_names = parse_security_schemes(self.definition)
+        self.async_client = bool(self.get_template_config("async-client", False))
+        self.split_models = bool(self.get_template_config("split-models", False))
+        self.model_backend = self.get_template_config("model-backend", "pydantic")
+        if self.model_backend not in MODEL_BACKENDS:
+            raise ValueError(
+                f"Unknown model backend '{self.model_backend}' "
+                f"(supported backends: {', '.join(MODEL_BACKENDS)})"
+            )
 
         self.verbose = ctx.get("verbose", False)
+        self.jobs = ctx.get("jobs") or 1
+        self.incremental = ctx.get("incremental", False)
+        self.format = not ctx.get("no_format", False)
         self.output_logger = ctx.get("output_logger", print)
+        self.environment = self.create_environment()
 
     def render(self):
         self.api_names = {}
 
-        if os.path.exists(self.output_path):
-            # TODO: Ask before removing
-            shutil.rmtree(self.output_path)
-        shutil.copytree(abs_path("./base"), self.output_path)
-        os.makedirs(self.output_path + "/apis")
-        open(self.output_path + "/apis/__init__.py", "w").close()
+        self.output = OutputWriter(
+            self.output_path,
+            fingerprint=self.fingerprint(),
+            incremental=self.incremental,
+        )
+        self.output.open()
+        self.output.copy_tree(abs_path("./base"))
+        self.output.write("apis/__init__.py", "")
+
+        if self.async_client:
+            # The asynchronous client sends its requests using httpx
+            with open(abs_path("./base/requirements.txt")) as f:
+                requirements = f.read().rstrip("\n")
+            self.output.write("requirements.txt", requirements + "\nhttpx>=0.26.0\n")
 
         self.output_logger("  📜 Generating models...")
-        generate_models(self.definition, self.schemas, self.output_path)
+        # Models are only generated from the schemas, so they do not depend
+        # on the paths of the definition
+        models_input = {
+            "definition": {
+                k: v for k, v in self.definition.definition.items() if k != "paths"
+            },
+            "schemas": self.schemas,
+            "split": self.split_models,
+            "backend": self.model_backend,
+        }
+        self.output.generate(
+            "models",
+            content_hash(json.dumps(models_input, sort_keys=True, default=str)),
+            lambda path: generate_models(
+                self.definition,
+                self.schemas,
+                path,
+                split=self.split_models,
+                backend=self.model_backend,
+            ),
+        )
 
         self.output_logger("  📝 Generating API client...")
         self.render_security_schemes_file()
         self.render_api_file()
         self.render_api_components()
 
-        format_file(self.output_path)
+        if self.format:
+            self.output.format(format_file)
         self.create_init_files()
+        self.output.close()
 
-    def create_init_files(self):
-        with open(self.output_path + "/__init__.py", "w") as f:
-            f.write("from .api import API\n")
+    def fingerprint(self) -> str:
+        """
+        Returns a hash of the template, the apier version and whether the
+        files are formatted, so that incremental builds write all the files
+        again if any of them changes.
+        """
+        return content_hash(
+            apier_version(), directory_hash(abs_path("./")), str(self.format)
+        )
 
-        with open(self.output_path + "/models/__init__.py", "w") as f:
-            f.write("from .models import *\n")
+    def create_environment(self) -> Environment:
+        """
+        Returns the Jinja environment shared by all the templates of a
+        render, so that each template is only compiled once. If a cache
+        directory is given in the context, the compiled templates are also
+        stored there and reused by the next builds.
+        """
+        bytecode_cache = None
+        cache_dir = self.ctx.get("cache_dir")
+        if cache_dir:
+            cache_dir = os.path.join(cache_dir, "templates")
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
 
-    def render_api_file(self):
-        filename = f"{self.output_path}/api.py"
         environment = Environment(
             loader=FileSystemLoader(abs_path("./")),
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
         )
 
         environment.filters["snake_case"] = to_snake_case
         environment.filters["pascal_case"] = to_pascal_case
         environment.filters["api_name"] = self.get_api_name
+        environment.filters["method_name"] = get_method_name
 
-        template = environment.get_template("templates/api.jinja")
+        return environment
+
+    def create_init_files(self):
+        self.output.write("__init__.py", "from .api import API\n", formatted=False)
+
+        if self.split_models:
+            # Models are only imported when they are first accessed
+            models_init = (
+                "from ..internal.lazy import lazy_attributes\n"
+                "from .models import __all__\n\n"
+                "__getattr__, __dir__ = lazy_attributes("
+                '__name__, dict.fromkeys(__all__, ".models"))\n'
+            )
+        else:
+            # The models module is only imported when a model is first accessed
+            models_init = (
+                "from ..internal.lazy import lazy_module\n\n"
+                '__getattr__, __dir__ = lazy_module(__name__, ".models")\n'
+            )
+        self.output.write("models/__init__.py", models_init, formatted=False)
+
+    def render_api_file(self):
+        template = self.environment.get_template("templates/api.jinja")
         content = template.render(
             openapi=self.definition.definition,
             get_type_hint=get_type_hint,
             server_url=self.definition.get_value("servers.0.url", default=None),
             root_branches=self.api_tree.branches,
             security_scheme_names=self.security_scheme_names,
-            raise_errors=bool(
-                self.definition.get_value(
-                    f"info.x-apier.templates.{TEMPLATE_NAME}.raise-response-errors",
-                    default=True,
-                )
-            ),
+            raise_errors=bool(self.get_template_config("raise-response-errors", True)),
+            async_client=self.async_client,
         )
-        with open(filename, mode="w", encoding="utf-8") as message:
-            message.write(content)
+        self.output.write("api.py", content)
 
     def render_security_schemes_file(self):
         if not self.security_scheme_names:
             return
 
-        filename = f"{self.output_path}/security.py"
-        environment = Environment(
-            loader=FileSystemLoader(abs_path("./")),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # environment.filters['snake_case'] = to_snake_case
-        environment.filters["pascal_case"] = to_pascal_case
-
-        template = environment.get_template("templates/security.jinja")
+        template = self.environment.get_template("templates/security.jinja")
         content = template.render(
             openapi=self.definition.definition,
             security_schemes=self.definition.get_value(
                 "components.securitySchemes", default=None
             ),
         )
-        with open(filename, mode="w", encoding="utf-8") as message:
-            message.write(content)
+        self.output.write("security.py", content)
 
     def render_api_components(self):
+        """
+        Renders the module of each node of the API tree. If more than one job
+        is configured, the modules are rendered concurrently by a pool of
+        processes, and written in the same order as when rendered
+        sequentially.
+        """
+        api_nodes = self.api_nodes()
+
+        # Names are allocated in the same order as if each module were
+        # rendered after the previous one, so they do not depend on the
+        # number of jobs
+        for api_node in api_nodes:
+            self.get_api_name(api_node)
+            self.sort_layers(api_node)
+            for next_node in self.next_nodes(api_node):
+                self.get_api_name(next_node)
+
+        if self.jobs > 1 and len(api_nodes) > 1 and _can_fork():
+            contents = _render_api_components_parallel(self, api_nodes)
+        else:
+            contents = map(self.render_api_component_content, api_nodes)
+
+        for api_node, content in zip(api_nodes, contents):
+            api_filename = to_snake_case(self.get_api_name(api_node))
+            if self.verbose:
+                self.output_logger(f"    Rendering /apis/{api_filename}.py... ")
+
+            self.output.write(f"apis/{api_filename}.py", content)
+
+    def api_nodes(self) -> list[APINode]:
+        """
+        Returns the nodes of the API tree in the order they are rendered.
+        """
+        api_nodes = []
         nodes_processed = set()
         stack = [self.api_tree]
 
@@ -140,9 +247,21 @@ class Renderer:
                 if api.next is not None:
                     stack.append(api.next)
                 if id(api) not in nodes_processed:
-                    self.render_api_component(api)
+                    api_nodes.append(api)
                     nodes_processed.add(id(api))
 
+        return api_nodes
+
+    def get_template_config(self, name: str, default=None):
+        """
+        Returns the value of the given option of the template configuration
+        (`info.x-apier.templates.python-tree`), or the default value if it is
+        not set.
+        """
+        return self.definition.get_value(
+            f"info.x-apier.templates.{TEMPLATE_NAME}.{name}", default=default
+        )
+
     def get_api_name(self, api_node: APINode) -> str:
         """
         Returns a unique name for the given API node.
@@ -162,28 +281,39 @@ class Renderer:
         self.api_names[id(api_node)] = api_name
         return api_name
 
+    @staticmethod
+    def sort_layers(api_node: APINode):
+        """
+        Sorts the layers of the given node by number of parameters.
+        """
+        api_node.layers.sort(key=lambda p: len(p.parameters), reverse=True)
+
+    @staticmethod
+    def next_nodes(api_node: APINode) -> list[APINode]:
+        """
+        Returns the nodes following any of the layers of the given node,
+        without duplicates.
+        """
+        return list(
+            {id(n): n for layer in api_node.layers for n in layer.next}.values()
+        )
+
     def render_api_component(self, api_node: APINode):
         api_filename = to_snake_case(self.get_api_name(api_node))
-        filename = f"{self.output_path}/apis/{api_filename}.py"
 
         if self.verbose:
             self.output_logger(f"    Rendering /apis/{api_filename}.py... ")
 
-        environment = Environment(
-            loader=FileSystemLoader(abs_path("./")),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        content = self.render_api_component_content(api_node)
+        self.output.write(f"apis/{api_filename}.py", content)
 
-        environment.filters["snake_case"] = to_snake_case
-        environment.filters["pascal_case"] = to_pascal_case
-        environment.filters["api_name"] = self.get_api_name
-        environment.filters["method_name"] = get_method_name
-
-        template = environment.get_template("templates/node.jinja")
+    def render_api_component_content(self, api_node: APINode) -> str:
+        """
+        Returns the content of the module of the given API node.
+        """
+        template = self.environment.get_template("templates/node.jinja")
 
-        # Sort layers by number of parameters
-        api_node.layers.sort(key=lambda p: len(p.parameters), reverse=True)
+        self.sort_layers(api_node)
 
         has_layer_without_params = any(len(p.parameters) == 0 for p in api_node.layers)
         optional_param_names = [
@@ -192,22 +322,85 @@ class Renderer:
             if len(api_node.layers) > 1 and i > 0 or has_layer_without_params
         ]
 
-        content = template.render(
+        return template.render(
             api_node=api_node,
+            next_nodes=self.next_nodes(api_node),
             optional_param_names=optional_param_names,
             has_layer_without_params=has_layer_without_params,
             get_type_hint=get_type_hint,
             payload_from_input_parameters=payload_from_input_parameters,
+            async_client=self.async_client,
         )
-        with open(filename, mode="w", encoding="utf-8") as message:
-            message.write(content)
 
 
-def format_file(filename):
-    config_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ruff.toml")
+# Renderer and API nodes used by the worker processes rendering API components
+_worker_state = None
+
+
+def _can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _init_worker(renderer: Renderer, api_nodes: list[APINode]):
+    global _worker_state
+    _worker_state = (renderer, api_nodes)
 
-    os.system(f"ruff check --config {config_file} check {filename} --fix -q")
-    os.system(f"ruff check --config {config_file} format {filename} -q")
 
-    # Run black with --exclude '' to format all files, including those in .gitignore
-    os.system(f"black {filename} --exclude '' -q")
+def _render_api_component_in_worker(index: int) -> str:
+    renderer, api_nodes = _worker_state
+    return renderer.render_api_component_content(api_nodes[index])
+
+
+def _render_api_components_parallel(renderer: Renderer, api_nodes: list[APINode]):
+    """
+    Renders the modules of the given API nodes using a pool of processes,
+    returning their contents in the same order as the nodes.
+
+    Worker processes are forked, so they inherit the renderer and the API
+    tree instead of receiving a serialized copy.
+    """
+    with ProcessPoolExecutor(
+        max_workers=renderer.jobs,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(renderer, api_nodes),
+    ) as executor:
+        chunksize = max(1, len(api_nodes) // (renderer.jobs * 4))
+        return list(
+            executor.map(
+                _render_api_component_in_worker,
+                range(len(api_nodes)),
+                chunksize=chunksize,
+            )
+        )
+
+
+def format_file(path: str):
+    """
+    Formats the Python files in the given directory.
+
+    Imports are sorted and unused imports are removed by a single ruff
+    process, and the code is then formatted by a single black process, which
+    reads its configuration from the nearest pyproject.toml and skips the
+    files left unchanged since its previous run.
+
+    :param path: The directory containing the files.
+    :raises subprocess.CalledProcessError: If ruff or black fail.
+    """
+    filenames = sorted(
+        os.path.join(root, name)
+        for root, dirs, files in os.walk(path)
+        for name in files
+        if name.endswith(".py")
+    )
+    if not filenames:
+        return
+
+    config_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ruff.toml")
+    subprocess.run(
+        [sys.executable, "-m", "ruff", "check", "--config", config_file]
+        + ["--fix", "--exit-zero", "--quiet"]
+        + filenames,
+        check=True,
+    )
+    subprocess.run([sys.executable, "-m", "black", "--quiet"] + filenames, check=True)
@@ -0,0 +1,75 @@
+"""
+Benchmark of the API tree construction of large OpenAPI definitions.
+
+It builds a synthetic definition with the given number of paths (see
+`parse_endpoints.py`), plus an alias of some of them declared as equivalent
+paths, and measures the time taken to build the API tree of its endpoints.
+
+Usage:
+    python benchmarks/build_tree.py [--paths 5000] [--equivalences 500]
+"""
+
+import argparse
+import time
+import warnings
+
+# parse_endpoints adds the root directory of the repository to sys.path
+from parse_endpoints import synthetic_definition
+
+if True:
+    from apier.core.api.endpoints import EndpointsParser
+    from apier.core.api.openapi import Definition
+    from apier.core.api.tree import build_endpoints_tree
+
+
+def synthetic_definition_with_equivalences(
+    num_paths: int, num_equivalences: int
+) -> dict:
+    """
+    Returns an OpenAPI definition with the given number of paths, where the
+    given number of them have an alias declared as an equivalent path.
+    """
+    definition = synthetic_definition(num_paths)
+    paths = definition["paths"]
+
+    equivalent_paths = []
+    for i in range(min(num_equivalences, num_paths)):
+        target = f"/resources{i % 100}/{{resource_id}}/items{i}"
+        source = f"/aliases{i}/{{resource_id}}/items{i}"
+        equivalent_paths.append({"source": source, "target": target})
+        paths[source + "/{item_id}"] = paths[target + "/{item_id}"]
+
+    definition["info"]["x-apier"] = {"equivalent_paths": equivalent_paths}
+    return definition
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--paths", type=int, default=5000)
+    arg_parser.add_argument("--equivalences", type=int, default=500)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    definition = Definition(
+        synthetic_definition_with_equivalences(args.paths, args.equivalences)
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        endpoints = EndpointsParser(definition).parse_endpoints()
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        build_endpoints_tree(endpoints)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(
+        f"API tree of {len(endpoints)} endpoints built in {best:.3f} s "
+        f"({best / len(endpoints) * 1e6:.1f} µs per endpoint, "
+        f"best of {args.repeat})"
+    )
+
+
+if __name__ == "__main__":
+    main()
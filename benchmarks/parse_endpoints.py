@@ -0,0 +1,152 @@
+"""
+Benchmark of the endpoint parsing of large OpenAPI definitions.
+
+It builds a synthetic definition with the given number of paths, whose
+parameters, schemas and responses are shared through references (as in most
+large definitions), and measures the time taken to parse all its endpoints.
+
+Usage:
+    python benchmarks/parse_endpoints.py [--paths 10000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+# Add the root directory of the repository to sys.path, so that apier can be
+# imported without being installed
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+if True:
+    from apier.core.api.endpoints import EndpointsParser
+    from apier.core.api.openapi import Definition
+
+
+def synthetic_definition(num_paths: int) -> dict:
+    """
+    Returns an OpenAPI definition with the given number of paths.
+    """
+    paths = {}
+    for i in range(num_paths):
+        resource = f"resources{i % 100}"
+        paths[f"/{resource}/{{resource_id}}/items{i}/{{item_id}}"] = {
+            "parameters": [
+                {"$ref": "#/components/parameters/ResourceId"},
+                {"$ref": "#/components/parameters/ItemId"},
+            ],
+            "get": {
+                "operationId": f"getItem{i}",
+                "description": "Returns an item.",
+                "parameters": [
+                    {"$ref": "#/components/parameters/Limit"},
+                    {"name": "filter", "in": "query", "schema": {"type": "string"}},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Item"}
+                            }
+                        },
+                    },
+                    "404": {"$ref": "#/components/responses/Error"},
+                },
+            },
+            "post": {
+                "operationId": f"updateItem{i}",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {"name": {"type": "string"}},
+                            }
+                        }
+                    }
+                },
+                "responses": {"204": {"description": "No content"}},
+            },
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Benchmark API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {
+            "parameters": {
+                "ResourceId": {
+                    "name": "resource_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                },
+                "ItemId": {
+                    "name": "item_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"},
+                },
+                "Limit": {
+                    "name": "limit",
+                    "in": "query",
+                    "schema": {"type": "integer"},
+                },
+            },
+            "schemas": {
+                "Item": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}},
+                },
+                "Error": {
+                    "type": "object",
+                    "properties": {"message": {"type": "string"}},
+                },
+            },
+            "responses": {
+                "Error": {
+                    "description": "Error",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Error"}
+                        }
+                    },
+                }
+            },
+        },
+    }
+
+
+def parse_endpoints(definition: Definition, jobs: int = 1) -> list:
+    return EndpointsParser(definition).parse_endpoints(jobs=jobs)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--paths", type=int, default=10000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--jobs", type=int, default=1)
+    args = arg_parser.parse_args()
+
+    definition_dict = synthetic_definition(args.paths)
+
+    timings = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for _ in range(args.repeat):
+            definition = Definition(definition_dict)
+            start = time.perf_counter()
+            parse_endpoints(definition, args.jobs)
+            timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(
+        f"{args.paths} paths parsed in {best:.3f} s "
+        f"({best / args.paths * 1e6:.1f} µs per path, best of {args.repeat})"
+    )
+
+
+if __name__ == "__main__":
+    main()
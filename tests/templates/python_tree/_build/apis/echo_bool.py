@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ECHO_BOOL1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "text/plain", models.GetBooleanResponseResponse200),
+    ]
+)
+
+
+@dataclass
+class EchoBool1(APIResource):
+
+    def get(self, **kwargs) -> models.GetBooleanResponseResponse200:
+        """
+        Returns a boolean response
+
+        :return: The API response to the request.
+        :rtype: models.GetBooleanResponseResponse200
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _ECHO_BOOL1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/echo_bool"
+
+
+class _EchoBoolMethods:
+    """
+    This class declares and implements the `echo_bool()` method.
+    """
+
+    @overload
+    def echo_bool(self) -> EchoBool1: ...
+
+    def echo_bool(self):
+        return EchoBool1()._child_of(self)
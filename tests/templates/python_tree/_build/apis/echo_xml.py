@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ECHO_XML1_POST_REQ_CONTENT_TYPES = [
+    ("application/xml", models.Company),
+]
+
+_ECHO_XML1_POST_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/xml", models.Company),
+    ]
+)
+
+
+@dataclass
+class EchoXml1(APIResource):
+
+    def post(self, req: Union[models.Company, dict], **kwargs) -> models.Company:
+        """
+        Returns an XML response
+
+        :param req: Request payload.
+        :type req: Union[models.Company, dict]
+        :return: The API response to the request.
+        :rtype: models.Company
+        """
+        resp = self._make_request(
+            "POST", req, req_content_types=_ECHO_XML1_POST_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _ECHO_XML1_POST_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/echo_xml"
+
+
+class _EchoXmlMethods:
+    """
+    This class declares and implements the `echo_xml()` method.
+    """
+
+    @overload
+    def echo_xml(self) -> EchoXml1: ...
+
+    def echo_xml(self):
+        return EchoXml1()._child_of(self)
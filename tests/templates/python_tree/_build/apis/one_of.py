@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ONE_OF1_POST_REQ_CONTENT_TYPES = [
+    ("application/json", models.PostTestsOneOfRequest),
+]
+
+_ONE_OF1_POST_RESPONSES = ExpectedResponses(
+    [
+        (200, "text/plain", models.PostTestsOneOfResponse200),
+    ]
+)
+
+
+@dataclass
+class OneOf1(APIResource):
+
+    def post(
+        self, req: models.PostTestsOneOfRequest, **kwargs
+    ) -> models.PostTestsOneOfResponse200:
+        """
+        Send request with multiple possible schemas
+
+        :param req: Request payload.
+        :type req: models.PostTestsOneOfRequest
+        :return: The API response to the request.
+        :rtype: models.PostTestsOneOfResponse200
+        """
+        resp = self._make_request(
+            "POST", req, req_content_types=_ONE_OF1_POST_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _ONE_OF1_POST_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/oneOf"
+
+
+class _OneOfMethods:
+    """
+    This class declares and implements the `oneOf()` method.
+    """
+
+    @overload
+    def one_of(self) -> OneOf1: ...
+
+    def one_of(self):
+        return OneOf1()._child_of(self)
@@ -0,0 +1,3 @@
+from ..internal.lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(__name__, ".models")
@@ -0,0 +1,149 @@
+# generated by datamodel-codegen:
+#   filename:  schemas.yaml
+#   timestamp: 2026-10-18T05:12:25+00:00
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional, Union
+
+from pydantic import Extra, Field
+
+from .basemodel import APIBaseModel
+
+
+class AnyValue(APIBaseModel):
+    __root__: Optional[Any] = Field(
+        None,
+        description="Can be any value - string, number, boolean, array, object or null.",
+    )
+
+
+class Category(Enum):
+    food = "food"
+    clothing = "clothing"
+    technology = "technology"
+    evil = "evil"
+    stickers = "stickers"
+
+
+class CompanyBase(APIBaseModel):
+    category: Optional[Category] = Field(None, example="stickers")
+    id: Optional[str] = Field(
+        None, description="ID of the Company.", example="shiny_stickers"
+    )
+    name: Optional[str] = Field(
+        None, description="Name of the Company.", example="Shiny Stickers"
+    )
+
+
+class CompanyCreate(CompanyBase):
+    pass
+
+
+class Cursors(APIBaseModel):
+    next: Optional[str] = Field(None, example="")
+    previous: Optional[str] = Field(None, example="")
+
+
+class CompanyUpdate(CompanyBase):
+    pass
+
+
+class EmployeeBase(APIBaseModel):
+    name: Optional[str] = Field(
+        None, description="Name of the employee.", example="Billy"
+    )
+    number: Optional[int] = Field(
+        None, description="ID number of the employee.", example=17
+    )
+
+
+class EmployeeCreate(EmployeeBase):
+    pass
+
+
+class ErrorResponse(APIBaseModel):
+    message: str = Field(..., example="Oh, no!")
+    status: int = Field(..., example=400)
+
+
+class GetArrayResponseResponse200(APIBaseModel):
+    __root__: List[int]
+
+
+class GetBooleanResponseResponse200(APIBaseModel):
+    __root__: bool
+
+
+class GetObjectResponseResponse200(APIBaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class GetTestTestResponse200(APIBaseModel):
+    pass
+
+
+class GetTextResponseRequest(APIBaseModel):
+    __root__: str
+
+
+class GetTextResponseResponse200(APIBaseModel):
+    __root__: str
+
+
+class Op(Enum):
+    add = "add"
+    remove = "remove"
+    replace = "replace"
+    move = "move"
+    copy = "copy"
+    test = "test"
+
+
+class PatchCompanyRequestItem(APIBaseModel):
+    from_: Optional[str] = Field(
+        None, alias="from", description="Used with 'move' and 'copy' operations."
+    )
+    op: Op
+    path: str = Field(
+        ..., description="The path to the property to modify, e.g. '/name'."
+    )
+    value: Optional[Any] = Field(
+        None, description="The value to apply in operations like add/replace/test."
+    )
+
+
+class PatchCompanyRequest(APIBaseModel):
+    __root__: List[PatchCompanyRequestItem]
+
+
+class PostTestsOneOfResponse200(APIBaseModel):
+    __root__: str
+
+
+class Company(CompanyBase):
+    created: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
+    modified: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
+
+
+class CompanyList(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Company]] = None
+
+
+class Employee(EmployeeBase):
+    pass
+
+
+class EmployeeList(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Employee]] = None
+
+
+class PostTestsOneOfRequest(APIBaseModel):
+    __root__: Union[Company, Employee]
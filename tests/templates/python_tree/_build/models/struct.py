@@ -0,0 +1,817 @@
+"""
+This module defines the base class of the struct models, which are
+generated instead of pydantic models when the `model-backend` template
+option is `struct`.
+
+Struct models are declared like pydantic models, but they are slotted
+classes whose instances are built by a decoder compiled for each model class
+the first time it is used. Values are checked against their JSON types
+instead of being coerced (e.g., a string is not accepted for an integer
+field), and the constraints of the fields (e.g., a maximum length) are
+checked. Values of any other type (e.g., dates) are validated by pydantic.
+"""
+
+import copy
+import json
+import operator
+import re
+from enum import Enum
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+from pydantic import BaseConfig, BaseModel, Extra, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import (
+    AnyStrMaxLengthError,
+    AnyStrMinLengthError,
+    BoolError,
+    BytesError,
+    DictError,
+    EnumMemberError,
+    ExtraError,
+    FloatError,
+    IntegerError,
+    ListError,
+    ListMaxLengthError,
+    ListMinLengthError,
+    ListUniqueItemsError,
+    MissingError,
+    NumberNotGeError,
+    NumberNotGtError,
+    NumberNotLeError,
+    NumberNotLtError,
+    NumberNotMultipleError,
+    PydanticTypeError,
+    StrError,
+    StrRegexError,
+    WrongConstantError,
+)
+from pydantic.fields import ModelField, Undefined
+from pydantic.json import pydantic_encoder
+
+from .pagination import Paginator, _PaginationHelper
+
+_MISSING = object()
+
+_ROOT_KEY = "__root__"
+
+_CONSTRAINTS = {
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "multiple_of",
+    "min_length",
+    "max_length",
+    "regex",
+    "min_items",
+    "max_items",
+    "unique_items",
+}
+
+# Default values that can be shared by all the instances of a model
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes, Enum, tuple, frozenset)
+
+_ERRORS = (ValueError, TypeError, AssertionError)
+
+
+class FieldInfo:
+    """
+    The declaration of a field of a struct model.
+    """
+
+    __slots__ = ("default", "default_factory", "alias", "constraints")
+
+    def __init__(
+        self, default=_MISSING, default_factory=None, alias=None, constraints=None
+    ):
+        self.default = default
+        self.default_factory = default_factory
+        self.alias = alias
+        self.constraints = constraints or {}
+
+    @property
+    def required(self) -> bool:
+        return self.default is _MISSING and self.default_factory is None
+
+
+def Field(default: Any = ..., *, alias: str = None, default_factory=None, **kwargs):
+    """
+    Declares a field of a struct model, as `pydantic.Field` does. Only the
+    default value, the alias and the constraints of the field are used.
+    """
+    constraints = {
+        k: v for k, v in kwargs.items() if k in _CONSTRAINTS and v is not None
+    }
+    if default is ...:
+        default = _MISSING
+    return FieldInfo(default, default_factory, alias, constraints)
+
+
+class StructMeta(type):
+    """
+    Metaclass of the struct models. It collects the fields declared by the
+    annotations of the class and its bases, and declares the slots of the
+    fields of the class, unless the class is created with `slots=False`
+    (e.g., because it is a base of a class with several struct bases).
+    """
+
+    def __new__(mcs, name, bases, namespace, slots=True, **kwargs):
+        fields = {}
+        config = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, "__struct_fields__", {}))
+            config.update(getattr(base, "__struct_config__", {}))
+
+        config_class = namespace.pop("Config", None)
+        if config_class is not None:
+            config.update(
+                {k: v for k, v in vars(config_class).items() if not k.startswith("_")}
+            )
+
+        own_fields = []
+        for field_name in namespace.get("__annotations__", {}):
+            value = namespace.pop(field_name, _MISSING)
+            if not isinstance(value, FieldInfo):
+                value = FieldInfo(default=value)
+            fields[field_name] = value
+            own_fields.append(field_name)
+
+        if slots and "__slots__" not in namespace:
+            inherited = {
+                slot
+                for base in bases
+                for c in base.__mro__
+                for slot in c.__dict__.get("__slots__", ())
+            }
+            namespace["__slots__"] = tuple(f for f in own_fields if f not in inherited)
+
+        if _ROOT_KEY in fields and "__setattr__" not in namespace:
+            namespace["__setattr__"] = _root_setattr
+
+        namespace["__struct_fields__"] = fields
+        namespace["__struct_config__"] = config
+        namespace["__struct_decoders__"] = {}
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, slots=True, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+
+class APIStruct(Paginator, metaclass=StructMeta):
+    """
+    The base class of struct models. Like `APIBaseModel`, it allows to access
+    the items of a __root__ dictionary or list with dot and square-bracket
+    notation, to get the HTTP response of an instance and to paginate its
+    results.
+    """
+
+    __slots__ = ("_http_response", "_pagination", "_extra")
+
+    # Used by pydantic to format the errors of the models
+    __config__ = BaseConfig
+
+    def __init__(self, **data):
+        errors = _decoder(type(self), True)[1](self, data)
+        if errors:
+            raise ValidationError(errors, type(self))
+
+    @classmethod
+    def parse_obj(cls, obj):
+        """
+        Returns an instance of the model built from the given data, checking
+        that it is valid.
+        """
+        return _decoder(cls, True)[0](obj)
+
+    @classmethod
+    def _construct(cls, obj):
+        """
+        Returns an instance of the model built from trusted data, without
+        checking the types of the values that can be used as they are, nor
+        the constraints of the fields.
+        """
+        return _decoder(cls, False)[0](obj)
+
+    @classmethod
+    def update_forward_refs(cls, **localns):
+        # Annotations are resolved when the decoder is compiled
+        pass
+
+    def __getattr__(self, attribute):
+        # Called for the attributes that have not been set
+        if attribute == "_pagination":
+            pagination = _PaginationHelper()
+            object.__setattr__(self, "_pagination", pagination)
+            return pagination
+        if attribute in ("_http_response", "_extra"):
+            return None
+        if attribute.startswith("__") and attribute.endswith("__"):
+            raise AttributeError(attribute)
+
+        extra = self._extra
+        if extra and attribute in extra:
+            return extra[attribute]
+        if self._has_root(dict) and attribute in self.__root__:
+            return self.__root__[attribute]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{attribute}'"
+        )
+
+    def _has_root(self, types):
+        return _ROOT_KEY in self.__struct_fields__ and isinstance(self.__root__, types)
+
+    def _set_http_response(self, response):
+        object.__setattr__(self, "_http_response", response)
+
+    def http_response(self):
+        """
+        Returns the HTTP response of this model instance.
+        """
+        return self._http_response
+
+    def _enable_pagination(self, data_attribute: str):
+        self._pagination.supported = True
+        self._pagination.results_attribute = data_attribute
+
+    def _values(self) -> dict:
+        values = {name: getattr(self, name) for name in self.__struct_fields__}
+        if self._extra:
+            values.update(self._extra)
+        return values
+
+    def dict(self, *, by_alias: bool = False, exclude_none: bool = False):
+        """
+        Returns the values of the model as a dictionary, converting the nested
+        models too. The value of models with a __root__ field is returned as
+        it is.
+        """
+        if _ROOT_KEY in self.__struct_fields__:
+            return _to_builtins(self.__root__, by_alias, exclude_none)
+
+        fields = self.__struct_fields__
+        values = {}
+        for name, value in self._values().items():
+            if exclude_none and value is None:
+                continue
+            field = fields.get(name)
+            key = (field.alias or name) if by_alias and field is not None else name
+            values[key] = _to_builtins(value, by_alias, exclude_none)
+        return values
+
+    def json(self, *, by_alias: bool = False, exclude_none: bool = False, **kwargs):
+        """
+        Returns the JSON representation of the model.
+        """
+        return json.dumps(
+            self.dict(by_alias=by_alias, exclude_none=exclude_none),
+            default=pydantic_encoder,
+            **kwargs,
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, (APIStruct, BaseModel)):
+            return self.dict() == other.dict()
+        return self.dict() == other
+
+    def __repr__(self):
+        if _ROOT_KEY in self.__struct_fields__:
+            return repr(self.__root__)
+        values = ", ".join(f"{k}={v!r}" for k, v in self._values().items())
+        return f"{type(self).__name__}({values})"
+
+    def __str__(self):
+        if _ROOT_KEY in self.__struct_fields__:
+            return str(self.__root__)
+        return " ".join(f"{k}={v!r}" for k, v in self._values().items())
+
+    def __getitem__(self, key):
+        if self._has_root((dict, list)):
+            return self.__root__[key]
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if self._has_root((dict, list)):
+            self.__root__[key] = value
+        else:
+            setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if self._has_root((dict, list)):
+            del self.__root__[key]
+        else:
+            raise TypeError("Cannot delete an object attribute")
+
+    def __contains__(self, key):
+        if self._has_root((dict, list)):
+            return key in self.__root__
+        return key in self._values()
+
+    def __len__(self):
+        if self._has_root((dict, list)):
+            return len(self.__root__)
+        return len(self._values())
+
+    def items(self):
+        if self._has_root(dict):
+            return self.__root__.items()
+        return self._values().items()
+
+    def __iter__(self):
+        if self._pagination.supported:
+            return Paginator.__iter__(self)
+        if self._has_root((dict, list)):
+            return iter(self.__root__)
+        return iter(self._values().items())
+
+    def __next__(self):
+        if self._pagination.supported:
+            return Paginator.__next__(self)
+        raise TypeError(f"'{type(self).__name__}' object is not an iterator")
+
+    def __aiter__(self):
+        if self._pagination.supported:
+            return Paginator.__aiter__(self)
+        raise TypeError(f"'{type(self).__name__}' object is not async iterable")
+
+    async def __anext__(self):
+        if self._pagination.supported:
+            return await Paginator.__anext__(self)
+        raise TypeError(f"'{type(self).__name__}' object is not async iterable")
+
+
+def _root_setattr(self, attribute, value):
+    """
+    Sets the items of a __root__ dictionary using dot notation.
+    """
+    if attribute != _ROOT_KEY and self._has_root(dict):
+        self.__root__[attribute] = value
+    else:
+        object.__setattr__(self, attribute, value)
+
+
+def _to_builtins(value, by_alias: bool, exclude_none: bool):
+    """
+    Returns the given value with the models it contains converted to
+    dictionaries.
+    """
+    if isinstance(value, APIStruct):
+        return value.dict(by_alias=by_alias, exclude_none=exclude_none)
+    if isinstance(value, BaseModel):
+        value = value.dict(by_alias=by_alias, exclude_none=exclude_none)
+        return value.get(_ROOT_KEY, value) if isinstance(value, dict) else value
+    if isinstance(value, list):
+        return [_to_builtins(v, by_alias, exclude_none) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_builtins(v, by_alias, exclude_none) for k, v in value.items()}
+    return value
+
+
+def _decoder(cls: StructMeta, checked: bool):
+    """
+    Returns the functions that build instances of the given struct model:
+    the first one receives the data and returns the instance, and the second
+    one sets the fields of a given instance and returns the errors found.
+    The functions are compiled the first time they are needed.
+
+    :param cls:     The class of the model.
+    :param checked: Whether the values are checked (i.e., the data is not
+                    trusted).
+    """
+    decoder = cls.__struct_decoders__.get(checked)
+    if decoder is None:
+        decoder = cls.__struct_decoders__[checked] = _compile_decoder(cls, checked)
+    return decoder
+
+
+def _compile_decoder(cls: StructMeta, checked: bool):
+    hints = get_type_hints(cls)
+    fields = cls.__struct_fields__
+    config = cls.__struct_config__
+    by_name = config.get("allow_population_by_field_name", False)
+    extra = Extra(config.get("extra", Extra.ignore))
+
+    namespace = {
+        "_MISSING": _MISSING,
+        "_ERRORS": _ERRORS,
+        "_add_error": _add_error,
+        "_deepcopy": copy.deepcopy,
+        "MissingError": MissingError,
+        "ExtraError": ExtraError,
+    }
+    known_keys = set()
+    lines = ["def fill(obj, data):", "    errors = None"]
+    for i, (name, field) in enumerate(fields.items()):
+        alias = field.alias or name
+        known_keys.add(alias)
+        target = f"obj.{name}" if name.isidentifier() else None
+
+        lines.append(f"    value = data.get({alias!r}, _MISSING)")
+        if by_name and name != alias:
+            known_keys.add(name)
+            lines.append("    if value is _MISSING:")
+            lines.append(f"        value = data.get({name!r}, _MISSING)")
+
+        lines.append("    if value is _MISSING:")
+        if field.required:
+            lines.append(
+                f"        errors = _add_error(errors, MissingError(), {alias!r})"
+            )
+        else:
+            if field.default_factory is not None:
+                namespace[f"f{i}"] = field.default_factory
+                default = f"f{i}()"
+            elif isinstance(field.default, _IMMUTABLE_TYPES):
+                namespace[f"d{i}"] = field.default
+                default = f"d{i}"
+            else:
+                namespace[f"d{i}"] = field.default
+                default = f"_deepcopy(d{i})"
+            lines.append(f"        {_assignment(target, name, default)}")
+
+        lines.append("    else:")
+        convert = _converter(hints.get(name, Any), checked)
+        if checked and field.constraints:
+            convert = _constrained(convert, field.constraints)
+        if convert is None:
+            lines.append(f"        {_assignment(target, name, 'value')}")
+        else:
+            namespace[f"c{i}"] = convert
+            lines.append("        try:")
+            lines.append(f"            {_assignment(target, name, f'c{i}(value)')}")
+            lines.append("        except _ERRORS as e:")
+            lines.append(f"            errors = _add_error(errors, e, {alias!r})")
+
+    namespace["known_keys"] = frozenset(known_keys)
+    if extra == Extra.allow:
+        lines.append(
+            "    extra = {k: v for k, v in data.items() if k not in known_keys}"
+        )
+        lines.append("    if extra:")
+        lines.append("        obj._extra = extra")
+    elif extra == Extra.forbid and checked:
+        lines.append("    for key in data.keys() - known_keys:")
+        lines.append("        errors = _add_error(errors, ExtraError(), key)")
+    lines.append("    return errors")
+
+    exec(compile("\n".join(lines), f"<{cls.__qualname__} decoder>", "exec"), namespace)
+    fill = namespace["fill"]
+    new = object.__new__
+    is_root = _ROOT_KEY in fields
+
+    def decode(data):
+        if is_root:
+            if not (isinstance(data, dict) and data.keys() == {_ROOT_KEY}):
+                data = {_ROOT_KEY: data}
+        elif not isinstance(data, dict):
+            raise ValidationError([ErrorWrapper(DictError(), loc=_ROOT_KEY)], cls)
+
+        obj = new(cls)
+        errors = fill(obj, data)
+        if errors:
+            raise ValidationError(errors, cls)
+        return obj
+
+    return decode, fill
+
+
+def _assignment(target, name: str, value: str) -> str:
+    if target is None:
+        return f"setattr(obj, {name!r}, {value})"
+    return f"{target} = {value}"
+
+
+class _ItemError(ValueError):
+    """
+    An error found in an item of a list or a dictionary, with its location.
+    """
+
+    def __init__(self, exc: Exception, loc: tuple):
+        super().__init__(str(exc))
+        self.exc = exc
+        self.loc = loc
+
+
+def _item_error(exc: Exception, key) -> _ItemError:
+    if isinstance(exc, _ItemError):
+        return _ItemError(exc.exc, (key,) + exc.loc)
+    return _ItemError(exc, (key,))
+
+
+def _add_error(errors, exc: Exception, loc):
+    if errors is None:
+        errors = []
+    if isinstance(exc, _ItemError):
+        errors.append(ErrorWrapper(exc.exc, loc=(loc,) + exc.loc))
+    else:
+        errors.append(ErrorWrapper(exc, loc=loc))
+    return errors
+
+
+class _UnionError(PydanticTypeError):
+    code = "union"
+    msg_template = "value does not match any of the types: {types}"
+
+
+def _converter(tp, checked: bool):
+    """
+    Returns the function that converts the values of the given type, or None
+    if they can be used as they are.
+    """
+    if tp is Any or tp is object:
+        return _copy_container
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Union:
+        types = [a for a in args if a is not type(None)]
+        if len(types) < len(args):
+            inner = _converter(
+                types[0] if len(types) == 1 else Union[tuple(types)], checked
+            )
+            if inner is None:
+                return None
+            return lambda value: None if value is None else inner(value)
+        return _union_converter(args)
+
+    if origin is Literal:
+        return _literal_converter(args) if checked else None
+
+    if origin is list or tp is list:
+        return _list_converter(_converter(args[0], checked) if args else None, checked)
+
+    if origin is dict or tp is dict:
+        key_type = args[0] if args else str
+        value_convert = _converter(args[1], checked) if args else None
+        if key_type in (str, Any):
+            return _dict_converter(value_convert, checked)
+
+    if isinstance(tp, StructMeta):
+        return _struct_converter(tp, checked)
+
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return _enum_converter(tp)
+
+    if tp in _TYPE_CHECKERS:
+        if checked:
+            return _TYPE_CHECKERS[tp]
+        return _to_float if tp is float else None
+
+    return _pydantic_converter(tp)
+
+
+def _copy_container(value):
+    # Containers are copied, so they are not shared with the data (e.g., the
+    # decoded body of a response)
+    if value.__class__ is list:
+        return list(value)
+    if value.__class__ is dict:
+        return dict(value)
+    return value
+
+
+def _check_str(value):
+    if isinstance(value, str):
+        return value
+    raise StrError()
+
+
+def _check_int(value):
+    if value.__class__ is int or (
+        isinstance(value, int) and not isinstance(value, bool)
+    ):
+        return value
+    raise IntegerError()
+
+
+def _check_float(value):
+    if value.__class__ is float:
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise FloatError()
+
+
+def _check_bool(value):
+    if isinstance(value, bool):
+        return value
+    raise BoolError()
+
+
+def _check_bytes(value):
+    if isinstance(value, bytes):
+        return value
+    raise BytesError()
+
+
+def _to_float(value):
+    return float(value) if value.__class__ is int else value
+
+
+_TYPE_CHECKERS = {
+    str: _check_str,
+    int: _check_int,
+    float: _check_float,
+    bool: _check_bool,
+    bytes: _check_bytes,
+}
+
+
+def _union_converter(types: tuple):
+    # Types are tried in order, and their values are always checked to find
+    # the type of the value
+    converters = [_converter(t, True) or (lambda v: v) for t in types]
+    names = ", ".join(getattr(t, "__name__", str(t)) for t in types)
+
+    def convert_union(value):
+        for convert in converters:
+            try:
+                return convert(value)
+            except _ERRORS:
+                pass
+        raise _UnionError(types=names)
+
+    return convert_union
+
+
+def _literal_converter(values: tuple):
+    def convert_literal(value):
+        if value in values:
+            return value
+        raise WrongConstantError(given=value, permitted=values)
+
+    return convert_literal
+
+
+def _list_converter(convert_item, checked: bool):
+    def convert_list(value):
+        if checked and not isinstance(value, (list, tuple)):
+            raise ListError()
+        if convert_item is None:
+            return list(value)
+
+        items = []
+        for i, item in enumerate(value):
+            try:
+                items.append(convert_item(item))
+            except _ERRORS as e:
+                raise _item_error(e, i)
+        return items
+
+    return convert_list
+
+
+def _dict_converter(convert_value, checked: bool):
+    def convert_dict(value):
+        if checked:
+            if not isinstance(value, dict):
+                raise DictError()
+            for key in value:
+                if not isinstance(key, str):
+                    raise _item_error(StrError(), key)
+        if convert_value is None:
+            return dict(value)
+
+        items = {}
+        for key, item in value.items():
+            try:
+                items[key] = convert_value(item)
+            except _ERRORS as e:
+                raise _item_error(e, key)
+        return items
+
+    return convert_dict
+
+
+def _struct_converter(struct_class: StructMeta, checked: bool):
+    # The decoder is only compiled when it is first used, which allows
+    # recursive models
+    def convert_struct(value):
+        if isinstance(value, struct_class):
+            return value
+        return _decoder(struct_class, checked)[0](value)
+
+    return convert_struct
+
+
+def _enum_converter(enum_class):
+    def convert_enum(value):
+        try:
+            return enum_class(value)
+        except ValueError:
+            raise EnumMemberError(enum_values=list(enum_class))
+
+    return convert_enum
+
+
+class _PydanticConfig(BaseConfig):
+    arbitrary_types_allowed = True
+
+
+def _pydantic_converter(tp):
+    """
+    Returns the function that validates the values of the given type with
+    pydantic (e.g., dates or file payloads).
+    """
+    model_field = ModelField.infer(
+        name="value",
+        value=Undefined,
+        annotation=tp,
+        class_validators=None,
+        config=_PydanticConfig,
+    )
+
+    def convert_value(value):
+        value, error = model_field.validate(value, {}, loc="value")
+        if error:
+            while isinstance(error, list):
+                error = error[0]
+            raise error.exc
+        return value
+
+    return convert_value
+
+
+def _constrained(convert, constraints: dict):
+    """
+    Returns the given converter extended to check the given constraints of
+    a field.
+    """
+    checks = [
+        _CONSTRAINT_CHECKS[name](limit)
+        for name, limit in constraints.items()
+        if name in _CONSTRAINT_CHECKS
+    ]
+
+    def convert_constrained(value):
+        if convert is not None:
+            value = convert(value)
+        if value is not None:
+            for check in checks:
+                check(value)
+        return value
+
+    return convert_constrained
+
+
+def _limit_check(types: tuple, size, is_valid, error):
+    """
+    Returns a function that checks a limit of the values of the given types.
+    The limit is compared with the value itself, or with its length if
+    `size` is given.
+    """
+
+    def make_check(limit):
+        def check(value):
+            if isinstance(value, types) and not isinstance(value, bool):
+                if not is_valid(size(value) if size else value, limit):
+                    raise error(limit_value=limit)
+
+        return check
+
+    return make_check
+
+
+def _unique_items_check(unique: bool):
+    def check(value):
+        if unique and isinstance(value, list):
+            seen = []
+            for item in value:
+                if item in seen:
+                    raise ListUniqueItemsError()
+                seen.append(item)
+
+    return check
+
+
+def _regex_check(pattern: str):
+    regex = re.compile(pattern)
+
+    def check(value):
+        if isinstance(value, str) and not regex.match(value):
+            raise StrRegexError(pattern=pattern)
+
+    return check
+
+
+def _multiple_of_check(multiple_of):
+    def check(value):
+        if isinstance(value, (int, float)) and value % multiple_of != 0:
+            raise NumberNotMultipleError(multiple_of=multiple_of)
+
+    return check
+
+
+_CONSTRAINT_CHECKS = {
+    "max_length": _limit_check(str, len, operator.le, AnyStrMaxLengthError),
+    "min_length": _limit_check(str, len, operator.ge, AnyStrMinLengthError),
+    "max_items": _limit_check(list, len, operator.le, ListMaxLengthError),
+    "min_items": _limit_check(list, len, operator.ge, ListMinLengthError),
+    "gt": _limit_check((int, float), None, operator.gt, NumberNotGtError),
+    "ge": _limit_check((int, float), None, operator.ge, NumberNotGeError),
+    "lt": _limit_check((int, float), None, operator.lt, NumberNotLtError),
+    "le": _limit_check((int, float), None, operator.le, NumberNotLeError),
+    "multiple_of": _multiple_of_check,
+    "unique_items": _unique_items_check,
+    "regex": _regex_check,
+}
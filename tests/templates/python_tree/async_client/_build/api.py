@@ -0,0 +1,188 @@
+import asyncio
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import DEFAULT_POOLSIZE
+
+from .internal.async_session import AsyncSession
+from .internal.content_type import encode_json
+from .internal.lazy import lazy_methods
+from .internal.session import ConnectionPoolStats
+from .models.struct import APIStruct
+from .security import (
+    OAuth2ClientCredentials,
+    SecurityStrategyWithTokenExchange,
+)
+
+if TYPE_CHECKING:
+    from .apis.books import _BooksMethods
+    from .apis.pagination import _PaginationMethods
+else:
+    _BooksMethods = lazy_methods(__package__, ".apis.books", "_BooksMethods", "books")
+    _PaginationMethods = lazy_methods(
+        __package__, ".apis.pagination", "_PaginationMethods", "pagination"
+    )
+
+
+class API(_BooksMethods, _PaginationMethods):
+    """
+    The top-level class used as an abstraction of the Pagination API.
+    """
+
+    def __init__(
+        self,
+        host: str = "https://pagination.test",
+        security_strategy: OAuth2ClientCredentials = None,
+        verify: bool = True,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        validate_responses: bool = True,
+    ):
+        """
+        Creates a new API instance.
+
+        :param host: (optional) Host name of the Pagination API.
+        :param security_strategy: (optional) The security strategy for the API client.
+        :param verify: (optional) Whether to verify the server's TLS certificate.
+        :param pool_connections: (optional) Not used, since the HTTP session
+            keeps a single connection pool for all the hosts.
+        :param pool_maxsize: (optional) The maximum number of idle connections
+            kept alive by the HTTP session. It should be at least the number
+            of concurrent requests.
+        :param validate_responses: (optional) Whether the responses are
+            validated when they are parsed into models. If False, models are
+            built from the trusted response data without validating the values
+            that already have the expected type, which is faster for large
+            responses.
+        """
+        if not host.startswith("http://") and not host.startswith("https://"):
+            host = "https://" + host
+
+        self.host = host.rstrip("/")
+        self._verify = verify
+        self.headers = {}
+        self._raise_errors = True
+        self._validate_responses = validate_responses
+        self._session = AsyncSession(pool_connections, pool_maxsize)
+
+        self._security_strategy = security_strategy
+        if self._security_strategy:
+            self.with_security(self._security_strategy)
+
+    def with_security(self, security_strategy: OAuth2ClientCredentials):
+        """
+        Sets the security strategy for the API client. If the provided security
+        strategy requires token exchange and retrieval, the method will retrieve
+        the access token automatically.
+
+        :param security_strategy: The security strategy to be set for the API client.
+        :type security_strategy: OAuth2ClientCredentials
+        :return: The modified API client with the specified security strategy.
+        """
+        self._security_strategy = security_strategy
+
+        if isinstance(self._security_strategy, SecurityStrategyWithTokenExchange):
+            self._security_strategy.set_token_url_host(self.host)
+            self._security_strategy.set_verify_tls_certificate(self._verify)
+            # The token is retrieved by the first request, in a worker thread
+            # so that the event loop is not blocked
+
+        return self
+
+    async def make_request(
+        self,
+        method: str,
+        url: str,
+        data=None,
+        files: dict = None,
+        json=None,
+        params=None,
+        headers: dict = None,
+        timeout: float = 3,
+        auth: bool = True,
+        verify=None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Makes a request to the API server.
+
+        :param method: HTTP request method used (`GET`, `OPTIONS`, `HEAD`,
+            `POST`, `PUT`, `PATCH`, or `DELETE`).
+        :param url: Request URL. It can be a relative path or a full URL (the
+            host used must be the same as the host in this :class:`API` instance).
+        :param body: (optional) Dictionary, list of tuples, bytes, or file-like
+            object to send in the body of the request.
+        :param files: (optional) Dictionary of files to send in the request.
+        :param params: (optional) Dictionary, list of tuples or bytes to send
+            in the query string for the :class:`Request`.
+        :param headers: (optional) Dictionary of HTTP headers to send.
+        :param timeout: (optional) How many seconds to wait for the server to
+            send data before giving up, as a float, or a `(connect timeout,
+            read timeout)` tuple.
+        :param auth: (optional) If True (default), the authentication token will
+            be sent in the request if a security strategy is set.
+        :param verify: (optional) If set as a boolean, it will override the API
+            verify value.
+        :param kwargs: (optional) Other arguments of the request, as in
+            `requests`: `allow_redirects`, `stream`, `proxies` and `cert`.
+        :return: An instance of :class:`request.Response`.
+        """
+        if headers is None:
+            headers = {}
+
+        headers.update(self.headers)
+
+        # Models and JSON payloads are sent encoded with the JSON codec
+        payload = data if isinstance(data, (BaseModel, APIStruct)) else None
+        if payload is None and json is not None and not data:
+            payload = json
+        if payload is not None:
+            data, json = encode_json(payload), None
+            if "content-type" not in {k.lower() for k in headers}:
+                headers["Content-Type"] = "application/json"
+
+        if url.lower().startswith("http://") or url.lower().startswith("https://"):
+            url = url
+        else:
+            url = urljoin(self.host, url)
+
+        req = requests.Request(
+            method, url, params=params, headers=headers, data=data, json=json
+        )
+
+        if auth and self._security_strategy:
+            # Applying a strategy may exchange a token using blocking requests
+            await asyncio.to_thread(self._security_strategy.apply, req)
+
+        if verify is None:
+            verify = self._verify
+
+        req.files = files
+        return await self._session.send(
+            req.prepare(), timeout=timeout, verify=verify, **kwargs
+        )
+
+    def connection_stats(self) -> ConnectionPoolStats:
+        """
+        Returns the usage counters of the connection pools of this API
+        instance, which can be used to check how often the pooled connections
+        are reused.
+        """
+        return self._session.stats
+
+    async def close(self):
+        """
+        Closes the HTTP session of this API instance and all its pooled
+        connections.
+        """
+        await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._security_strategy:
+            await asyncio.to_thread(self._security_strategy.clean)
+        await self.close()
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import AsyncAPIResource
+from ..models import models
+
+_DOWNLOAD1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/pdf", models.BooksBookIdDownloadResponse200),
+    ]
+)
+
+
+@dataclass
+class Download1(AsyncAPIResource):
+
+    async def get(self, **kwargs) -> models.BooksBookIdDownloadResponse200:
+        """
+        None
+
+        :return: The API response to the request.
+        :rtype: models.BooksBookIdDownloadResponse200
+        """
+        kwargs.setdefault("stream", True)
+
+        resp = await self._make_request("GET", **kwargs)
+        return await self._handle_response(resp, _DOWNLOAD1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/download"
+
+
+class _DownloadMethods:
+    """
+    This class declares and implements the `download()` method.
+    """
+
+    @overload
+    def download(self) -> Download1: ...
+
+    def download(self):
+        return Download1()._child_of(self)
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import AsyncAPIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_OFFSET_TOTAL1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PageOffsetTotal),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_OFFSET_TOTAL1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.offset",
+                "value": "$eval({$request.query.offset ?? 0} + len({#results}))",
+            }
+        ],
+        "result": "#results",
+        "has_more": "$eval(len({$response.body#/results}) >= {$request.query.limit})",
+        "total_pages": "$eval(ceil({$response.body#/total} / {$request.query.limit}))",
+    }
+)
+
+_OFFSET_TOTAL1_GET_PARAM_TYPES = {
+    "query": {
+        "offset": int,
+        "limit": int,
+    },
+}
+
+
+@dataclass
+class OffsetTotal1(AsyncAPIResource):
+
+    async def get(
+        self, **kwargs
+    ) -> Union[models.PageOffsetTotal, models.ErrorResponse]:
+        """
+        Returns an offset-paginated list of responses including the total
+        number of results.
+
+        Query parameters:
+         - `offset` _(int)_:
+         - `limit` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PageOffsetTotal, models.ErrorResponse]
+        """
+        resp = await self._make_request("GET", **kwargs)
+        return await self._handle_response(
+            resp,
+            _OFFSET_TOTAL1_GET_RESPONSES,
+            pagination_info=_OFFSET_TOTAL1_GET_PAGINATION_INFO,
+            param_types=_OFFSET_TOTAL1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/offset_total"
+
+
+class _OffsetTotalMethods:
+    """
+    This class declares and implements the `offset_total()` method.
+    """
+
+    @overload
+    def offset_total(self) -> OffsetTotal1: ...
+
+    def offset_total(self):
+        return OffsetTotal1()._child_of(self)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, overload
+
+from ..internal.lazy import lazy_methods
+from ..internal.resource import AsyncAPIResource
+
+if TYPE_CHECKING:
+    from .cursor import _CursorMethods
+    from .cursor_total import _CursorTotalMethods
+    from .next_page_url import _NextPageUrlMethods
+    from .offset import _OffsetMethods
+    from .offset_total import _OffsetTotalMethods
+    from .page import _PageMethods
+else:
+    _CursorMethods = lazy_methods(__package__, ".cursor", "_CursorMethods", "cursor")
+    _CursorTotalMethods = lazy_methods(
+        __package__, ".cursor_total", "_CursorTotalMethods", "cursor_total"
+    )
+    _NextPageUrlMethods = lazy_methods(
+        __package__, ".next_page_url", "_NextPageUrlMethods", "next_page_url"
+    )
+    _OffsetMethods = lazy_methods(__package__, ".offset", "_OffsetMethods", "offset")
+    _OffsetTotalMethods = lazy_methods(
+        __package__, ".offset_total", "_OffsetTotalMethods", "offset_total"
+    )
+    _PageMethods = lazy_methods(__package__, ".page", "_PageMethods", "page")
+
+
+@dataclass
+class Pagination1(
+    AsyncAPIResource,
+    _CursorMethods,
+    _CursorTotalMethods,
+    _NextPageUrlMethods,
+    _OffsetMethods,
+    _OffsetTotalMethods,
+    _PageMethods,
+):
+
+    def _build_partial_path(self):
+        return "/pagination"
+
+
+class _PaginationMethods:
+    """
+    This class declares and implements the `pagination()` method.
+    """
+
+    @overload
+    def pagination(self) -> Pagination1: ...
+
+    def pagination(self):
+        return Pagination1()._child_of(self)
@@ -0,0 +1,302 @@
+"""
+This module provides the HTTP session used by the asynchronous API client.
+
+Requests are prepared with `requests`, so that payload encoding, security
+strategies and runtime expressions work exactly as in the synchronous client,
+and they are sent with an `httpx.AsyncClient`. Responses are converted back to
+`requests.Response` instances so that they can be handled by the same models
+and runtime expressions code.
+"""
+
+import io
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .content_type import content_types_match
+from .session import ConnectionPoolStats
+
+# Content types of the response bodies that are always read, even if the
+# response is streamed, since they are parsed into models
+_PARSED_CONTENT_TYPES = ("application/json", "application/xml", "text/plain")
+
+
+class AsyncSession:
+    """
+    An asynchronous HTTP session that keeps its connections alive so that they
+    can be reused by subsequent requests.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+    ):
+        """
+        httpx keeps a single connection pool for all the hosts, without
+        limiting the number of connections opened (as `requests` does by
+        default), so `pool_maxsize` is the maximum number of idle connections
+        kept alive, and `pool_connections` is not used.
+
+        :param pool_connections: The number of hosts expected to be requested.
+        :param pool_maxsize:     The maximum number of connections kept alive.
+        """
+        self._limits = httpx.Limits(
+            max_connections=None, max_keepalive_connections=pool_maxsize
+        )
+        # httpx sets the TLS verification, client certificate and proxy per
+        # client, so a client is created for each combination of them used
+        self._clients = {}
+        self.stats = ConnectionPoolStats()
+
+    def _client(
+        self,
+        verify: Union[bool, str],
+        cert: Union[str, tuple, None],
+        proxy: Optional[str],
+    ) -> httpx.AsyncClient:
+        key = (verify, cert, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                verify=verify, cert=cert, proxy=proxy, limits=self._limits
+            )
+            self._clients[key] = client
+        return client
+
+    async def send(
+        self,
+        request: requests.PreparedRequest,
+        timeout=None,
+        verify: Union[bool, str] = True,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        proxies: dict = None,
+        cert: Union[str, tuple] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends the given request and returns its response.
+
+        :param request:         The request to send.
+        :param timeout:         How many seconds to wait for the server, as a
+                                float or a `(connect timeout, read timeout)`
+                                tuple.
+        :param verify:          Whether to verify the server's TLS certificate.
+        :param allow_redirects: Whether to follow redirections.
+        :param stream:          Whether the response body is read as a stream
+                                (see `AsyncStreamResponse`). The bodies of
+                                error responses and of the content types parsed
+                                into models are always read.
+        :param proxies:         Dictionary mapping the URL schemes (or "all")
+                                to the URLs of the proxies, as in `requests`.
+        :param cert:            The client certificate, as a path or a
+                                `(cert, key)` tuple.
+        :raises TypeError:      Other keyword arguments of `requests` are given.
+        :return:                The response as a `requests.Response` instance.
+        """
+        if kwargs:
+            raise TypeError(
+                "unsupported request arguments for the asynchronous client: "
+                + ", ".join(sorted(kwargs))
+            )
+
+        async def trace(event_name, info):
+            if event_name == "connection.connect_tcp.complete":
+                self.stats.connections += 1
+
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        client = self._client(verify, cert, _select_proxy(request.url, proxies))
+        httpx_request = client.build_request(
+            request.method,
+            request.url,
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=_to_httpx_timeout(timeout),
+            extensions={"trace": trace},
+        )
+
+        self.stats.requests += 1
+        httpx_response = await client.send(
+            httpx_request, follow_redirects=allow_redirects, stream=stream
+        )
+
+        if stream and not _is_parsed(httpx_response):
+            return AsyncStreamResponse(httpx_response, request)
+
+        try:
+            await httpx_response.aread()
+        finally:
+            await httpx_response.aclose()
+        return _to_requests_response(httpx_response, request)
+
+    async def close(self):
+        """
+        Closes all the connections of this session.
+        """
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients = {}
+
+
+class AsyncResponseStream(io.IOBase):
+    """
+    The body of a streamed response of the asynchronous client, which is read
+    asynchronously with `await stream.read()` or `async for chunk in stream`.
+    The connection is released when the body has been read or the stream is
+    closed with `await stream.aclose()`.
+    """
+
+    def __init__(
+        self, httpx_response: httpx.Response, response: requests.Response = None
+    ):
+        self._response = httpx_response
+        self._requests_response = response
+        self._chunks = None
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        Reads up to `size` bytes of the body, or the rest of the body if
+        `size` is negative. An empty bytes object is returned at the end of
+        the body.
+        """
+        if self._chunks is None:
+            self._chunks = self._response.aiter_bytes()
+
+        while not self.closed and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                # httpx closes the response once its body has been read
+                self._copy_elapsed()
+                break
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = await self.read(io.DEFAULT_BUFFER_SIZE)
+        if not chunk:
+            raise StopAsyncIteration
+        return chunk
+
+    def __iter__(self):
+        raise TypeError(
+            "the body of a streamed asynchronous response must be read with "
+            "'async for' or 'await read()'"
+        )
+
+    async def aclose(self):
+        """
+        Closes the stream and releases its connection.
+        """
+        await self._response.aclose()
+        self._copy_elapsed()
+        self.close()
+
+    def _copy_elapsed(self):
+        # The elapsed time of an httpx response is only known once it is closed
+        if self._requests_response is not None and self._response.is_closed:
+            self._requests_response.elapsed = self._response.elapsed
+
+
+class AsyncStreamResponse(requests.Response):
+    """
+    A `requests.Response` whose body has not been read yet. Its `raw`
+    attribute is an `AsyncResponseStream`, so the body must be read
+    asynchronously instead of using `content` or `iter_content()`. Its
+    `elapsed` time is set once the stream is closed.
+    """
+
+    def __init__(
+        self, httpx_response: httpx.Response, request: requests.PreparedRequest
+    ):
+        super().__init__()
+        _copy_response_attributes(httpx_response, request, self)
+        self.raw = AsyncResponseStream(httpx_response, self)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        raise RuntimeError(
+            "the body of a streamed asynchronous response must be read from "
+            "its 'raw' stream with 'async for' or 'await read()'"
+        )
+
+
+def _select_proxy(url: str, proxies: Optional[dict]) -> Optional[str]:
+    """
+    Returns the URL of the proxy used for the given URL according to a
+    `requests` proxies dictionary, or None.
+    """
+    if not proxies:
+        return None
+    scheme = urlparse(url).scheme
+    return proxies.get(scheme) or proxies.get("all")
+
+
+def _is_parsed(httpx_response: httpx.Response) -> bool:
+    """
+    Returns whether the body of the given response is parsed into a model, so
+    it must be read even if the response is streamed.
+    """
+    content_type = httpx_response.headers.get("content-type", "")
+    return httpx_response.is_error or any(
+        content_types_match(content_type, t) for t in _PARSED_CONTENT_TYPES
+    )
+
+
+def _to_httpx_timeout(timeout) -> httpx.Timeout:
+    """
+    Converts a timeout value as used by `requests` to an httpx.Timeout.
+    """
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+    return httpx.Timeout(timeout)
+
+
+def _to_requests_response(
+    httpx_response: httpx.Response, request: requests.PreparedRequest
+) -> requests.Response:
+    """
+    Converts an httpx.Response to a requests.Response.
+    """
+    response = requests.Response()
+    _copy_response_attributes(httpx_response, request, response)
+    response.elapsed = httpx_response.elapsed
+    response._content = httpx_response.content
+    response._content_consumed = True
+    return response
+
+
+def _copy_response_attributes(
+    httpx_response: httpx.Response,
+    request: requests.PreparedRequest,
+    response: requests.Response,
+):
+    """
+    Copies the status, headers, cookies and metadata of an httpx.Response to
+    a requests.Response.
+    """
+    response.status_code = httpx_response.status_code
+    response.headers = CaseInsensitiveDict(httpx_response.headers)
+    response.url = str(httpx_response.url)
+    response.reason = httpx_response.reason_phrase
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.cookies.update(httpx_response.cookies.jar)
+    response.request = request
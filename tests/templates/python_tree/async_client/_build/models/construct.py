@@ -0,0 +1,206 @@
+"""
+This module builds model instances from trusted data (e.g., the decoded body
+of a response), skipping most of the validation done by pydantic.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel, Extra, ValidationError
+from pydantic.fields import (
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SINGLETON,
+    ModelField,
+)
+from pydantic.types import ConstrainedFloat, ConstrainedInt, ConstrainedStr
+
+from .struct import StructMeta, _copy_container
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_ROOT_KEY = "__root__"
+
+_CONSTRAINED_TYPES = {
+    str: ConstrainedStr,
+    int: ConstrainedInt,
+    float: ConstrainedFloat,
+}
+
+
+def construct_model(model_class: Type[Model], data: Any) -> Model:
+    """
+    Builds an instance of the given model from trusted data without
+    validating it, recursively building the nested models.
+
+    Values whose type already matches the type of their field are used as
+    they are (lists and dictionaries are shallow-copied, so they are not
+    shared with the data), so the constraints of the field (e.g., a maximum length) are not
+    checked. Fields of any other type (e.g., dates, enums or unions) are
+    validated as usual, so they have the same values as if the whole model
+    were validated.
+
+    Struct models are built by their decoder for trusted data.
+
+    :param model_class: The class of the model.
+    :param data:        The data of the model (e.g., a decoded JSON object).
+    :return:            The model instance.
+    """
+    if isinstance(model_class, StructMeta):
+        return model_class._construct(data)
+    return _model_builder(model_class)(data)
+
+
+@lru_cache(maxsize=None)
+def _model_builder(model_class: Type[Model]) -> Callable[[Any], Model]:
+    """
+    Returns the function that builds instances of the given model from
+    trusted data. The way each field is built is only resolved once.
+    """
+    if model_class.__custom_root_type__:
+        build_root = _value_builder(model_class, model_class.__fields__[_ROOT_KEY])
+
+        def build_root_model(data):
+            return model_class.construct(**{_ROOT_KEY: build_root(data)})
+
+        return build_root_model
+
+    config = model_class.__config__
+    fields = [
+        (name, f.alias, f, _value_builder(model_class, f))
+        for name, f in model_class.__fields__.items()
+    ]
+    by_name = config.allow_population_by_field_name
+    allow_extra = config.extra == Extra.allow
+    aliases = {f.alias for f in model_class.__fields__.values()}
+
+    def build_model(data):
+        if not isinstance(data, dict):
+            return model_class.parse_obj(data)
+
+        values = {}
+        fields_set = set()
+        for name, alias, model_field, build_value in fields:
+            if alias in data:
+                values[name] = build_value(data[alias])
+            elif by_name and name in data:
+                values[name] = build_value(data[name])
+            elif model_field.required:
+                # Let pydantic report the missing field
+                return model_class.parse_obj(data)
+            else:
+                values[name] = model_field.get_default()
+                continue
+            fields_set.add(name)
+
+        if allow_extra:
+            for key, value in data.items():
+                if key not in aliases and key not in values:
+                    values[key] = _copy_container(value)
+                    fields_set.add(key)
+
+        model = model_class.__new__(model_class)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", fields_set)
+        model._init_private_attributes()
+        return model
+
+    return build_model
+
+
+def _value_builder(
+    model_class: Type[BaseModel], model_field: ModelField
+) -> Callable[[Any], Any]:
+    """
+    Returns the function that builds the values of the given field from
+    trusted values.
+    """
+
+    def validate(value):
+        value, errors = model_field.validate(
+            value, {}, loc=model_field.alias, cls=model_class
+        )
+        if errors:
+            raise ValidationError([errors], model_class)
+        return value
+
+    build = validate
+    field_type = model_field.type_
+
+    if model_field.shape == SHAPE_SINGLETON and not model_field.sub_fields:
+        if field_type is Any:
+            return _copy_container
+
+        if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+            is_root_model = bool(field_type.__custom_root_type__)
+
+            def build_model(value):
+                if is_root_model or isinstance(value, dict):
+                    return _model_builder(field_type)(value)
+                return validate(value)
+
+            build = build_model
+
+        elif isinstance(field_type, type) and _json_type(field_type) is not None:
+            json_type = _json_type(field_type)
+
+            def build_json_value(value):
+                if type(value) is json_type:
+                    return _copy_container(value)
+                if json_type is float and type(value) is int:
+                    return float(value)
+                return validate(value)
+
+            build = build_json_value
+
+    elif model_field.shape == SHAPE_LIST:
+        build_item = _value_builder(model_class, model_field.sub_fields[0])
+
+        def build_list(value):
+            if isinstance(value, list):
+                return [build_item(v) for v in value]
+            return validate(value)
+
+        build = build_list
+
+    elif model_field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+        if model_field.key_field.type_ is str:
+            build_item = _value_builder(model_class, model_field.sub_fields[0])
+
+            def build_dict(value):
+                if isinstance(value, dict):
+                    return {k: build_item(v) for k, v in value.items()}
+                return validate(value)
+
+            build = build_dict
+
+    if model_field.allow_none:
+        build_not_none = build
+
+        def build_optional(value):
+            return None if value is None else build_not_none(value)
+
+        build = build_optional
+
+    return build
+
+
+def _json_type(field_type: type) -> Optional[type]:
+    """
+    Returns the type decoded from JSON (str, int, float, bool, list or dict)
+    whose values can be used as they are for a field of the given type, or
+    None if values must be validated.
+    """
+    if issubclass(field_type, Enum):
+        return None
+
+    if field_type in (str, int, float, bool, list, dict):
+        return field_type
+
+    for json_type, constrained_type in _CONSTRAINED_TYPES.items():
+        if issubclass(field_type, constrained_type):
+            return json_type
+
+    return None
@@ -0,0 +1,85 @@
+# generated by datamodel-codegen:
+#   filename:  schemas.yaml
+#   timestamp: 2026-10-18T05:12:14+00:00
+
+from __future__ import annotations
+
+from io import IOBase
+from typing import IO, Any, List, Optional, Union
+
+from pydantic import Field
+
+from .basemodel import APIBaseModel
+from .primitives import FilePayload
+
+
+class BookUploadRequest(APIBaseModel):
+    author: Optional[str] = Field(None, description="Author of the book")
+    file: Union[bytes, IO, IOBase, FilePayload] = Field(
+        ..., description="The book file to upload"
+    )
+    publication_year: Optional[int] = Field(
+        None, description="Year the book was published"
+    )
+    title: str = Field(..., description="Title of the book")
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BooksBookIdDownloadResponse200(APIBaseModel):
+    __root__: Union[bytes, IO, IOBase, FilePayload]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BooksResponse201(APIBaseModel):
+    message: Optional[str] = None
+
+
+class ErrorResponse(APIBaseModel):
+    message: str = Field(..., example="Oh, no!")
+    status: int = Field(..., example=400)
+
+
+class Cursors(APIBaseModel):
+    next: Optional[str] = None
+    previous: Optional[str] = None
+
+
+class PageCursor(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    data: Optional[List] = None
+
+
+class Cursors1(APIBaseModel):
+    next: Optional[str] = None
+
+
+class PageCursorTotal(APIBaseModel):
+    cursors: Optional[Cursors1] = None
+    data: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PageNextUrl(APIBaseModel):
+    next_page_url: Optional[str] = None
+    results: Optional[List] = None
+
+
+class PageOffset(APIBaseModel):
+    results: Optional[List] = None
+
+
+class PageOffsetTotal(APIBaseModel):
+    results: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PagePage(APIBaseModel):
+    results: Optional[List] = None
+
+
+class Result(APIBaseModel):
+    value: Optional[Any] = Field(None, description="Value.")
@@ -0,0 +1,270 @@
+import asyncio
+import inspect
+import json
+import threading
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from tests.templates.setup import build_client
+
+build_client(
+    "python-tree",
+    [
+        "pagination_api.yaml",
+        "files_api.yaml",
+        "async_client.yaml",
+    ],
+)
+if True:
+    from ._build.api import API
+    from ._build.internal.async_session import AsyncResponseStream, AsyncSession
+    from ._build.models.models import PageOffset, Result
+    from ._build.models.primitives import FilePayload
+    from ._build.security import OAuth2ClientCredentials
+
+expected_results = [{"value": i} for i in range(10)]
+
+
+def offset_handler(request: Request) -> Response:
+    offset = int(request.args.get("offset", 0))
+    limit = int(request.args["limit"])
+    resp = {"results": expected_results[offset : offset + limit]}
+    return Response(json.dumps(resp), content_type="application/json")
+
+
+def test_async_methods():
+    """
+    Tests that the operation methods of an asynchronous client are coroutines.
+    """
+    api = API()
+    assert inspect.iscoroutinefunction(api.make_request)
+    assert inspect.iscoroutinefunction(api.pagination().offset().get)
+
+
+def test_async_request(httpserver: HTTPServer):
+    """
+    Tests a successful request using an asynchronous client.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            return await api.pagination().offset().get(params={"limit": 3})
+
+    resp = asyncio.run(run())
+
+    assert isinstance(resp, PageOffset)
+    assert resp.results == [Result.parse_obj(r) for r in expected_results[:3]]
+    assert resp.http_response().status_code == 200
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("limit", [1, 3, 10])
+def test_async_pagination(
+    httpserver: HTTPServer, limit: int, prefetch: int, stream: bool
+):
+    """
+    Tests that the results of an asynchronous client are paginated using
+    `async for`.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            resp = await api.pagination().offset().get(params={"limit": limit})
+            results = [result async for result in resp.paginate(prefetch, stream)]
+            return results, api.connection_stats()
+
+    results, stats = asyncio.run(run())
+
+    assert results == [Result.parse_obj(r) for r in expected_results]
+    assert stats.requests == len(expected_results) // limit + 1
+
+
+def test_async_pagination_sync_iteration(httpserver: HTTPServer):
+    """
+    Tests that a TypeError is raised when the response of an asynchronous
+    client is paginated synchronously.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            return await api.pagination().offset().get(params={"limit": 3})
+
+    resp = asyncio.run(run())
+
+    with pytest.raises(TypeError):
+        list(resp)
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+@pytest.mark.parametrize("limit", [1, 3])
+def test_async_pagination_parallel(httpserver: HTTPServer, limit: int, prefetch: int):
+    """
+    Tests that the pages of a response of an asynchronous client whose total
+    number of pages is known are requested concurrently and their results
+    are returned in order.
+    """
+
+    def handler(request: Request) -> Response:
+        offset = int(request.args.get("offset", 0))
+        resp = {
+            "results": expected_results[offset : offset + limit],
+            "total": len(expected_results),
+        }
+        return Response(json.dumps(resp), content_type="application/json")
+
+    httpserver.expect_request("/pagination/offset_total").respond_with_handler(handler)
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            resp = await api.pagination().offset_total().get(params={"limit": limit})
+            return [result async for result in resp.paginate(prefetch)]
+
+    results = asyncio.run(run())
+
+    assert results == [Result.parse_obj(r) for r in expected_results]
+    assert len(httpserver.log) == len(expected_results) // limit + 1
+
+
+@pytest.mark.parametrize("stream", [None, False, True])
+def test_async_download(httpserver: HTTPServer, stream):
+    """
+    Tests that the body of a streamed response of an asynchronous client is
+    read asynchronously, and that it is read before returning otherwise.
+    """
+    file_content = b"PDF content\n" * 10000
+    httpserver.expect_request("/books/123/download").respond_with_data(
+        file_content, content_type="application/pdf"
+    )
+    get_kwargs = {"stream": stream} if stream is not None else {}
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            resp = await api.books("123").download().get(**get_kwargs)
+            content = resp.__root__.content
+            if isinstance(content, bytes):
+                return resp, content
+            return resp, b"".join([chunk async for chunk in content])
+
+    resp, content = asyncio.run(run())
+
+    assert isinstance(resp.__root__, FilePayload)
+    assert content == file_content
+    # The operation streams its response by default (x-apier.response-stream)
+    if stream is False:
+        assert isinstance(resp.__root__.content, bytes)
+    else:
+        assert isinstance(resp.__root__.content, AsyncResponseStream)
+        with pytest.raises(RuntimeError):
+            resp.http_response().content
+
+
+def test_async_stream_read(httpserver: HTTPServer):
+    """
+    Tests reading the body of a streamed response by size.
+    """
+    httpserver.expect_request("/books/123/download").respond_with_data(
+        b"0123456789", content_type="application/pdf"
+    )
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            resp = await api.books("123").download().get()
+            content = resp.__root__.content
+            return [await content.read(4), await content.read(4), await content.read()]
+
+    assert asyncio.run(run()) == [b"0123", b"4567", b"89"]
+
+
+def test_async_response_attributes(httpserver: HTTPServer):
+    """
+    Tests that the cookies and the elapsed time of the responses are set,
+    including those of streamed responses once their body has been read.
+    """
+    httpserver.expect_request("/books/123/download").respond_with_response(
+        Response(
+            b"0123456789",
+            content_type="application/pdf",
+            headers={"Set-Cookie": "session=abc; Path=/"},
+        )
+    )
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            resp = await api.books("123").download().get(stream=True)
+            http_response = resp.http_response()
+            elapsed_before_read = http_response.elapsed
+            await resp.__root__.content.read()
+            return http_response, elapsed_before_read
+
+    http_response, elapsed_before_read = asyncio.run(run())
+
+    assert http_response.cookies.get("session") == "abc"
+    assert elapsed_before_read.total_seconds() == 0
+    assert http_response.elapsed.total_seconds() > 0
+
+
+def test_async_request_arguments(httpserver: HTTPServer):
+    """
+    Tests that the request arguments of `requests` not supported by the
+    asynchronous client raise a TypeError, and that the client certificate
+    and proxies select the httpx client used.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+
+    async def run():
+        async with API(host=httpserver.url_for("")) as api:
+            with pytest.raises(TypeError, match="hooks"):
+                await api.make_request("GET", "/pagination/offset", hooks={})
+
+            await api.make_request(
+                "GET",
+                "/pagination/offset",
+                params={"limit": 1},
+                proxies={"https": "http://proxy.test"},
+            )
+            return set(api._session._clients)
+
+    assert asyncio.run(run()) == {(True, None, None)}
+
+    session = AsyncSession(pool_maxsize=4)
+    client = session._client(False, None, "http://proxy.test")
+    assert session._client(False, None, "http://proxy.test") is client
+    assert session._client(False, None, None) is not client
+    assert session._limits.max_keepalive_connections == 4
+    assert session._limits.max_connections is None
+
+
+def test_async_token_exchange(httpserver: HTTPServer):
+    """
+    Tests that the token of a security strategy is exchanged outside the
+    event loop thread, when the first request is made.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+    token_threads = []
+
+    class SecurityStrategy(OAuth2ClientCredentials):
+        def get_token(self):
+            token_threads.append(threading.current_thread())
+            self._token = "token"
+            self.expires_at = float("inf")
+
+        def revoke_token(self):
+            token_threads.append(threading.current_thread())
+
+    async def run():
+        strategy = SecurityStrategy("id", "secret", [])
+        async with API(host=httpserver.url_for(""), security_strategy=strategy) as api:
+            assert token_threads == []
+            await api.pagination().offset().get(params={"limit": 3})
+
+    asyncio.run(run())
+
+    assert len(token_threads) == 2
+    assert threading.main_thread() not in token_threads
+    assert httpserver.log[0][0].headers["Authorization"] == "Bearer token"
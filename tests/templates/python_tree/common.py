@@ -5,6 +5,8 @@ from requests.structures import CaseInsensitiveDict
 from pydantic import BaseModel
 from requests import PreparedRequest, Request, Response
 
+from apier.templates.python_tree.base.internal import json_codec
+
 
 def make_response(
     status_code: int,
@@ -31,13 +33,25 @@ def make_response(
     return resp
 
 
+def json_request_args(body, headers: dict) -> dict:
+    """
+    Returns the headers, data and json arguments expected to be used to send
+    the given body as JSON. Bodies are sent already encoded with the JSON
+    codec of the client.
+    """
+    headers = dict(headers)
+    if "content-type" not in {k.lower() for k in headers}:
+        headers["Content-Type"] = "application/json"
+    return dict(headers=headers, data=json_codec.dumps(to_dict(body)), json=None)
+
+
 def to_dict(d) -> dict:
     if isinstance(d, (dict, list)):
         return d
-    elif isinstance(d, BaseModel):
+    elif isinstance(d, BaseModel) or hasattr(d, "__struct_fields__"):
         return json.loads(d.json(by_alias=True))
     else:
-        raise ValueError("value must be a dict or a pydantic model")
+        raise ValueError("value must be a dict or a model")
 
 
 def to_json(d) -> str:
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ECHO_ARRAY1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.GetArrayResponseResponse200),
+    ]
+)
+
+
+@dataclass
+class EchoArray1(APIResource):
+
+    def get(self, **kwargs) -> models.GetArrayResponseResponse200:
+        """
+        Returns an array response
+
+        :return: The API response to the request.
+        :rtype: models.GetArrayResponseResponse200
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _ECHO_ARRAY1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/echo-array"
+
+
+class _EchoArrayMethods:
+    """
+    This class declares and implements the `echo-array()` method.
+    """
+
+    @overload
+    def echo_array(self) -> EchoArray1: ...
+
+    def echo_array(self):
+        return EchoArray1()._child_of(self)
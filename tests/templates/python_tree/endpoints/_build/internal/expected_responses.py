@@ -0,0 +1,93 @@
+"""
+This module defines the ExpectedResponses class, used to find the class of
+the response of an API operation from its status code and Content-Type.
+"""
+
+from typing import Iterable, Optional, Tuple, Type
+
+DEFAULT_STATUS_CODE = 0
+"""Status code used for the default response of an operation."""
+
+ANY_MEDIA_TYPE = "*/*"
+
+
+class ExpectedResponses:
+    """
+    The responses expected from an API operation, indexed by status code and
+    media type so that the class of a response can be found with a lookup.
+    """
+
+    def __init__(self, responses: Iterable[Tuple[int, str, Type]]):
+        """
+        :param responses: The expected responses as a list of tuples with the
+                          status code, the Content-Type and the class of the
+                          response. The default response uses the status code
+                          0, and responses without content use an empty
+                          Content-Type.
+        """
+        self.responses = list(responses)
+
+        # Status code -> media type -> response class
+        self._classes = {}
+        # Status code -> response class for responses without content
+        self._no_content_classes = {}
+
+        for code, content_type, resp_class in self.responses:
+            if not content_type:
+                self._no_content_classes.setdefault(code, resp_class)
+            else:
+                media_types = self._classes.setdefault(code, {})
+                media_types.setdefault(_media_type(content_type), resp_class)
+
+        self._status_codes = set(self._classes) | set(self._no_content_classes)
+
+    def is_expected(self, status_code: int) -> bool:
+        """
+        Returns whether a response with the given status code is expected.
+        """
+        return (
+            status_code in self._status_codes
+            or DEFAULT_STATUS_CODE in self._status_codes
+        )
+
+    def find(self, status_code: int, content_type: str) -> Optional[Tuple[str, Type]]:
+        """
+        Returns the expected response matching the given status code and
+        Content-Type as a tuple with the media type and the class of the
+        response, or None if no response matches.
+
+        Responses defined for the given status code take precedence over the
+        default response. If no response matches the Content-Type, the
+        response without content of that status code, if any, is returned
+        with an empty media type.
+        """
+        media_type = _media_type(content_type)
+
+        for code in (status_code, DEFAULT_STATUS_CODE):
+            media_types = self._classes.get(code)
+            if media_types:
+                if media_type in media_types:
+                    return media_type, media_types[media_type]
+                if ANY_MEDIA_TYPE in media_types:
+                    return ANY_MEDIA_TYPE, media_types[ANY_MEDIA_TYPE]
+                if media_type == ANY_MEDIA_TYPE:
+                    return next(iter(media_types.items()))
+
+            if code in self._no_content_classes:
+                return "", self._no_content_classes[code]
+
+        return None
+
+    def __iter__(self):
+        return iter(self.responses)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.responses!r})"
+
+
+def _media_type(content_type: str) -> str:
+    """
+    Returns the normalized media type of the given Content-Type (i.e.,
+    lowercase and without parameters).
+    """
+    return content_type.split(";", 1)[0].strip().lower()
@@ -0,0 +1,460 @@
+import re
+from functools import lru_cache, partial, reduce
+from typing import Callable, Union
+from urllib.parse import parse_qs, urlparse
+
+from requests import PreparedRequest, Request, Response
+
+from .. import json_codec
+from ..response_body import json_body
+from .evaluation import compile_expr, eval_expr
+
+
+class RuntimeExpressionError(Exception):
+    """Invalid runtime expression."""
+
+    def __init__(self, *attrs, caused_by: Exception = None):
+        super().__init__(*attrs)
+        self.caused_by = caused_by
+
+
+EXPRESSIONS_CACHE_SIZE = 512
+"""Maximum number of compiled runtime expressions kept in the cache."""
+
+
+class RuntimeExpression:
+    """
+    A runtime expression parsed by `compile_expression()`, which can be
+    evaluated any number of times without parsing it again.
+    """
+
+    def __init__(self, expression: str, evaluate_func: Callable):
+        self.expression = expression
+        self._evaluate_func = evaluate_func
+
+    def evaluate(
+        self,
+        resp: Union[dict, Response],
+        path_values: dict = None,
+        query_param_types: dict = None,
+        header_param_types: dict = None,
+    ):
+        """
+        Evaluates this expression on the given response. See `evaluate()`.
+        """
+        try:
+            return self._evaluate_func(
+                resp, path_values, query_param_types, header_param_types
+            )
+        except RuntimeExpressionError as e:
+            raise e
+        except Exception as e:
+            raise RuntimeExpressionError(caused_by=e)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.expression!r})"
+
+
+@lru_cache(maxsize=EXPRESSIONS_CACHE_SIZE)
+def compile_expression(expression: str) -> RuntimeExpression:
+    """
+    Parses an OpenAPI runtime expression (https://swagger.io/docs/specification/links/)
+    or a dot-separated expression, and returns it as a RuntimeExpression that
+    can be evaluated several times.
+
+    The most recently used expressions are cached, so compiling the same
+    expression again returns the same instance.
+
+    It raises a RuntimeExpressionError if the expression is not valid.
+
+    :param expression:  An OpenAPI runtime expression or a dot-separated expression.
+    :return:            The compiled expression.
+    """
+    try:
+        return RuntimeExpression(expression, _compile(expression.strip()))
+    except RuntimeExpressionError as e:
+        raise e
+    except Exception as e:
+        raise RuntimeExpressionError(caused_by=e)
+
+
+def evaluate(
+    resp: Union[dict, Response],
+    expression: str,
+    path_values: dict = None,
+    query_param_types: dict = None,
+    header_param_types: dict = None,
+):
+    """
+    Evaluates an OpenAPI runtime expression (https://swagger.io/docs/specification/links/).
+    It also accepts a dot-separated expression to address an attribute of the
+    response body.
+
+    The expression is compiled with `compile_expression()`, so it is only
+    parsed the first time it is evaluated.
+
+    It raises a RuntimeExpressionError if the expression cannot be evaluated
+    successfully.
+
+    :param resp:        The response on which the expression will be applied.
+    :param expression:  An OpenAPI runtime expression or a dot-separated expression.
+    :param path_values: A dictionary with the values of the path parameters of
+                        the request. It is only needed if the runtime expression
+                        needs to access these values.
+    :param query_param_types: A dictionary with the types of the query parameters of
+                        the request. It is only needed if the values have to be
+                        returned with the appropriate type. Otherwise, a string value
+                        will be returned.
+    :param header_param_types: A dictionary with the types of the header parameters of
+                        the request. It is only needed if the values have to be
+                        returned with the appropriate type. Otherwise, a string value
+                        will be returned.
+    :return:            The result of the evaluated expression.
+    """
+    try:
+        compiled_expression = compile_expression(expression)
+    except TypeError as e:
+        # Unhashable expressions cannot be cached
+        raise RuntimeExpressionError(caused_by=e)
+
+    return compiled_expression.evaluate(
+        resp, path_values, query_param_types, header_param_types
+    )
+
+
+def _compile(expression: str) -> Callable:
+    """
+    Returns a function that evaluates the given (stripped) expression. The
+    function receives the response, the path values and the query and header
+    parameter types.
+    """
+    if expression.startswith("$eval("):
+        return _compile_eval(expression[len("$eval(") : -1].strip())
+
+    if "{" in expression:
+        parts = _compile_template(expression)
+
+        def evaluate_template(resp, *params):
+            values = [part(resp, *params) if callable(part) else part for part in parts]
+            return values[0] if len(values) == 1 else "".join(map(str, values))
+
+        return evaluate_template
+
+    if expression.startswith("$"):
+        return _compile_runtime_expression(expression)
+
+    if expression.startswith("#"):
+        # Dot-separated path
+        key = expression[1:].strip()
+
+        def evaluate_path(resp, *params):
+            if isinstance(resp, Response):
+                resp = json_body(resp)
+
+            if not isinstance(resp, dict):
+                raise ValueError("Invalid response format")
+
+            return _get_from_dict(resp, key)
+
+        return evaluate_path
+
+    # Return the expression as a literal value
+    return lambda resp, *params: expression
+
+
+def _compile_eval(expression: str) -> Callable:
+    """
+    Compiles the content of an $eval() expression. Any subexpressions (enclosed
+    in {}) are replaced with variables holding their values when the compound
+    expression is evaluated.
+    """
+    if expression.startswith("$eval("):
+        raise RuntimeExpressionError(
+            caused_by=ValueError("Nested evaluation expressions are not supported")
+        )
+
+    variables = {}
+    if "{" in expression:
+        parts = _compile_template(expression)
+        for i, part in enumerate(parts):
+            if callable(part):
+                var_name = f"var{len(variables)}"
+                variables[var_name] = part
+                parts[i] = var_name
+        expression = "".join(parts)
+
+    compiled_expr = compile_expr(expression)
+
+    def evaluate_eval(resp, *params):
+        return compiled_expr(
+            {name: part(resp, *params) for name, part in variables.items()}
+        )
+
+    return evaluate_eval
+
+
+def _compile_template(expression: str) -> list:
+    """
+    Splits an expression that includes subexpressions enclosed in curly braces.
+    Returns a list with the literal parts of the expression as strings and the
+    subexpressions as functions that evaluate them.
+    """
+    parts = re.split(r"({\$?[^}]+})", expression)
+    parts = [part for part in parts if part]
+    for i, part in enumerate(parts):
+        if part.startswith("{") and part.endswith("}"):
+            parts[i] = _compile_subexpression(part[1:-1])
+    return parts
+
+
+def _compile_subexpression(expression: str) -> Callable:
+    """
+    Compiles a subexpression enclosed in curly braces, which may define a
+    default value with the coalescing operator (??).
+    """
+    default_value_defined = " ?? " in expression
+
+    # Handle coalescing operator (??) to provide a default value
+    default_value = None
+    if default_value_defined:
+        expression, default_value = map(str.strip, expression.split(" ?? ", 1))
+        default_value = eval_expr(default_value)
+
+    compiled_expression = compile_expression(expression)
+
+    def evaluate_subexpression(resp, *params):
+        try:
+            return compiled_expression.evaluate(resp, *params)
+        except RuntimeExpressionError as e:
+            if default_value_defined and isinstance(
+                e.caused_by, (KeyError, IndexError)
+            ):
+                return default_value
+            raise e
+
+    return evaluate_subexpression
+
+
+def _compile_runtime_expression(expression: str) -> Callable:
+    """
+    Decodes the given runtime expression (according to
+    https://swagger.io/docs/specification/links/) and returns a function that
+    evaluates it.
+    """
+    for expr, fn in _RUNTIME_EXPRESSION_FUNCS.items():
+        if expr.endswith("*"):
+            expr_prefix = expr.rstrip("*")
+            if expression.startswith(expr_prefix):
+                return partial(fn, name=expression[len(expr_prefix) :])
+        if expr == expression:
+            return fn
+
+    raise RuntimeExpressionError(caused_by=ValueError("Invalid runtime expression"))
+
+
+def _get_query_value(resp: Response, path_values, query_param_types, _, name: str):
+    parsed_url = urlparse(resp.request.url)
+    query_params = parse_qs(parsed_url.query)
+    value = query_params.get(name, [])
+    if len(value) == 0:
+        raise RuntimeExpressionError(
+            caused_by=KeyError(f"Query parameter '{name}' not found")
+        )
+    elif len(value) == 1:
+        value = value[0]
+
+    return _cast_value(name, value, query_param_types)
+
+
+def _get_path_value(resp: Response, path_values, _, __, name: str):
+    if path_values is not None and name in path_values:
+        return path_values[name]
+    raise RuntimeExpressionError(
+        caused_by=KeyError(f"Path parameter '{name}' not found")
+    )
+
+
+def _get_header_value(resp: Response, _, __, header_param_types, name: str):
+    if header_param_types is not None:
+        header_param_types = {k.lower(): v for k, v in header_param_types.items()}
+    return _cast_value(name, resp.request.headers.get(name), header_param_types)
+
+
+def _cast_value(name, value, type_dict):
+    if type_dict is not None and name in type_dict:
+        return type_dict[name](value)
+    return value
+
+
+def _to_string(obj):
+    return str(obj) if obj is not None else ""
+
+
+_RUNTIME_EXPRESSION_FUNCS = {
+    "$url": lambda resp, *_: resp.request.url,
+    "$method": lambda resp, *_: resp.request.method,
+    "$request.query.*": _get_query_value,
+    "$request.path.*": _get_path_value,
+    "$request.header.*": _get_header_value,
+    "$request.body": lambda resp, *_: _to_string(resp.request.body),
+    "$request.body#/*": lambda resp, *_, name: _get_from_dict(
+        json_codec.loads(resp.request.body), name, "/"
+    ),
+    "$statusCode": lambda resp, *_: resp.status_code,
+    "$response.header.*": lambda resp, *_, name: resp.headers.get(name),
+    "$response.body": lambda resp, *_: resp.text,
+    "$response.body#/*": lambda resp, *_, name: _get_from_dict(
+        json_body(resp), name, "/"
+    ),
+}
+"""
+Functions to evaluate each type of runtime expression, receiving the response,
+the path values and the query and header parameter types. Expressions ending
+with `*` receive the rest of the expression as the `name` argument.
+"""
+
+
+def prepare_request(req: Union[PreparedRequest, Request], expression: str, value):
+    """
+    Set the value of a request from an OpenAPI runtime expression
+    (https://swagger.io/docs/specification/links/).
+    The expression can also be a dot-separated expression to address an
+    attribute of the response body.
+
+    It raises a RuntimeExpressionError if the expression cannot be evaluated
+    successfully.
+
+    :param req:         Request to update.
+    :param expression:  An OpenAPI runtime expression or a dot-separated expression.
+                        Only expressions that can be applied to a request are allowed.
+    :param value:       The value to set in the request.
+    """
+    try:
+        expression = expression.strip()
+
+        if isinstance(req, Request):
+            req = req.prepare()
+        elif not isinstance(req, PreparedRequest):
+            raise ValueError(f"Unexpected type '{type(req)}'")
+
+        if expression.startswith("$"):
+            _set_expression_value(req, expression, value)
+            return req
+
+        if expression:
+            if req.body:
+                body = json_codec.loads(req.body)
+            else:
+                body = {}
+
+            _set_in_dict(body, expression, value)
+        else:
+            body = value
+
+        _set_json_body(req, body)
+        return req
+
+    except RuntimeExpressionError as e:
+        raise e
+    except Exception as e:
+        raise RuntimeExpressionError(caused_by=e)
+
+
+def _set_expression_value(req: PreparedRequest, expression: str, value):
+    """
+    Decodes the given runtime expression (according to
+    https://swagger.io/docs/specification/links/) and applies the given value
+    to the corresponding field.
+    """
+
+    def set_query_param(name):
+        parsed_url = urlparse(req.url)
+        query_params = parse_qs(parsed_url.query)
+        query_params[name] = value
+        parsed_url = parsed_url._replace(query=None)
+        req.prepare_url(parsed_url.geturl(), query_params)
+
+    expression_funcs = {
+        "$url": lambda: req.prepare_url(value, None),
+        "$method": lambda: req.prepare_method(value),
+        "$request.query.*": lambda x: set_query_param(x),
+        "$request.header.*": lambda x: req.headers.__setitem__(x, value),
+        "$request.body": lambda: _set_json_body(req, value),
+        "$request.body#/*": lambda x: _set_json_body(
+            req, _set_in_dict(json_codec.loads(req.body or "{}"), x, value, "/")
+        ),
+    }
+
+    for expr, fn in expression_funcs.items():
+        if expr.endswith("*"):
+            expr_prefix = expr.rstrip("*")
+            if expression.startswith(expr_prefix):
+                return fn(expression[len(expr_prefix) :])
+        if expr == expression:
+            return fn()
+
+    raise RuntimeExpressionError("invalid runtime expression")
+
+
+def _set_json_body(req: PreparedRequest, body):
+    """
+    Sets the given object as the JSON body of the request, encoded with the
+    JSON codec of the client.
+    """
+    req.prepare_body(json_codec.dumps(body), None)
+    if "Content-Type" not in req.headers:
+        req.headers["Content-Type"] = "application/json"
+
+
+def _get_from_dict(d: dict, key: str, separator="."):
+    if key == "":
+        return d
+
+    try:
+
+        def get_item(a, b):
+            if isinstance(a, list):
+                b = int(b)
+            return a[b]
+
+        return reduce(get_item, key.split(separator), d)
+    except KeyError:
+        raise KeyError(f"Key '{key}' not found")
+    except IndexError:
+        raise IndexError(f"Index '{key}' out of range")
+
+
+def _set_in_dict(d: dict, key: str, value, separator="."):
+    temp_dict = d
+
+    def get_next(obj: Union[dict, list], subkey: str, set_value: bool = False):
+        default_value = value if set_value else {}
+
+        if isinstance(obj, dict):
+            next_level = obj.setdefault(subkey, default_value)
+        elif isinstance(obj, list):
+            if subkey == "-":
+                obj.append(default_value)
+                return obj[-1]
+            subkey = int(subkey)
+            next_level = obj[subkey]
+        else:
+            raise ValueError(
+                f"Unexpected type '{type(obj)}'. Expected 'dict' or 'list'"
+            )
+
+        if not set_value and not isinstance(next_level, (dict, list)):
+            obj[subkey] = {}
+            return obj[subkey]
+
+        if set_value:
+            obj[subkey] = value
+            return obj[subkey]
+
+        return next_level
+
+    *key, last = key.strip().split(separator)
+    for bit in key:
+        temp_dict = get_next(temp_dict, bit)
+    get_next(temp_dict, last, True)
+    return d
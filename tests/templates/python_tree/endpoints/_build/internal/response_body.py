@@ -0,0 +1,40 @@
+"""
+This module provides helpers to access the decoded body of an HTTP response,
+so that it is only decoded once no matter how many times it is used (e.g.
+to build the response model and to evaluate the pagination expressions).
+"""
+
+from requests import Response
+
+from . import json_codec
+
+_JSON_BODY_ATTR = "_decoded_json_body"
+
+
+def json_body(response: Response):
+    """
+    Returns the JSON-decoded body of the given response, decoded with the JSON
+    codec of the client. The decoded body is cached in the response instance,
+    so the same object is returned every time. It must not be modified.
+
+    :param response: The response whose body is decoded.
+    :return:         The decoded body.
+    """
+    try:
+        return getattr(response, _JSON_BODY_ATTR)
+    except AttributeError:
+        body = _decode_json(response)
+        setattr(response, _JSON_BODY_ATTR, body)
+        return body
+
+
+def _decode_json(response: Response):
+    """
+    Decodes the JSON body of the given response using the JSON codec of the
+    client. Bodies encoded in UTF-8 (or without a known encoding) are decoded
+    from their bytes, without building an intermediate string.
+    """
+    encoding = response.encoding
+    if encoding is None or encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return json_codec.loads(response.content)
+    return json_codec.loads(response.text)
@@ -0,0 +1,120 @@
+"""
+This module provides helpers to create the HTTP session shared by all the
+requests of an API instance, and to inspect how its connection pools are used.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+
+@dataclass
+class ConnectionPoolStats:
+    """
+    Usage counters of the connection pools held by an HTTP session.
+    """
+
+    connections: int = 0  # Number of connections opened
+    requests: int = 0  # Number of requests sent
+
+    @property
+    def reused(self) -> int:
+        """
+        Returns the number of requests that were sent through an already
+        opened connection.
+        """
+        return max(self.requests - self.connections, 0)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that keeps track of the number of requests sent and the
+    number of connections actually opened by its connection pools.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.stats = ConnectionPoolStats()
+        self._stats_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._count_connections(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        # Requests sent through a proxy use the pools of its own manager
+        new_manager = proxy not in self.proxy_manager
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if new_manager:
+            self._count_connections(manager)
+        return manager
+
+    def send(self, request, *args, **kwargs):
+        with self._stats_lock:
+            self.stats.requests += 1
+        return super().send(request, *args, **kwargs)
+
+    def _count_connections(self, pool_manager):
+        """
+        Makes the connection pools of the given urllib3 pool manager count
+        the connections they open.
+        """
+        pool_manager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_class, self._on_connect)
+            for scheme, pool_class in pool_manager.pool_classes_by_scheme.items()
+        }
+
+    def _on_connect(self):
+        with self._stats_lock:
+            self.stats.connections += 1
+
+
+def _counting_pool_class(pool_class, on_connect):
+    """
+    Returns a subclass of the given urllib3 connection pool class that calls
+    `on_connect` every time one of its connections opens a new socket.
+    """
+
+    class ConnectionCls(pool_class.ConnectionCls):
+        def connect(self):
+            super().connect()
+            on_connect()
+
+    return type(pool_class.__name__, (pool_class,), {"ConnectionCls": ConnectionCls})
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOLSIZE, pool_maxsize: int = DEFAULT_POOLSIZE
+) -> requests.Session:
+    """
+    Creates a new HTTP session that keeps its connections alive so that they
+    can be reused by subsequent requests to the same host.
+
+    :param pool_connections: The number of connection pools (hosts) to cache.
+    :param pool_maxsize:     The maximum number of connections kept in each
+                             pool.
+    :return:                 A new requests.Session instance.
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def connection_pool_stats(session: requests.Session) -> ConnectionPoolStats:
+    """
+    Returns the usage counters of the connection pools of the given session.
+    """
+    stats = ConnectionPoolStats()
+
+    for adapter in set(session.adapters.values()):
+        if isinstance(adapter, PooledHTTPAdapter):
+            stats.connections += adapter.stats.connections
+            stats.requests += adapter.stats.requests
+
+    return stats
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
@@ -5,12 +7,12 @@ import xmltodict
 from requests.structures import CaseInsensitiveDict
 
 from tests.templates.setup import build_client
-from ..common import make_response, to_dict
+from ..common import json_request_args, make_response, to_dict
 
 build_client("python-tree", "companies_api.yaml")
 
 pkg_name = __name__.rsplit(".", 1)[0]
-request_mock_pkg = f"{pkg_name}._build.api.requests.request"
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
 
 if True:
     from ._build.api import API
@@ -117,14 +119,17 @@ def test_create(req, expected_resp, req_headers):
     expected_req_headers = {"Authorization": "Bearer token"}
     expected_req_headers.update(req_headers)
     if req_headers.get("content-type") == "application/x-www-form-urlencoded":
-        expected_req_data = to_dict(req)
-        expected_req_json = None
+        expected_req_args = dict(
+            headers=expected_req_headers, data=to_dict(req), json=None
+        )
     elif req_headers.get("content-type") == "application/xml":
-        expected_req_data = xmltodict.unparse({"root": to_dict(req)})
-        expected_req_json = None
+        expected_req_args = dict(
+            headers=expected_req_headers,
+            data=xmltodict.unparse({"root": to_dict(req)}),
+            json=None,
+        )
     else:
-        expected_req_data = []
-        expected_req_json = to_dict(req)
+        expected_req_args = json_request_args(req, expected_req_headers)
 
     with mock.patch(request_mock_pkg, return_value=expected_raw_resp) as m:
         resp = (
@@ -138,10 +143,8 @@ def test_create(req, expected_resp, req_headers):
         "POST",
         "https://test-api.com/companies",
         params={"foo": "bar"},
-        headers=expected_req_headers,
-        data=expected_req_data,
+        **expected_req_args,
         files=None,
-        json=expected_req_json,
         timeout=3,
         verify=True,
     )
@@ -171,10 +174,8 @@ def test_create_default_status_code():
         "POST",
         "https://test-api.com/companies",
         params={"foo": "bar"},
-        headers={"Authorization": "Bearer token"},
-        data=[],
+        **json_request_args(test_req_create01, {"Authorization": "Bearer token"}),
         files=None,
-        json=to_dict(test_req_create01),
         timeout=3,
         verify=True,
     )
@@ -215,9 +216,11 @@ def test_get():
     assert isinstance(resp, Company)
 
 
-def test_list():
+@pytest.mark.parametrize("validate_responses", [True, False])
+def test_list(validate_responses: bool):
     """
-    Tests a successful request to get the list of Companies.
+    Tests a successful request to get the list of Companies, with and without
+    validating the response.
     """
     expected_list = CompanyList(
         results=[
@@ -235,7 +238,7 @@ def test_list():
 
     with mock.patch(request_mock_pkg, return_value=expected_resp) as m:
         resp = (
-            API(host="test-api.com")
+            API(host="test-api.com", validate_responses=validate_responses)
             .with_security(BearerToken("token"))
             .companies()
             .list_companies(params={"foo": "bar"})
@@ -256,6 +259,7 @@ def test_list():
     assert resp.http_response().status_code == 200
     assert resp == expected_list
     assert isinstance(resp, CompanyList)
+    assert all(isinstance(company, Company) for company in resp.results)
 
 
 @pytest.mark.parametrize(
@@ -283,10 +287,8 @@ def test_update(req, expected_resp):
         "PUT",
         "https://test-api.com/companies/shiny_stickers",
         params={"foo": "bar"},
-        headers={"Authorization": "Bearer token"},
-        data=[],
+        **json_request_args(req, {"Authorization": "Bearer token"}),
         files=None,
-        json=to_dict(req),
         timeout=3,
         verify=True,
     )
@@ -321,13 +323,14 @@ def test_patch(req, expected_resp):
         "PATCH",
         "https://test-api.com/companies/shiny_stickers",
         params={"foo": "bar"},
-        headers={
-            "Authorization": "Bearer token",
-            "Content-Type": "application/json-patch+json",
-        },
-        data=[],
+        **json_request_args(
+            req,
+            {
+                "Authorization": "Bearer token",
+                "Content-Type": "application/json-patch+json",
+            },
+        ),
         files=None,
-        json=to_dict(req),
         timeout=3,
         verify=True,
     )
@@ -461,3 +464,44 @@ def test_get_error_not_raised():
     assert resp.http_response().status_code == 404
     assert resp == test_company_not_found
     assert isinstance(resp, ErrorResponse)
+
+
+def test_lazy_api_tree():
+    """
+    Tests that the modules of the API tree are only imported when their
+    endpoints are accessed.
+    """
+    code = f"""
+import sys
+from {pkg_name}._build.api import API
+
+apis = "{pkg_name}._build.apis"
+assert apis + ".companies" not in sys.modules
+assert apis + ".tests" not in sys.modules
+
+API(host="test-api.com").companies("a").departments("b")
+assert apis + ".companies" in sys.modules
+assert apis + ".departments" in sys.modules
+assert apis + ".employees" not in sys.modules
+assert apis + ".tests" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_models():
+    """
+    Tests that the models are only imported when they are first accessed.
+    """
+    code = f"""
+import sys
+import {pkg_name}._build.api
+from {pkg_name}._build import models
+
+assert "{pkg_name}._build.models.models" not in sys.modules
+
+assert models.Company.__name__ == "Company"
+assert "{pkg_name}._build.models.models" in sys.modules
+assert "Company" in dir(models)
+assert "Company" in models.__all__
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
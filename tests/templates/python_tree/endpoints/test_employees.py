@@ -3,12 +3,12 @@ from unittest import mock
 import pytest
 
 from tests.templates.setup import build_client
-from ..common import make_response, to_dict
+from ..common import json_request_args, make_response, to_dict
 
 build_client("python-tree", "companies_api.yaml")
 
 pkg_name = __name__.rsplit(".", 1)[0]
-request_mock_pkg = f"{pkg_name}._build.api.requests.request"
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
 
 if True:
     from ._build.api import API
@@ -62,10 +62,8 @@ def test_create(req, expected_resp):
         "POST",
         "https://test-api.com/companies/shiny_stickers/employees",
         params={"foo": "bar"},
-        headers={"Authorization": "Bearer token"},
-        data=[],
+        **json_request_args(req, {"Authorization": "Bearer token"}),
         files=None,
-        json=to_dict(req),
         timeout=3,
         verify=True,
     )
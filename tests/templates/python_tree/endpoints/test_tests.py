@@ -5,12 +5,12 @@ import xmltodict
 from requests.structures import CaseInsensitiveDict
 
 from tests.templates.setup import build_client
-from ..common import make_response, to_dict
+from ..common import json_request_args, make_response, to_dict
 
 build_client("python-tree", "companies_api.yaml")
 
 pkg_name = __name__.rsplit(".", 1)[0]
-request_mock_pkg = f"{pkg_name}._build.api.requests.request"
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
 
 if True:
     from ._build.api import API
@@ -67,10 +67,8 @@ def test_post_employee_input_parameters(employee_id, name, extra_info):
         "POST",
         "https://test-api.com/tests/shiny_stickers/employees",
         params={"foo": "bar"},
-        headers={"Authorization": "Bearer token"},
-        data=[],
+        **json_request_args(expected_req, {"Authorization": "Bearer token"}),
         files=None,
-        json=to_dict(expected_req),
         timeout=3,
         verify=True,
     )
@@ -106,10 +104,8 @@ def test_one_of(req, expected_resp):
         "POST",
         "https://test-api.com/tests/oneOf",
         params={"foo": "bar"},
-        headers={"Authorization": "Bearer token"},
-        data=[],
+        **json_request_args(expected_req, {"Authorization": "Bearer token"}),
         files=None,
-        json=to_dict(expected_req),
         timeout=3,
         verify=True,
     )
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import DEFAULT_POOLSIZE
+
+from .internal.content_type import encode_json
+from .internal.lazy import lazy_methods
+from .internal.session import ConnectionPoolStats, connection_pool_stats, create_session
+from .models.struct import APIStruct
+
+if TYPE_CHECKING:
+    from .apis.books import _BooksMethods
+else:
+    _BooksMethods = lazy_methods(__package__, ".apis.books", "_BooksMethods", "books")
+
+
+class API(_BooksMethods):
+    """
+    The top-level class used as an abstraction of the Files API.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        verify: bool = True,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        validate_responses: bool = True,
+    ):
+        """
+        Creates a new API instance.
+
+        :param host: (optional) Host name of the Files API.
+        :param verify: (optional) Whether to verify the server's TLS certificate.
+        :param pool_connections: (optional) The number of connection pools
+            (one per host) kept by the HTTP session.
+        :param pool_maxsize: (optional) The maximum number of connections kept
+            alive in each pool. It should be at least the number of threads
+            sharing this API instance.
+        :param validate_responses: (optional) Whether the responses are
+            validated when they are parsed into models. If False, models are
+            built from the trusted response data without validating the values
+            that already have the expected type, which is faster for large
+            responses.
+        """
+        if not host.startswith("http://") and not host.startswith("https://"):
+            host = "https://" + host
+
+        self.host = host.rstrip("/")
+        self._verify = verify
+        self.headers = {}
+        self._raise_errors = True
+        self._validate_responses = validate_responses
+        self._session = create_session(pool_connections, pool_maxsize)
+
+    def make_request(
+        self,
+        method: str,
+        url: str,
+        data=None,
+        files: dict = None,
+        json=None,
+        params=None,
+        headers: dict = None,
+        timeout: float = 3,
+        verify=None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Makes a request to the API server.
+
+        :param method: HTTP request method used (`GET`, `OPTIONS`, `HEAD`,
+            `POST`, `PUT`, `PATCH`, or `DELETE`).
+        :param url: Request URL. It can be a relative path or a full URL (the
+            host used must be the same as the host in this :class:`API` instance).
+        :param body: (optional) Dictionary, list of tuples, bytes, or file-like
+            object to send in the body of the request.
+        :param files: (optional) Dictionary of files to send in the request.
+        :param params: (optional) Dictionary, list of tuples or bytes to send
+            in the query string for the :class:`Request`.
+        :param headers: (optional) Dictionary of HTTP headers to send.
+        :param timeout: (optional) How many seconds to wait for the server to
+            send data before giving up, as a float, or a `(connect timeout,
+            read timeout)` tuple.
+        :param auth: (optional) If True (default), the authentication token will
+            be sent in the request if a security strategy is set.
+        :param verify: (optional) If set as a boolean, it will override the API
+            verify value.
+        :return: An instance of :class:`request.Response`.
+        """
+        if headers is None:
+            headers = {}
+
+        headers.update(self.headers)
+
+        # Models and JSON payloads are sent encoded with the JSON codec
+        payload = data if isinstance(data, (BaseModel, APIStruct)) else None
+        if payload is None and json is not None and not data:
+            payload = json
+        if payload is not None:
+            data, json = encode_json(payload), None
+            if "content-type" not in {k.lower() for k in headers}:
+                headers["Content-Type"] = "application/json"
+
+        if url.lower().startswith("http://") or url.lower().startswith("https://"):
+            url = url
+        else:
+            url = urljoin(self.host, url)
+
+        req = requests.Request(
+            method, url, params=params, headers=headers, data=data, json=json
+        )
+
+        if verify is None:
+            verify = self._verify
+
+        if data and files:
+            # Try to import MultipartEncoder from requests_toolbelt to handle
+            # multipart/form-data encoding with file streams
+            try:
+                from requests_toolbelt import MultipartEncoder
+
+                data_encoded = {
+                    k: v if isinstance(v, bytes) else str(v)
+                    for k, v in data.items()
+                    if v is not None
+                }
+
+                m = MultipartEncoder(fields={**data_encoded, **files})
+                req.data = m
+                files = None
+
+                req.headers["Content-Type"] = m.content_type
+
+            except ImportError:
+                # Fallback to standard file upload handling
+                pass
+
+        return self._session.request(
+            req.method,
+            req.url,
+            params=req.params,
+            headers=req.headers,
+            data=req.data,
+            files=files,
+            json=req.json,
+            timeout=timeout,
+            verify=verify,
+            **kwargs,
+        )
+
+    def connection_stats(self) -> ConnectionPoolStats:
+        """
+        Returns the usage counters of the connection pools of this API
+        instance, which can be used to check how often the pooled connections
+        are reused.
+        """
+        return connection_pool_stats(self._session)
+
+    def close(self):
+        """
+        Closes the HTTP session of this API instance and all its pooled
+        connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.lazy import lazy_methods
+from ..internal.resource import APIResource
+from ..models import models
+
+if TYPE_CHECKING:
+    from .download import _DownloadMethods
+else:
+    _DownloadMethods = lazy_methods(
+        __package__, ".download", "_DownloadMethods", "download"
+    )
+
+
+@dataclass
+class Books1(APIResource, _DownloadMethods):
+    book_id: str
+
+    def _build_partial_path(self):
+        return f"/books/{self.book_id}"
+
+
+_BOOKS2_POST_REQ_CONTENT_TYPES = [
+    ("multipart/form-data", models.BookUploadRequest),
+]
+
+_BOOKS2_POST_RESPONSES = ExpectedResponses(
+    [
+        (201, "application/json", models.BooksResponse201),
+    ]
+)
+
+
+@dataclass
+class Books2(APIResource):
+
+    def post(
+        self, req: Union[models.BookUploadRequest, dict], **kwargs
+    ) -> models.BooksResponse201:
+        """
+        None
+
+        :param req: Request payload.
+        :type req: Union[models.BookUploadRequest, dict]
+        :return: The API response to the request.
+        :rtype: models.BooksResponse201
+        """
+        resp = self._make_request(
+            "POST", req, req_content_types=_BOOKS2_POST_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _BOOKS2_POST_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/books"
+
+
+class _BooksMethods:
+    """
+    This class declares and implements the `books()` method.
+    """
+
+    @overload
+    def books(self, book_id: str) -> Books1: ...
+
+    @overload
+    def books(self) -> Books2: ...
+
+    def books(self, book_id: str = None):
+        if book_id is not None:
+            return Books1(book_id)._child_of(self)
+
+        if book_id is None:
+            return Books2()._child_of(self)
+
+        raise ValueError("Invalid parameters")
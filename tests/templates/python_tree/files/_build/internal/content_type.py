@@ -0,0 +1,299 @@
+import mimetypes
+from dataclasses import dataclass, field
+from functools import lru_cache
+from io import IOBase
+from typing import Any, Optional, Union
+
+import xmltodict
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from requests.structures import CaseInsensitiveDict
+
+from ..models.basemodel import APIBaseModel
+from ..models.primitives import FilePayload
+from ..models.struct import APIStruct
+from . import json_codec
+
+CONTENT_TYPES_CACHE_SIZE = 256
+"""Maximum number of parsed Content-Types (and comparisons) kept in the cache."""
+
+
+class ContentType:
+    """
+    Represents a Content-Type.
+
+    Instances returned by `get_content_type()` are shared, so they must not be
+    modified.
+    """
+
+    def __init__(self, content_type: str):
+        self.content_type = content_type
+        components = parse_content_type(content_type)
+        self.media_type = components["media_type"]
+        self.type = components["type"]
+        self.subtype = components["subtype"]
+        self.suffix = components["suffix"]
+        self.parameters = components["parameters"]
+
+        # Media type used to check if two Content-Types match
+        self.match_key = content_type.lower().split(";")[0]
+        # Underlying format (e.g., json for application/json-patch+json)
+        self.format = self.suffix or self.subtype
+
+    def __eq__(self, other):
+        return content_types_match(self.content_type, other.content_type)
+
+    def __str__(self):
+        return self.content_type
+
+    def __repr__(self):
+        return f"ContentType({self.content_type})"
+
+
+def parse_content_type(content_type):
+    """
+    Parses a Content-Type into its components.
+
+    :param content_type: The Content-Type to parse.
+    :return:  A dictionary with the components of the Content-Type.
+    """
+    # Split the main type from the parameters
+    media_type, *params = content_type.split(";")
+    media_type = media_type.strip()
+
+    # Split the base type and the suffix
+    base_type, _, suffix = media_type.partition("+")
+
+    # Split the type and subtype
+    main_type, _, subtype = base_type.partition("/")
+
+    # Parse parameters into a dictionary, ignoring parameters without value
+    parameters = {}
+    for param in params:
+        key, _, value = param.partition("=")
+        key, value = key.strip(), value.strip()
+        if key and value:
+            parameters[key] = value
+
+    return {
+        "media_type": media_type,  # Full media type (e.g., application/json-patch+json)
+        "type": main_type,  # Main type (e.g., application)
+        "subtype": subtype,  # Subtype (e.g., json-patch)
+        "suffix": (
+            suffix if suffix else None
+        ),  # Suffix (e.g., json), or None if not present
+        "parameters": parameters,  # Parameters (e.g., {'charset': 'utf-8'})
+    }
+
+
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
+def get_content_type(content_type: str) -> ContentType:
+    """
+    Returns the ContentType instance representing the given Content-Type.
+    Instances are cached, so each Content-Type is only parsed once.
+    """
+    return ContentType(content_type)
+
+
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
+def content_types_compatible(type1: str, type2: str):
+    """
+    Checks if two Content-Types are compatible (i.e., if they use the same
+    underlying format).
+    """
+    parsed_type1 = get_content_type(type1)
+    parsed_type2 = get_content_type(type2)
+
+    if parsed_type1.type != parsed_type2.type:
+        return False
+
+    if "*" in [parsed_type1.subtype, parsed_type2.subtype]:
+        return True
+
+    return parsed_type1.format == parsed_type2.format
+
+
+@lru_cache(maxsize=CONTENT_TYPES_CACHE_SIZE)
+def content_types_match(type1: str, type2: str) -> bool:
+    """
+    Returns whether the given Content-Types match.
+    """
+    t1, t2 = get_content_type(type1).match_key, get_content_type(type2).match_key
+    if "*/*" in [t1, t2]:
+        return True
+    return t1 == t2
+
+
+@dataclass
+class ContentTypeValidationResult:
+    """
+    Represents the result of preparing a request payload for a specific
+    Content-Type.
+    """
+
+    type: str = ""  # The request's Content-Type, indicating the data format
+    data: Any = None
+    files: Optional[dict] = None
+    json: Optional[Union[dict, list]] = None
+    headers: CaseInsensitiveDict = field(default_factory=dict)
+
+
+def to_plain_text(obj) -> ContentTypeValidationResult:
+    """
+    Returns the plain text representation of the given object.
+    """
+    return ContentTypeValidationResult(
+        type="text/plain",
+        data=str(obj),
+        headers=CaseInsensitiveDict({"Content-Type": "text/plain"}),
+    )
+
+
+def to_form_urlencoded(obj) -> ContentTypeValidationResult:
+    """
+    Returns the form-urlencoded representation of the given object.
+    Raises an exception if the object cannot be serialized to a valid
+    application/x-www-form-urlencoded format.
+    """
+    result = ContentTypeValidationResult(
+        type="application/x-www-form-urlencoded",
+        headers=CaseInsensitiveDict(
+            {"Content-Type": "application/x-www-form-urlencoded"}
+        ),
+    )
+
+    if isinstance(obj, (str, bytes)):
+        result.data = str(obj)
+    elif isinstance(obj, dict):
+        result.data = obj
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
+        result.data = json_codec.loads(obj.json(by_alias=True))
+    else:
+        raise ValueError(
+            f'Value type "{type(obj).__name__}" cannot be converted to form-urlencoded'
+        )
+
+    return result
+
+
+def encode_json(obj) -> bytes:
+    """
+    Encodes the given JSON payload (a model or a JSON value) as UTF-8 bytes
+    with the JSON codec of the client. Models are encoded by alias, with the
+    same values as `model.json(by_alias=True)`.
+    """
+    if isinstance(obj, BaseModel):
+        # The values are built as in `BaseModel.json()`
+        data = dict(obj._iter(to_dict=True, by_alias=True))
+        if obj.__custom_root_type__:
+            data = data["__root__"]
+        return json_codec.dumps(data, default=obj.__json_encoder__)
+    if isinstance(obj, APIStruct):
+        return json_codec.dumps(obj.dict(by_alias=True), default=pydantic_encoder)
+    return json_codec.dumps(obj)
+
+
+def to_json(obj) -> ContentTypeValidationResult:
+    """
+    Returns the JSON representation of the given object.
+    Raises an exception if the object cannot be serialized to a valid JSON.
+    """
+    result = ContentTypeValidationResult(
+        type="application/json",
+        headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+    )
+
+    if isinstance(obj, (str, bytes)):
+        result.data = encode_json(json_codec.loads(obj))
+    elif isinstance(obj, (dict, list, APIBaseModel, APIStruct)):
+        # Payloads are serialized only once, and sent as they are
+        result.data = encode_json(obj)
+    else:
+        raise ValueError(
+            f'Value type "{type(obj).__name__}" cannot be converted to JSON'
+        )
+
+    return result
+
+
+def to_xml(obj) -> ContentTypeValidationResult:
+    """
+    Returns the XML representation of the given object.
+    Raises an exception if the object cannot be serialized to a valid XML.
+    """
+    result = ContentTypeValidationResult(
+        type="application/xml",
+        headers=CaseInsensitiveDict({"Content-Type": "application/xml"}),
+    )
+
+    if isinstance(obj, (str, bytes)):
+        xmltodict.parse(obj)
+        result.data = str(obj)
+        return result
+    elif isinstance(obj, dict):
+        obj_dict = obj
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
+        obj_dict = json_codec.loads(obj.json(by_alias=True))
+    else:
+        raise ValueError(
+            f'Value type "{type(obj).__name__}" cannot be converted to XML'
+        )
+
+    obj_dict = {"root": obj_dict}
+    result.data = xmltodict.unparse(obj_dict)
+    return result
+
+
+def to_multipart(obj) -> ContentTypeValidationResult:
+    """
+    Converts the given object to a multipart representation.
+    Returns the data and files to be sent in a multipart/form-data request.
+    """
+    if isinstance(obj, dict):
+        obj_dict = obj
+    elif isinstance(obj, (APIBaseModel, APIStruct)):
+        obj_dict = obj.dict(by_alias=True)
+    else:
+        raise ValueError(
+            f'Value type "{type(obj).__name__}" cannot be converted to multipart/form-data'
+        )
+
+    data = {}
+    files = {}
+
+    for key, value in obj_dict.items():
+        if isinstance(value, (bytes, IOBase)):
+            name = key
+            content_type = "application/octet-stream"
+            if hasattr(value, "name"):
+                if filename := value.name.split("/")[-1]:
+                    name = filename
+
+                content_type_guess, _ = mimetypes.guess_type(value.name)
+                if content_type_guess:
+                    content_type = content_type_guess
+
+            files[key] = (name, value, content_type)
+
+        elif isinstance(obj[key], FilePayload):
+            value: FilePayload = obj[key]
+            files[key] = (value.filename, value.content, value.content_type)
+
+        else:
+            data[key] = value
+
+    return ContentTypeValidationResult(
+        type="multipart/form-data",
+        data=data,
+        files=files,
+        headers=CaseInsensitiveDict({"Content-Type": "multipart/form-data"}),
+    )
+
+
+SUPPORTED_REQUEST_CONTENT_TYPES = {
+    "application/x-www-form-urlencoded": to_form_urlencoded,
+    "application/json": to_json,
+    "application/xml": to_xml,
+    "text/plain": to_plain_text,
+    "multipart/form-data": to_multipart,
+}
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  schemas.yaml
+#   timestamp: 2026-10-18T05:12:18+00:00
+
+from __future__ import annotations
+
+from io import IOBase
+from typing import IO, Optional, Union
+
+from pydantic import Field
+
+from .basemodel import APIBaseModel
+from .primitives import FilePayload
+
+
+class BookUploadRequest(APIBaseModel):
+    author: Optional[str] = Field(None, description="Author of the book")
+    file: Union[bytes, IO, IOBase, FilePayload] = Field(
+        ..., description="The book file to upload"
+    )
+    publication_year: Optional[int] = Field(
+        None, description="Year the book was published"
+    )
+    title: str = Field(..., description="Title of the book")
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BooksBookIdDownloadResponse200(APIBaseModel):
+    __root__: Union[bytes, IO, IOBase, FilePayload]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BooksResponse201(APIBaseModel):
+    message: Optional[str] = None
@@ -15,7 +15,7 @@ from ..common import make_response
 build_client("python-tree", "files_api.yaml")
 
 pkg_name = __name__.rsplit(".", 1)[0]
-request_mock_pkg = f"{pkg_name}._build.api.requests.request"
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
 send_mock_pkg = f"{pkg_name}._build.api.requests.Session.send"
 
 if True:
@@ -268,7 +268,9 @@ def test_book_download(
     get_kwargs = {"stream": stream} if stream is not None else {}
     expected_stream = stream if stream is not None else True
 
-    with mock.patch(request_mock_pkg, wraps=requests.request) as mock_request:
+    with mock.patch(
+        request_mock_pkg, autospec=True, side_effect=requests.Session.request
+    ) as mock_request:
         resp = (
             API(host=httpserver.url_for("")).books("123").download().get(**get_kwargs)
         )
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_NEXT_PAGE_URL1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PageNextUrl),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_NEXT_PAGE_URL1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "$response.body#/next_page_url",
+        "modifiers": [],
+        "result": "#results",
+        "has_more": "$response.body#/next_page_url",
+        "total_pages": "",
+    }
+)
+
+_NEXT_PAGE_URL1_GET_PARAM_TYPES = {
+    "query": {
+        "next_page": str,
+        "limit": int,
+    },
+}
+
+
+@dataclass
+class NextPageUrl1(APIResource):
+
+    def get(self, **kwargs) -> Union[models.PageNextUrl, models.ErrorResponse]:
+        """
+        Returns a paginated list of responses with an URL to the next page.
+
+        Query parameters:
+         - `next_page` _(str)_:
+         - `limit` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PageNextUrl, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _NEXT_PAGE_URL1_GET_RESPONSES,
+            pagination_info=_NEXT_PAGE_URL1_GET_PAGINATION_INFO,
+            param_types=_NEXT_PAGE_URL1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/next_page_url"
+
+
+class _NextPageUrlMethods:
+    """
+    This class declares and implements the `next_page_url()` method.
+    """
+
+    @overload
+    def next_page_url(self) -> NextPageUrl1: ...
+
+    def next_page_url(self):
+        return NextPageUrl1()._child_of(self)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_PAGE1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PagePage),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_PAGE1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.page",
+                "value": "$eval({$request.query.page ?? 0} + 1)",
+            }
+        ],
+        "result": "#results",
+        "has_more": "$eval(len({$response.body#/results}) >= {$request.query.page_size})",
+        "total_pages": "",
+    }
+)
+
+_PAGE1_GET_PARAM_TYPES = {
+    "query": {
+        "page": int,
+        "page_size": int,
+    },
+}
+
+
+@dataclass
+class Page1(APIResource):
+
+    def get(self, **kwargs) -> Union[models.PagePage, models.ErrorResponse]:
+        """
+        Returns a paginated list of responses using page pagination.
+
+        Query parameters:
+         - `page` _(int)_:
+         - `page_size` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PagePage, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _PAGE1_GET_RESPONSES,
+            pagination_info=_PAGE1_GET_PAGINATION_INFO,
+            param_types=_PAGE1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/page"
+
+
+class _PageMethods:
+    """
+    This class declares and implements the `page()` method.
+    """
+
+    @overload
+    def page(self) -> Page1: ...
+
+    def page(self):
+        return Page1()._child_of(self)
@@ -0,0 +1,128 @@
+"""
+This module allows to import the modules of the API tree and the models
+lazily, so that only the modules of the endpoints and models actually used
+are loaded.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+
+class _LazyMethod:
+    """
+    Descriptor that imports the module implementing a method the first time
+    the method is accessed, and then replaces itself with that method.
+    """
+
+    def __init__(self, package: str, module_name: str, class_name: str):
+        self._package = package
+        self._module_name = module_name
+        self._class_name = class_name
+        self._owner = None
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        module = importlib.import_module(self._module_name, self._package)
+        func = getattr(module, self._class_name).__dict__[self._name]
+
+        # The next accesses find the method without using the descriptor
+        setattr(self._owner, self._name, func)
+        return func.__get__(obj, objtype)
+
+
+def lazy_methods(package: str, module_name: str, class_name: str, method_name: str):
+    """
+    Returns a class declaring the given method of the given class, whose
+    module is only imported when the method is accessed for the first time.
+
+    :param package:     The package used to resolve the relative module name.
+    :param module_name: The (relative) name of the module declaring the class.
+    :param class_name:  The name of the class declaring the method.
+    :param method_name: The name of the method.
+    :return:            A class to be used in place of the given class.
+    """
+    return type(
+        class_name,
+        (),
+        {
+            "__module__": importlib.util.resolve_name(module_name, package),
+            method_name: _LazyMethod(package, module_name, class_name),
+        },
+    )
+
+
+def lazy_attributes(module_name: str, attributes: dict):
+    """
+    Returns the `__getattr__` and `__dir__` functions of a module whose given
+    attributes are imported from other modules the first time they are
+    accessed.
+
+    :param module_name: The name of the module.
+    :param attributes:  A dictionary with the names of the attributes and the
+                        (relative) names of the modules declaring them.
+    :return:            The `__getattr__` and `__dir__` functions.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str):
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+
+        value = getattr(importlib.import_module(source, module.__package__), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(attributes))
+
+    return __getattr__, __dir__
+
+
+def lazy_module(module_name: str, source: str):
+    """
+    Returns the `__getattr__` and `__dir__` functions of a module that exports
+    all the public attributes of another module, which is only imported the
+    first time one of them is accessed.
+
+    :param module_name: The name of the module.
+    :param source:      The (relative) name of the module whose attributes
+                        are exported.
+    :return:            The `__getattr__` and `__dir__` functions.
+    """
+    module = sys.modules[module_name]
+
+    def load():
+        return importlib.import_module(source, module.__package__)
+
+    def public_names(source_module) -> list:
+        names = getattr(source_module, "__all__", None)
+        if names is None:
+            names = [n for n in vars(source_module) if not n.startswith("_")]
+        return list(names)
+
+    def __getattr__(name: str):
+        source_module = load()
+        if name == "__all__":
+            # Star imports of the module must export the source attributes
+            value = public_names(source_module)
+        elif name.startswith("_") or not hasattr(source_module, name):
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        else:
+            value = getattr(source_module, name)
+
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(public_names(load())))
+
+    return __getattr__, __dir__
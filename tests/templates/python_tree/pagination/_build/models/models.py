@@ -0,0 +1,58 @@
+# generated by datamodel-codegen:
+#   filename:  schemas.yaml
+#   timestamp: 2026-10-18T05:12:19+00:00
+
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from pydantic import Field
+
+from .basemodel import APIBaseModel
+
+
+class ErrorResponse(APIBaseModel):
+    message: str = Field(..., example="Oh, no!")
+    status: int = Field(..., example=400)
+
+
+class Cursors(APIBaseModel):
+    next: Optional[str] = None
+    previous: Optional[str] = None
+
+
+class PageCursor(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    data: Optional[List] = None
+
+
+class Cursors1(APIBaseModel):
+    next: Optional[str] = None
+
+
+class PageCursorTotal(APIBaseModel):
+    cursors: Optional[Cursors1] = None
+    data: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PageNextUrl(APIBaseModel):
+    next_page_url: Optional[str] = None
+    results: Optional[List] = None
+
+
+class PageOffset(APIBaseModel):
+    results: Optional[List] = None
+
+
+class PageOffsetTotal(APIBaseModel):
+    results: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PagePage(APIBaseModel):
+    results: Optional[List] = None
+
+
+class Result(APIBaseModel):
+    value: Optional[Any] = Field(None, description="Value.")
@@ -5,7 +5,7 @@ import httpretty
 import requests
 
 pkg_name = __name__.rsplit(".", 1)[0]
-request_mock_pkg = f"{pkg_name}._build.api.requests.request"
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
 
 
 @httpretty.activate
@@ -20,23 +20,24 @@ def assert_pagination(
     expected_call_count: int,
     expected_type,
     expected_verify: bool = True,
+    prefetch: int = 0,
 ):
     """
     Asserts that, given API function (pagination_function) that supports
     pagination, it can be paginated properly.
     """
-    original_request_func = requests.request
+    original_request_func = requests.Session.request
 
-    def side_effect(*args, **kwargs):
+    def side_effect(session, *args, **kwargs):
         # Makes a real call to the request function
-        response = original_request_func(*args, **kwargs)
+        response = original_request_func(session, *args, **kwargs)
         assert "verify" in kwargs and kwargs["verify"] == expected_verify
         return response
 
     httpretty.register_uri(httpretty.GET, expected_url, body=request_handler)
     function_params_copy = copy.deepcopy(function_params)
 
-    with mock.patch(request_mock_pkg) as m:
+    with mock.patch(request_mock_pkg, autospec=True) as m:
         m.side_effect = side_effect
 
         actual_result = pagination_function(**function_params_copy)
@@ -50,7 +51,7 @@ def assert_pagination(
             # assert not actual_result.has_more()
 
         # Iterate results
-        for result_index, result in enumerate(actual_result):
+        for result_index, result in enumerate(actual_result.paginate(prefetch)):
             assert result == expected_type.parse_obj(expected_results[result_index])
 
         # assert not actual_result.has_more()
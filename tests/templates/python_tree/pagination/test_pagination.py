@@ -1,7 +1,14 @@
 import json
 import math
+import threading
+import time
+import weakref
+from unittest import mock
 
+import pytest
 from httpretty.core import HTTPrettyRequest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
 
 from tests.templates.setup import build_client
 from .common import assert_pagination
@@ -9,6 +16,8 @@ from .common import assert_pagination
 build_client("python-tree", "pagination_api.yaml")
 if True:
     from ._build.api import API
+    from ._build.models.exceptions import ResponseError
+    from ._build.models import pagination as pagination_module
     from ._build.models.models import Result
 
 expected_results = [
@@ -25,7 +34,8 @@ expected_results = [
 ]
 
 
-def test_cursor_pagination():
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_cursor_pagination(prefetch):
     """
     Tests a successful pagination using Cursor pagination.
     """
@@ -79,6 +89,7 @@ def test_cursor_pagination():
             expected_limit=limit,
             expected_call_count=math.ceil(len(expected_results) / limit),
             expected_type=Result,
+            prefetch=prefetch,
         )
 
 
@@ -136,7 +147,8 @@ def test_next_page_url_pagination():
         )
 
 
-def test_offset_pagination():
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_offset_pagination(prefetch):
     """
     Tests a successful pagination using offset pagination.
     """
@@ -181,6 +193,7 @@ def test_offset_pagination():
             expected_limit=limit,
             expected_call_count=expected_call_count,
             expected_type=Result,
+            prefetch=prefetch,
         )
 
 
@@ -230,3 +243,299 @@ def test_page_pagination():
             expected_call_count=expected_call_count,
             expected_type=Result,
         )
+
+
+def offset_handler(request: Request) -> Response:
+    offset = int(request.args.get("offset", 0))
+    limit = int(request.args["limit"])
+    resp = {"results": expected_results[offset : offset + limit]}
+    return Response(json.dumps(resp), content_type="application/json")
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_pagination_prefetch(httpserver: HTTPServer, prefetch: int):
+    """
+    Tests that the next pages are requested in the background while the
+    current page is consumed.
+    """
+    prefetched = threading.Event()
+    offsets = []
+
+    def handler(request: Request) -> Response:
+        offsets.append(int(request.args.get("offset", 0)))
+        if len(offsets) == 1 + prefetch:
+            prefetched.set()
+        return offset_handler(request)
+
+    httpserver.expect_request("/pagination/offset").respond_with_handler(handler)
+
+    resp = (
+        API(host=httpserver.url_for("")).pagination().offset().get(params={"limit": 2})
+    )
+    assert offsets == [0]
+
+    results = iter(resp.paginate(prefetch=prefetch))
+    assert next(results) == expected_results[0]
+
+    # The next pages are prefetched up to the given depth, without consuming
+    # any more results. Once the last of them has been requested, no slot is
+    # left to request another page until one is consumed.
+    assert prefetched.wait(timeout=5)
+    assert not resp._pagination.prefetcher._slots.acquire(blocking=False)
+    assert offsets == [2 * i for i in range(1 + prefetch)]
+
+    # Calling iter() again would restart the iteration, so next() is used
+    remaining = [next(results) for _ in range(len(expected_results) - 1)]
+    assert remaining == expected_results[1:]
+    with pytest.raises(StopIteration):
+        next(results)
+    assert len(httpserver.log) == len(expected_results) // 2 + 1
+
+
+def test_pagination_prefetch_error(httpserver: HTTPServer):
+    """
+    Tests that an error requesting a prefetched page is raised when the page
+    is consumed.
+    """
+
+    def handler(request: Request) -> Response:
+        if int(request.args.get("offset", 0)) >= 4:
+            return Response("Oh, no!", content_type="text/html")
+        return offset_handler(request)
+
+    httpserver.expect_request("/pagination/offset").respond_with_handler(handler)
+
+    resp = (
+        API(host=httpserver.url_for("")).pagination().offset().get(params={"limit": 2})
+    )
+
+    results = []
+    with pytest.raises(ResponseError):
+        for result in resp.paginate(prefetch=3):
+            results.append(result)
+
+    assert results == expected_results[:4]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_pagination_stream(httpserver: HTTPServer, prefetch: int):
+    """
+    Tests that only the results of the current page are kept when a response
+    is paginated in streaming mode.
+    """
+    httpserver.expect_request("/pagination/offset").respond_with_handler(offset_handler)
+    limit = 3
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .offset()
+        .get(params={"limit": limit})
+    )
+
+    results = []
+    for result in resp.paginate(prefetch=prefetch, stream=True):
+        assert len(resp._pagination.results) <= limit
+        results.append(result)
+
+    assert results == expected_results
+    assert len(httpserver.log) == math.ceil(len(expected_results) / limit)
+
+    # The consumed results are not kept, so they cannot be iterated again
+    assert list(resp) == []
+
+
+def offset_total_handler(request: Request) -> Response:
+    offset = int(request.args.get("offset", 0))
+    limit = int(request.args["limit"])
+    resp = {
+        "results": expected_results[offset : offset + limit],
+        "total": len(expected_results),
+    }
+    return Response(json.dumps(resp), content_type="application/json")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("prefetch", [1, 4])
+@pytest.mark.parametrize("limit", [1, 3, 5])
+def test_pagination_parallel(limit: int, prefetch: int, stream: bool):
+    """
+    Tests that the pages of a response whose total number of pages is known
+    are requested concurrently and their results are returned in order.
+    """
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def handler(request: Request) -> Response:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        # Give time to the next requests to be sent
+        if int(request.args.get("offset", 0)) > 0:
+            time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return offset_total_handler(request)
+
+    server = HTTPServer(threaded=True)
+    server.expect_request("/pagination/offset_total").respond_with_handler(handler)
+    server.start()
+    try:
+        resp = (
+            API(host=server.url_for(""))
+            .pagination()
+            .offset_total()
+            .get(params={"limit": limit})
+        )
+        results = list(resp.paginate(prefetch=prefetch, stream=stream))
+    finally:
+        server.stop()
+
+    assert results == expected_results
+
+    # Pages are requested until a page is not full
+    offsets = sorted(int(r.args.get("offset", 0)) for r, _ in server.log)
+    assert offsets == [i * limit for i in range(len(expected_results) // limit + 1)]
+
+    # The exact number of concurrent requests depends on the scheduling of
+    # the threads, but it never exceeds the number of pages prefetched
+    total_pages = math.ceil(len(expected_results) / limit)
+    max_concurrent = min(prefetch, total_pages - 1)
+    assert max_in_flight[0] <= max_concurrent
+    if max_concurrent > 1:
+        assert max_in_flight[0] > 1
+
+
+def test_pagination_parallel_not_prefetched(httpserver: HTTPServer):
+    """
+    Tests that the pages of a response whose total number of pages is known
+    are requested one after another if no pages are prefetched.
+    """
+    httpserver.expect_request("/pagination/offset_total").respond_with_handler(
+        offset_total_handler
+    )
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .offset_total()
+        .get(params={"limit": 3})
+    )
+
+    assert list(resp) == expected_results
+    assert len(httpserver.log) == 4
+
+
+def test_pagination_parallel_error(httpserver: HTTPServer):
+    """
+    Tests that an error requesting one of the pages requested concurrently is
+    raised when the page is consumed.
+    """
+
+    def handler(request: Request) -> Response:
+        if int(request.args.get("offset", 0)) == 4:
+            return Response("Oh, no!", content_type="text/html")
+        return offset_total_handler(request)
+
+    httpserver.expect_request("/pagination/offset_total").respond_with_handler(handler)
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .offset_total()
+        .get(params={"limit": 2})
+    )
+
+    results = []
+    with pytest.raises(ResponseError):
+        for result in resp.paginate(prefetch=3):
+            results.append(result)
+
+    assert results == expected_results[:4]
+
+
+def test_pagination_parallel_next_pages(httpserver: HTTPServer):
+    """
+    Tests that only the first page derives the requests of the pages to be
+    requested concurrently.
+    """
+    httpserver.expect_request("/pagination/offset_total").respond_with_handler(
+        offset_total_handler
+    )
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .offset_total()
+        .get(params={"limit": 2})
+    )
+    next_page = resp._pagination.iter_func()
+
+    assert resp._pagination.page_funcs is not None
+    assert next_page._pagination.page_funcs is None
+    assert next_page._pagination.iter_func is not None
+
+
+def test_pagination_prefetcher_finalizer(httpserver: HTTPServer):
+    """
+    Tests that only the finalizer of the current prefetcher is kept, so the
+    finalizers of the replaced prefetchers do not accumulate.
+    """
+    httpserver.expect_request("/pagination/offset_total").respond_with_handler(
+        offset_total_handler
+    )
+    finalizers = []
+    original_finalize = weakref.finalize
+
+    def finalize(*args):
+        finalizers.append(original_finalize(*args))
+        return finalizers[-1]
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .offset_total()
+        .get(params={"limit": 2})
+    )
+    with mock.patch.object(pagination_module.weakref, "finalize", finalize):
+        # The pages known in advance are requested concurrently, and then the
+        # page following the last one is requested by another prefetcher
+        assert list(resp.paginate(prefetch=2)) == expected_results
+
+    assert [f.alive for f in finalizers] == [False, True]
+    assert resp._pagination.prefetcher_finalizer is finalizers[-1]
+
+
+def cursor_total_handler(request: Request) -> Response:
+    start = int(request.args.get("next", 0))
+    end = start + int(request.args["limit"])
+    resp = {
+        "data": expected_results[start:end],
+        "cursors": {"next": str(end) if end < len(expected_results) else None},
+        "total": len(expected_results),
+    }
+    return Response(json.dumps(resp), content_type="application/json")
+
+
+def test_pagination_parallel_response_cursor(httpserver: HTTPServer):
+    """
+    Tests that the pages are requested one after another, even if their total
+    number is known, when the request of each page depends on the previous
+    response (e.g., a cursor).
+    """
+    httpserver.expect_request("/pagination/cursor_total").respond_with_handler(
+        cursor_total_handler
+    )
+
+    resp = (
+        API(host=httpserver.url_for(""))
+        .pagination()
+        .cursor_total()
+        .get(params={"limit": 3})
+    )
+
+    assert resp._pagination.page_funcs is None
+    assert list(resp.paginate(prefetch=3)) == expected_results
+    cursors = [r.args.get("next") for r, _ in httpserver.log]
+    assert cursors == [None, "3", "6", "9"]
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, overload
+
+from ..internal.lazy import lazy_methods
+from ..internal.resource import APIResource
+
+if TYPE_CHECKING:
+    from .employees import _EmployeesMethods
+else:
+    _EmployeesMethods = lazy_methods(
+        __package__, ".employees", "_EmployeesMethods", "employees"
+    )
+
+
+@dataclass
+class Departments1(APIResource, _EmployeesMethods):
+    department_name: str
+
+    def _build_partial_path(self):
+        return f"/departments/{self.department_name}"
+
+
+class _DepartmentsMethods:
+    """
+    This class declares and implements the `departments()` method.
+    """
+
+    @overload
+    def departments(self, department_name: str) -> Departments1: ...
+
+    def departments(self, department_name: str):
+        return Departments1(department_name)._child_of(self)
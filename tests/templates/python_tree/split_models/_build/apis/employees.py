@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_EMPLOYEES1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.Employee),
+        (404, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+@dataclass
+class Employees1(APIResource):
+    employee_num: int
+
+    def get(self, **kwargs) -> Union[models.Employee, models.ErrorResponse]:
+        """
+        Returns one of your company employees
+
+        :return: The API response to the request.
+        :rtype: Union[models.Employee, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _EMPLOYEES1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return f"/employees/{self.employee_num}"
+
+
+_EMPLOYEES2_POST_REQ_CONTENT_TYPES = [
+    ("application/json", models.EmployeeCreate),
+]
+
+_EMPLOYEES2_POST_RESPONSES = ExpectedResponses(
+    [
+        (201, "application/json", models.Employee),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+_EMPLOYEES2_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.EmployeeList),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_EMPLOYEES2_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.next_cursor",
+                "value": "$response.body#/cursors/next",
+            }
+        ],
+        "result": "results",
+        "has_more": "$response.body#/cursors/next",
+        "total_pages": "",
+    }
+)
+
+
+@dataclass
+class Employees2(APIResource):
+
+    def post(
+        self, req: Union[models.EmployeeCreate, dict], **kwargs
+    ) -> Union[models.Employee, models.ErrorResponse]:
+        """
+        Hires a new employee!
+
+        :param req: Request payload.
+        :type req: Union[models.EmployeeCreate, dict]
+        :return: The API response to the request.
+        :rtype: Union[models.Employee, models.ErrorResponse]
+        """
+        resp = self._make_request(
+            "POST", req, req_content_types=_EMPLOYEES2_POST_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _EMPLOYEES2_POST_RESPONSES)
+
+    def get(self, **kwargs) -> Union[models.EmployeeList, models.ErrorResponse]:
+        """
+        Returns all your employees.
+
+        :return: The API response to the request.
+        :rtype: Union[models.EmployeeList, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _EMPLOYEES2_GET_RESPONSES,
+            pagination_info=_EMPLOYEES2_GET_PAGINATION_INFO,
+        )
+
+    def _build_partial_path(self):
+        return "/employees"
+
+
+class _EmployeesMethods:
+    """
+    This class declares and implements the `employees()` method.
+    """
+
+    @overload
+    def employees(self, employee_num: int) -> Employees1: ...
+
+    @overload
+    def employees(self) -> Employees2: ...
+
+    def employees(self, employee_num: int = None):
+        if employee_num is not None:
+            return Employees1(employee_num)._child_of(self)
+
+        if employee_num is None:
+            return Employees2()._child_of(self)
+
+        raise ValueError("Invalid parameters")
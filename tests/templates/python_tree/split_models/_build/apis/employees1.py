@@ -0,0 +1,70 @@
+import json
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_EMPLOYEES1_POST_REQ_CONTENT_TYPES = [
+    ("application/json", models.EmployeeCreate),
+]
+
+_EMPLOYEES1_POST_RESPONSES = ExpectedResponses(
+    [
+        (201, "application/json", models.Employee),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+@dataclass
+class Employees1(APIResource):
+
+    def post(
+        self, employee_id: int, employee_name: str, extra_info, **kwargs
+    ) -> Union[models.Employee, models.ErrorResponse]:
+        """
+        Compounds the request using custom parameters
+
+        :param employee_id: ID of the employee.
+        :param employee_name:
+        :param extra_info:
+        :return: The API response to the request.
+        :rtype: Union[models.Employee, models.ErrorResponse]
+        """
+        req = (
+            '{"number": '
+            + str(employee_id)
+            + ', "name": "'
+            + str(employee_name)
+            + '", "'
+            + str(employee_name)
+            + '": "'
+            + str(self._path_value("company_id"))
+            + '", "extra": '
+            + json.dumps(extra_info)
+            + "}"
+        )
+
+        resp = self._make_request(
+            "POST", req, req_content_types=_EMPLOYEES1_POST_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _EMPLOYEES1_POST_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/employees"
+
+
+class _Employees1Methods:
+    """
+    This class declares and implements the `employees()` method.
+    """
+
+    @overload
+    def employees(self) -> Employees1: ...
+
+    def employees(self):
+        return Employees1()._child_of(self)
@@ -0,0 +1,585 @@
+"""
+This module defines the APIResource class, which is the base class for all API
+resources. It provides methods to build URLs, handle requests and responses,
+and manage the API call stack. It also includes methods for validating request
+payloads and handling pagination.
+
+The AsyncAPIResource class is the counterpart of APIResource used by the
+asynchronous API client.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pyexpat import ExpatError
+from typing import Type, Union, get_args, get_type_hints
+
+import requests
+from requests import HTTPError, PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from ..models.basemodel import APIBaseModel
+from ..models.construct import construct_model
+from ..models.exceptions import ExceptionList, ResponseError
+from ..models.extensions.pagination import PaginationDescription
+from ..models.struct import APIStruct
+from .content_disposition import parse_content_disposition
+from .content_type import (
+    SUPPORTED_REQUEST_CONTENT_TYPES,
+    ContentTypeValidationResult,
+    content_types_compatible,
+    content_types_match,
+)
+from .expected_responses import ExpectedResponses
+from .expressions.runtime import evaluate, prepare_request
+from .response_body import json_body
+
+
+def _is_api(obj):
+    from ..api import API
+
+    return isinstance(obj, API)
+
+
+@dataclass
+class APIResource(ABC):
+    """
+    Abstract class to represent a part of an API call.
+    This must be inherited by any class implementing an API operation.
+    """
+
+    _stack: list = field(default_factory=list, init=False)
+    """
+    A list used to store the objects generated during a call chain.
+    This allows to access all the information needed to make an API request,
+    such as building the request URL.
+
+    Items in the stack can be:
+    - One (and only one) `API` instance. This must be the first item in the
+      stack.
+    - A number of `APIResource` building the request.
+    """
+
+    @abstractmethod
+    def _build_partial_path(self):
+        pass
+
+    def _with_stack(self, stack: list):
+        self._stack = stack
+        return self
+
+    def _child_of(self, obj):
+        """
+        Sets the stack of this instance to a copy of the given `APIResource`
+        stack with the object itself added.
+        This method is used when a new `APIResource` instance is created from
+        another one.
+        """
+        if _is_api(obj):
+            self._stack = [obj]
+        else:
+            self._stack = obj._stack.copy()
+            self._stack.append(obj)
+        return self
+
+    def _build_url(self) -> str:
+        """
+        Builds and returns the URL using all the stack information.
+        The first item in the stack must be an `API` instance, and the rest
+        must be `APIResource` instances.
+        """
+        if len(self._stack) == 0 or not _is_api(self._stack[0]):
+            raise RuntimeError("API instance is missing in the stack")
+
+        return self._stack[0].host.rstrip("/") + self._build_path()
+
+    def _build_path(self) -> str:
+        """
+        Builds the URL path using all the `APIResource` instances in the stack.
+        """
+        path = ""
+        for obj in self._stack:
+            if isinstance(obj, APIResource):
+                path = path + obj._build_partial_path()
+
+        return path + self._build_partial_path()
+
+    def _path_value(self, path_param_name: str):
+        """
+        Returns the value of the given path parameter.
+        """
+        if hasattr(self, path_param_name):
+            return getattr(self, path_param_name)
+
+        for r in self._stack[1:]:
+            if hasattr(r, path_param_name):
+                return getattr(r, path_param_name)
+
+        return None
+
+    def _path_values(self) -> dict:
+        """
+        Returns a dictionary with the values of all the path parameters of the
+        current stack.
+        """
+        values = {k: v for k, v in self.__dict__.items() if k != "_stack"}
+        for r in self._stack[1:]:
+            values.update({k: v for k, v in r.__dict__.items() if k != "_stack"})
+
+        return values
+
+    def _api(self):
+        if len(self._stack) == 0 or not _is_api(self._stack[0]):
+            raise RuntimeError("API instance is missing in the stack")
+        return self._stack[0]
+
+    def _make_request(
+        self, method="GET", body=None, req_content_types: list = None, **kwargs
+    ) -> Response:
+        api = self._api()
+
+        results = _validate_request_payload(
+            body, req_content_types, kwargs.get("headers")
+        )
+
+        forced_content_type = kwargs.get("headers", {}).get("Content-Type")
+        kwargs.pop("headers", None)  # Remove headers from kwargs to avoid duplication
+
+        # If the Content-Type header is not explicitly provided, remove it from
+        # the headers for cases where it should be set automatically (payloads
+        # already serialized are sent as they are, so they keep it)
+        if not forced_content_type:
+            auto_content_types = ["application/json", "multipart/form-data"]
+            if results.type in auto_content_types and not isinstance(
+                results.data, bytes
+            ):
+                results.headers.pop("Content-Type", None)
+
+        return api.make_request(
+            method,
+            self._build_path(),
+            data=results.data,
+            json=results.json,
+            files=results.files,
+            headers=results.headers,
+            **kwargs,
+        )
+
+    def _handle_response(
+        self,
+        response: requests.Response,
+        expected_responses: Union[ExpectedResponses, list],
+        param_types: dict = None,
+        pagination_info: PaginationDescription = None,
+    ):
+        if not isinstance(expected_responses, ExpectedResponses):
+            expected_responses = ExpectedResponses(expected_responses)
+
+        if not expected_responses.is_expected(response.status_code):
+            raise ResponseError(
+                response, f"Unexpected response status code ({response.status_code})"
+            )
+
+        resp_content_type = response.headers.get("content-type", "")
+        expected_response = expected_responses.find(
+            response.status_code, resp_content_type
+        )
+        if expected_response is None:
+            raise ResponseError(
+                response, f"Unexpected response content type ({resp_content_type})"
+            )
+
+        content_type, resp_class = expected_response
+        if content_type:
+            resp_payload = _parse_response_content(response, resp_class)
+            if self._api()._validate_responses:
+                ret = resp_class.parse_obj(resp_payload)
+            else:
+                ret = construct_model(resp_class, resp_payload)
+        else:
+            ret = resp_class()
+
+        ret._set_http_response(response)
+        self._handle_pagination(
+            ret,
+            response,
+            pagination_info,
+            self._path_values(),
+            param_types,
+            expected_responses,
+        )
+
+        return self._handle_error(ret)
+
+    def _handle_error(self, ret):
+        api = self._stack[0]
+        if api._raise_errors:
+            try:
+                ret.http_response().raise_for_status()
+            except HTTPError as e:
+                raise ResponseError(ret, str(e))
+
+        return ret
+
+    def _handle_pagination(
+        self,
+        ret: APIBaseModel,
+        resp: Response,
+        pagination_info: PaginationDescription,
+        path_values: dict,
+        params_info: dict,
+        expected_responses: ExpectedResponses,
+    ):
+        """
+        Add metadata to the returned model object to allow handling pagination.
+        """
+        if pagination_info is None:
+            return None
+
+        if params_info is None:
+            params_info = {}
+
+        ret._enable_pagination(pagination_info.result)
+        ret._pagination.iter_func = None
+
+        query_params = params_info.get("query")
+        headers = params_info.get("header")
+
+        has_more = evaluate(
+            resp, pagination_info.has_more, path_values, query_params, headers
+        )
+        if not has_more:
+            return
+
+        req = _next_page_request(
+            resp, pagination_info, path_values, query_params, headers
+        )
+
+        total_pages = None
+        if pagination_info.total_pages:
+            total_pages = int(
+                evaluate(
+                    resp,
+                    pagination_info.total_pages,
+                    path_values,
+                    query_params,
+                    headers,
+                )
+            )
+            # The next pages must not derive the remaining pages again
+            pagination_info = pagination_info.copy(update={"total_pages": ""})
+
+        ret._pagination.iter_func = self._next_page_func(
+            req, expected_responses, params_info, pagination_info
+        )
+
+        if total_pages is None:
+            return
+
+        # If the request of a page derived from the previous one is the same
+        # (e.g., the modifiers only use a cursor of the response), the pages
+        # cannot be requested concurrently, so they are prefetched sequentially
+        if total_pages > 2:
+            derived_req = _next_page_request(
+                _with_request(resp, req.copy()),
+                pagination_info,
+                path_values,
+                query_params,
+                headers,
+            )
+            if _same_request(req, derived_req):
+                return
+
+        ret._pagination.page_funcs = self._page_funcs(
+            resp,
+            req,
+            total_pages - 1,
+            path_values,
+            expected_responses,
+            params_info,
+            pagination_info,
+        )
+
+    def _page_funcs(
+        self,
+        resp: Response,
+        req: PreparedRequest,
+        count: int,
+        path_values: dict,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        """
+        Yields the functions used to request the given number of pages
+        following the given response, so that they can be requested
+        concurrently.
+
+        The request of each page is derived from the request of the previous
+        one, evaluating the pagination modifiers as if the given response had
+        been received for it, so modifiers can only depend on the request and
+        on the size of a full page.
+        """
+        query_params = params_info.get("query")
+        headers = params_info.get("header")
+
+        for i in range(count):
+            yield self._next_page_func(
+                req, expected_responses, params_info, pagination_info
+            )
+
+            if i < count - 1:
+                req = _next_page_request(
+                    _with_request(resp, req.copy()),
+                    pagination_info,
+                    path_values,
+                    query_params,
+                    headers,
+                )
+
+    def _next_page_func(
+        self,
+        req: PreparedRequest,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        """
+        Returns the function used by the paginator to request the next page.
+        """
+
+        def make_request():
+            api = self._api()
+            new_resp = api.make_request(
+                req.method, req.url, req.body, headers=req.headers
+            )
+            return self._handle_response(
+                new_resp, expected_responses, params_info, pagination_info
+            )
+
+        return make_request
+
+
+class AsyncAPIResource(APIResource):
+    """
+    Abstract class to represent a part of an API call of an asynchronous API
+    client. Requests are sent with the coroutine `make_request()` of the API
+    instance, while responses are handled the same way as in `APIResource`.
+    """
+
+    async def _make_request(
+        self, method="GET", body=None, req_content_types: list = None, **kwargs
+    ) -> Response:
+        return await super()._make_request(method, body, req_content_types, **kwargs)
+
+    async def _handle_response(
+        self,
+        response: requests.Response,
+        expected_responses: Union[ExpectedResponses, list],
+        param_types: dict = None,
+        pagination_info: PaginationDescription = None,
+    ):
+        return super()._handle_response(
+            response, expected_responses, param_types, pagination_info
+        )
+
+    def _next_page_func(
+        self,
+        req: PreparedRequest,
+        expected_responses: ExpectedResponses,
+        params_info: dict,
+        pagination_info: PaginationDescription,
+    ):
+        async def make_request():
+            api = self._api()
+            new_resp = await api.make_request(
+                req.method, req.url, req.body, headers=req.headers
+            )
+            return await self._handle_response(
+                new_resp, expected_responses, params_info, pagination_info
+            )
+
+        return make_request
+
+
+def _next_page_request(
+    resp: Response,
+    pagination_info: PaginationDescription,
+    path_values: dict,
+    query_params: dict,
+    headers: dict,
+) -> PreparedRequest:
+    """
+    Prepares the request of the page following the given response.
+    """
+    req = PreparedRequest()
+    if pagination_info.reuse_previous_request:
+        req = resp.request
+    if pagination_info.url:
+        url = evaluate(resp, pagination_info.url, path_values, query_params, headers)
+        req.prepare_url(url, None)
+    if pagination_info.method:
+        req.prepare_method(pagination_info.method)
+    for modifier in pagination_info.modifiers:
+        value = evaluate(resp, modifier.value, path_values, query_params, headers)
+        prepare_request(req, modifier.param, value)
+
+    return req
+
+
+def _same_request(req1: PreparedRequest, req2: PreparedRequest) -> bool:
+    """
+    Returns whether the given requests would request the same page.
+    """
+    return (req1.method, req1.url, req1.body, req1.headers) == (
+        req2.method,
+        req2.url,
+        req2.body,
+        req2.headers,
+    )
+
+
+def _with_request(resp: Response, req: PreparedRequest) -> Response:
+    """
+    Returns a copy of the given response associated with another request.
+    The copy shares the body (and its decoded value) of the given response.
+    """
+    resp_copy = Response.__new__(Response)
+    resp_copy.__dict__.update(resp.__dict__)
+    resp_copy.request = req
+    return resp_copy
+
+
+def _parse_response_content(response: Response, resp_class: Type[APIBaseModel]):
+    """
+    Parses the response content according to its content type to ensure it
+    matches the expected response class.
+    """
+    resp_content_type = response.headers.get("content-type", "")
+
+    if content_types_match(resp_content_type, "application/json"):
+        return json_body(response)
+
+    if content_types_match(resp_content_type, "application/xml"):
+        import xmltodict
+
+        try:
+            resp_payload = xmltodict.parse(response.content)
+        except ExpatError as e:
+            raise ResponseError(response, f"Invalid XML response: {str(e)}")
+
+        root_name = list(resp_payload.keys())[0]
+        return resp_payload[root_name]
+
+    if content_types_match(resp_content_type, "text/plain"):
+        return response.content.decode("utf-8")
+
+    # To handle files or streams, verify that the response class has a root
+    # type compatible with known file handling types
+    type_hints = get_type_hints(resp_class)
+    if "__root__" in type_hints:
+        root_types = _extract_subtypes(type_hints["__root__"])
+        root_type_names = {t.__name__ for t in root_types if hasattr(t, "__name__")}
+
+        if "FilePayload" in root_type_names:
+            from ..models.primitives import FilePayload
+
+            filename = ""
+            if content_disposition := response.headers.get("Content-Disposition"):
+                if parsed_filename := parse_content_disposition(content_disposition):
+                    filename = parsed_filename
+
+            content = response.content if response._content_consumed else response.raw
+
+            return FilePayload(
+                filename=filename, content_type=resp_content_type, content=content
+            )
+
+        if "IOBase" in root_type_names:
+            return response.raw
+
+        if "bytes" in root_type_names:
+            return response.content
+
+    return None
+
+
+def _extract_subtypes(tp):
+    """Recursively extracts subtypes from a type hint."""
+    args = get_args(tp)
+
+    if not args:
+        return {tp}
+
+    subtypes = set()
+    for arg in args:
+        subtypes.update(_extract_subtypes(arg))
+
+    return subtypes
+
+
+def _validate_request_payload(
+    body: Union[str, bytes, dict, APIBaseModel, APIStruct],
+    req_content_types: list,
+    headers: dict,
+) -> ContentTypeValidationResult:
+    """
+    Tries to parse the request body into one of the supported pairs of
+    content-type / class type. An exception will be returned if the body
+    doesn't match any of the given expected types.
+
+    If req_content_types is None or an empty list, this is a no-op.
+
+    :param body:              Payload of the request.
+    :param req_content_types: List of tuples defining the supported types of the
+                              request. The first element of each tuple is the
+                              Content-Type, and the second one is the class of
+                              the payload model.
+    :param headers:           The headers of the request. If a Content-Type is
+                              set, only the types in req_content_types that
+                              matches that Content-Type will be validated.
+    :return:                  A ContentTypeValidationResult object with request
+                              information prepared for a specific content type.
+    """
+    exceptions_raised = []
+
+    if req_content_types:
+        # If Content-Type header is set, only that one is allowed
+        headers = CaseInsensitiveDict(headers)
+        expected_content_type = headers.get("content-type", None)
+        if expected_content_type:
+            req_content_types = [
+                (content_type, req_class)
+                for content_type, req_class in req_content_types
+                if content_types_match(content_type, expected_content_type)
+            ]
+
+        for content_type, request_class in req_content_types:
+            if (
+                isinstance(body, (APIBaseModel, APIStruct))
+                and type(body) is not request_class
+            ):
+                continue
+
+            for ct, conv_func in SUPPORTED_REQUEST_CONTENT_TYPES.items():
+                if content_types_compatible(content_type, ct):
+                    try:
+                        result = conv_func(body)
+
+                        # If the content types are not an exact match, update the info
+                        # (e.g. application/json to application/json-patch+json)
+                        if not content_types_match(content_type, ct):
+                            result.type = content_type
+                            result.headers["Content-Type"] = content_type
+
+                        # Keep the headers from the request
+                        if headers:
+                            result.headers.update(headers)
+
+                        return result
+                    except (ValueError, ExpatError) as e:
+                        exceptions_raised.append(e)
+
+    if len(exceptions_raised) > 0:
+        raise ExceptionList("Unexpected data format", exceptions_raised)
+
+    return ContentTypeValidationResult(data=body, headers=headers)
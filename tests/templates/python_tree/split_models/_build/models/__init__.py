@@ -0,0 +1,4 @@
+from ..internal.lazy import lazy_attributes
+from .models import __all__
+
+__getattr__, __dir__ = lazy_attributes(__name__, dict.fromkeys(__all__, ".models"))
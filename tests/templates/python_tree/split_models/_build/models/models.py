@@ -0,0 +1,86 @@
+from typing import TYPE_CHECKING
+
+from ..internal.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .schemas.any_value import AnyValue
+    from .schemas.category import Category
+    from .schemas.company import Company
+    from .schemas.company_base import CompanyBase
+    from .schemas.company_create import CompanyCreate
+    from .schemas.company_list import CompanyList
+    from .schemas.company_update import CompanyUpdate
+    from .schemas.cursors import Cursors
+    from .schemas.employee import Employee
+    from .schemas.employee_base import EmployeeBase
+    from .schemas.employee_create import EmployeeCreate
+    from .schemas.employee_list import EmployeeList
+    from .schemas.error_response import ErrorResponse
+    from .schemas.get_array_response_response200 import GetArrayResponseResponse200
+    from .schemas.get_boolean_response_response200 import GetBooleanResponseResponse200
+    from .schemas.get_object_response_response200 import GetObjectResponseResponse200
+    from .schemas.get_test_test_response200 import GetTestTestResponse200
+    from .schemas.get_text_response_request import GetTextResponseRequest
+    from .schemas.get_text_response_response200 import GetTextResponseResponse200
+    from .schemas.op import Op
+    from .schemas.patch_company_request import PatchCompanyRequest
+    from .schemas.patch_company_request_item import PatchCompanyRequestItem
+    from .schemas.post_tests_one_of_request import PostTestsOneOfRequest
+    from .schemas.post_tests_one_of_response200 import PostTestsOneOfResponse200
+
+__all__ = [
+    "AnyValue",
+    "Category",
+    "CompanyBase",
+    "CompanyCreate",
+    "Cursors",
+    "CompanyUpdate",
+    "EmployeeBase",
+    "EmployeeCreate",
+    "ErrorResponse",
+    "GetArrayResponseResponse200",
+    "GetBooleanResponseResponse200",
+    "GetObjectResponseResponse200",
+    "GetTestTestResponse200",
+    "GetTextResponseRequest",
+    "GetTextResponseResponse200",
+    "Op",
+    "PatchCompanyRequestItem",
+    "PatchCompanyRequest",
+    "PostTestsOneOfResponse200",
+    "Company",
+    "CompanyList",
+    "Employee",
+    "EmployeeList",
+    "PostTestsOneOfRequest",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AnyValue": ".schemas.any_value",
+        "Category": ".schemas.category",
+        "CompanyBase": ".schemas.company_base",
+        "CompanyCreate": ".schemas.company_create",
+        "Cursors": ".schemas.cursors",
+        "CompanyUpdate": ".schemas.company_update",
+        "EmployeeBase": ".schemas.employee_base",
+        "EmployeeCreate": ".schemas.employee_create",
+        "ErrorResponse": ".schemas.error_response",
+        "GetArrayResponseResponse200": ".schemas.get_array_response_response200",
+        "GetBooleanResponseResponse200": ".schemas.get_boolean_response_response200",
+        "GetObjectResponseResponse200": ".schemas.get_object_response_response200",
+        "GetTestTestResponse200": ".schemas.get_test_test_response200",
+        "GetTextResponseRequest": ".schemas.get_text_response_request",
+        "GetTextResponseResponse200": ".schemas.get_text_response_response200",
+        "Op": ".schemas.op",
+        "PatchCompanyRequestItem": ".schemas.patch_company_request_item",
+        "PatchCompanyRequest": ".schemas.patch_company_request",
+        "PostTestsOneOfResponse200": ".schemas.post_tests_one_of_response200",
+        "Company": ".schemas.company",
+        "CompanyList": ".schemas.company_list",
+        "Employee": ".schemas.employee",
+        "EmployeeList": ".schemas.employee_list",
+        "PostTestsOneOfRequest": ".schemas.post_tests_one_of_request",
+    },
+)
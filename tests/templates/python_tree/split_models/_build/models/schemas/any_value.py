@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+
+
+class AnyValue(APIBaseModel):
+    __root__: Optional[Any] = Field(
+        None,
+        description="Can be any value - string, number, boolean, array, object or null.",
+    )
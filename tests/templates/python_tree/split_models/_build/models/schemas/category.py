@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class Category(Enum):
+    food = "food"
+    clothing = "clothing"
+    technology = "technology"
+    evil = "evil"
+    stickers = "stickers"
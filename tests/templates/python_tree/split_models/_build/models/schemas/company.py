@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from .company_base import CompanyBase
+
+
+class Company(CompanyBase):
+    created: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
+    modified: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
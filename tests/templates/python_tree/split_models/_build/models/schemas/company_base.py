@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+from .category import Category
+
+
+class CompanyBase(APIBaseModel):
+    category: Optional[Category] = Field(None, example="stickers")
+    id: Optional[str] = Field(
+        None, description="ID of the Company.", example="shiny_stickers"
+    )
+    name: Optional[str] = Field(
+        None, description="Name of the Company.", example="Shiny Stickers"
+    )
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from .company_base import CompanyBase
+
+
+class CompanyCreate(CompanyBase):
+    pass
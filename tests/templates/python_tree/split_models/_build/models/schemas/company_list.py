@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from ..basemodel import APIBaseModel
+from .company import Company
+from .cursors import Cursors
+
+
+class CompanyList(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Company]] = None
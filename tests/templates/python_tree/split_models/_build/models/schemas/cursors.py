@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+
+
+class Cursors(APIBaseModel):
+    next: Optional[str] = Field(None, example="")
+    previous: Optional[str] = Field(None, example="")
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+
+
+class EmployeeBase(APIBaseModel):
+    name: Optional[str] = Field(
+        None, description="Name of the employee.", example="Billy"
+    )
+    number: Optional[int] = Field(
+        None, description="ID number of the employee.", example=17
+    )
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from .employee_base import EmployeeBase
+
+
+class EmployeeCreate(EmployeeBase):
+    pass
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from ..basemodel import APIBaseModel
+from .cursors import Cursors
+from .employee import Employee
+
+
+class EmployeeList(APIBaseModel):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Employee]] = None
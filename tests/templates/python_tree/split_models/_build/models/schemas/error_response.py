@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+
+
+class ErrorResponse(APIBaseModel):
+    message: str = Field(..., example="Oh, no!")
+    status: int = Field(..., example=400)
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from typing import List
+
+from ..basemodel import APIBaseModel
+
+
+class GetArrayResponseResponse200(APIBaseModel):
+    __root__: List[int]
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ..basemodel import APIBaseModel
+
+
+class GetBooleanResponseResponse200(APIBaseModel):
+    __root__: bool
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from pydantic import Extra
+
+from ..basemodel import APIBaseModel
+
+
+class GetObjectResponseResponse200(APIBaseModel):
+    pass
+
+    class Config:
+        extra = Extra.allow
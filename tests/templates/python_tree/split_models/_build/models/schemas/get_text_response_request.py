@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ..basemodel import APIBaseModel
+
+
+class GetTextResponseRequest(APIBaseModel):
+    __root__: str
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class Op(Enum):
+    add = "add"
+    remove = "remove"
+    replace = "replace"
+    move = "move"
+    copy = "copy"
+    test = "test"
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from typing import List
+
+from ..basemodel import APIBaseModel
+from .patch_company_request_item import PatchCompanyRequestItem
+
+
+class PatchCompanyRequest(APIBaseModel):
+    __root__: List[PatchCompanyRequestItem]
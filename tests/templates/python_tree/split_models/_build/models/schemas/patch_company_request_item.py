@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from pydantic import Field
+
+from ..basemodel import APIBaseModel
+from .op import Op
+
+
+class PatchCompanyRequestItem(APIBaseModel):
+    from_: Optional[str] = Field(
+        None, alias="from", description="Used with 'move' and 'copy' operations."
+    )
+    op: Op
+    path: str = Field(
+        ..., description="The path to the property to modify, e.g. '/name'."
+    )
+    value: Optional[Any] = Field(
+        None, description="The value to apply in operations like add/replace/test."
+    )
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from typing import Union
+
+from ..basemodel import APIBaseModel
+from .company import Company
+from .employee import Employee
+
+
+class PostTestsOneOfRequest(APIBaseModel):
+    __root__: Union[Company, Employee]
@@ -0,0 +1,93 @@
+import importlib
+import subprocess
+import sys
+import textwrap
+
+from apier.templates.python_tree.model_generation.split import split_models
+from tests.templates.setup import build_client
+
+build_client("python-tree", ["companies_api.yaml", "split_models.yaml"])
+
+pkg_name = __name__.rsplit(".", 1)[0]
+
+if True:
+    from ._build import models
+    from ._build.models import models as models_index
+
+
+def test_split_models_lazy_import():
+    """
+    Tests that each model is only imported when it is first accessed.
+    """
+    code = f"""
+import sys
+from {pkg_name}._build.api import API
+from {pkg_name}._build import models
+
+schemas = "{pkg_name}._build.models.schemas"
+assert not [m for m in sys.modules if m.startswith(schemas + ".")]
+
+models.Company
+assert schemas + ".company" in sys.modules
+assert schemas + ".company_base" in sys.modules
+assert schemas + ".employee" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_split_models_exports():
+    """
+    Tests that the split models are exported by the models package.
+    """
+    assert models.Company is models_index.Company
+    assert models.Company.__module__.endswith(".schemas.company")
+    assert "Company" in models.__all__
+    assert "Employee" in dir(models)
+
+    company = models.Company.parse_obj({"id": "acme", "category": "food"})
+    assert company.category is models.Category.food
+
+
+def test_split_models_dependencies(tmp_path, monkeypatch):
+    """
+    Tests that models depending on each other are kept in the same module,
+    and that the other modules import them.
+    """
+    package_path = tmp_path / "split_pkg"
+    package_path.mkdir()
+    (package_path / "__init__.py").touch()
+    (package_path / "models.py").write_text(textwrap.dedent("""
+        from __future__ import annotations
+
+        from typing import List, Optional
+
+        from pydantic import BaseModel
+
+
+        class Node(BaseModel):
+            children: List[Edge] = []
+
+
+        class Edge(BaseModel):
+            target: Optional['Node'] = None
+
+
+        class Graph(BaseModel):
+            root: Node
+
+
+        Node.update_forward_refs()
+        Edge.update_forward_refs()
+        """))
+
+    split_models(str(package_path / "models.py"))
+
+    modules = sorted(p.name for p in (package_path / "schemas").glob("*.py"))
+    assert modules == ["__init__.py", "graph.py", "node.py"]
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    graph_module = importlib.import_module("split_pkg.schemas.graph")
+    graph = graph_module.Graph.parse_obj(
+        {"root": {"children": [{"target": {"children": []}}]}}
+    )
+    assert graph.root.children[0].target.children == []
@@ -0,0 +1,277 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.lazy import lazy_methods
+from ..internal.resource import APIResource
+from ..models import models, primitives
+from ..models.extensions.pagination import PaginationDescription
+
+if TYPE_CHECKING:
+    from .departments import _DepartmentsMethods
+    from .employees import _EmployeesMethods
+else:
+    _EmployeesMethods = lazy_methods(
+        __package__, ".employees", "_EmployeesMethods", "employees"
+    )
+    _DepartmentsMethods = lazy_methods(
+        __package__, ".departments", "_DepartmentsMethods", "departments"
+    )
+
+
+_COMPANIES1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.Company),
+        (200, "application/xml", models.Company),
+        (404, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+@dataclass
+class Companies1(APIResource):
+    company_id: str
+    number: int
+
+    def get(self, **kwargs) -> Union[models.Company, models.ErrorResponse]:
+        """
+        An endpoint used to test multiple path parameters in the same layer.
+
+        :return: The API response to the request.
+        :rtype: Union[models.Company, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _COMPANIES1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return f"/companies/{self.company_id}/{self.number}"
+
+
+_COMPANIES2_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.Company),
+        (404, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_COMPANIES2_PUT_REQ_CONTENT_TYPES = [
+    ("application/json", models.CompanyUpdate),
+]
+
+_COMPANIES2_PUT_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.Company),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_COMPANIES2_PATCH_REQ_CONTENT_TYPES = [
+    ("application/json-patch+json", models.PatchCompanyRequest),
+]
+
+_COMPANIES2_PATCH_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.Company),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+_COMPANIES2_DELETE_RESPONSES = ExpectedResponses(
+    [
+        (204, "", primitives.NoResponse),
+        (404, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+@dataclass
+class Companies2(APIResource, _EmployeesMethods, _DepartmentsMethods):
+    company_id: str
+
+    def get(self, **kwargs) -> Union[models.Company, models.ErrorResponse]:
+        """
+        Returns a company by its ID.
+
+        :return: The API response to the request.
+        :rtype: Union[models.Company, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _COMPANIES2_GET_RESPONSES)
+
+    def put(
+        self, req: Union[models.CompanyUpdate, dict], **kwargs
+    ) -> Union[models.Company, models.ErrorResponse]:
+        """
+        Updates an exising company.
+
+        :param req: Request payload.
+        :type req: Union[models.CompanyUpdate, dict]
+        :return: The API response to the request.
+        :rtype: Union[models.Company, models.ErrorResponse]
+        """
+        resp = self._make_request(
+            "PUT", req, req_content_types=_COMPANIES2_PUT_REQ_CONTENT_TYPES, **kwargs
+        )
+        return self._handle_response(resp, _COMPANIES2_PUT_RESPONSES)
+
+    def patch(
+        self, req: Union[models.PatchCompanyRequest, list], **kwargs
+    ) -> Union[models.Company, models.ErrorResponse]:
+        """
+        Patches an existing company.
+
+        :param req: Request payload.
+        :type req: Union[models.PatchCompanyRequest, list]
+        :return: The API response to the request.
+        :rtype: Union[models.Company, models.ErrorResponse]
+        """
+        resp = self._make_request(
+            "PATCH",
+            req,
+            req_content_types=_COMPANIES2_PATCH_REQ_CONTENT_TYPES,
+            **kwargs,
+        )
+        return self._handle_response(resp, _COMPANIES2_PATCH_RESPONSES)
+
+    def delete(self, **kwargs) -> primitives.NoResponse:
+        """
+        Deletes a company :(
+
+        :return: The API response to the request.
+        :rtype: primitives.NoResponse
+        """
+        resp = self._make_request("DELETE", **kwargs)
+        return self._handle_response(resp, _COMPANIES2_DELETE_RESPONSES)
+
+    def _build_partial_path(self):
+        return f"/companies/{self.company_id}"
+
+
+_COMPANIES3_CREATE_REQ_CONTENT_TYPES = [
+    ("application/json", models.CompanyCreate),
+    ("application/xml", models.CompanyCreate),
+    ("application/x-www-form-urlencoded", models.CompanyCreate),
+]
+
+_COMPANIES3_CREATE_RESPONSES = ExpectedResponses(
+    [
+        (0, "*/*", models.AnyValue),
+        (201, "application/json", models.Company),
+        (400, "application/json", models.ErrorResponse),
+        (409, "application/json", models.ErrorResponse),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+
+_COMPANIES3_LIST_COMPANIES_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.CompanyList),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_COMPANIES3_LIST_COMPANIES_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.next_cursor",
+                "value": "$response.body#/cursors/next",
+            }
+        ],
+        "result": "results",
+        "has_more": "$response.body#/cursors/next",
+        "total_pages": "",
+    }
+)
+
+_COMPANIES3_LIST_COMPANIES_PARAM_TYPES = {
+    "query": {
+        "name": str,
+    },
+}
+
+
+@dataclass
+class Companies3(APIResource):
+
+    def create(
+        self, req: Union[models.CompanyCreate, dict], **kwargs
+    ) -> Union[models.AnyValue, models.Company, models.ErrorResponse]:
+        """
+        Creates a new Company and expands your capitalist empire.
+
+        :param req: Request payload.
+        :type req: Union[models.CompanyCreate, dict]
+        :return: The API response to the request.
+        :rtype: Union[models.AnyValue, models.Company, models.ErrorResponse]
+        """
+        resp = self._make_request(
+            "POST",
+            req,
+            req_content_types=_COMPANIES3_CREATE_REQ_CONTENT_TYPES,
+            **kwargs,
+        )
+        return self._handle_response(resp, _COMPANIES3_CREATE_RESPONSES)
+
+    def list_companies(
+        self, **kwargs
+    ) -> Union[models.CompanyList, models.ErrorResponse]:
+        """
+        Returns all your companies.
+
+        Query parameters:
+         - `name` _(str)_: Filters companies by name.
+
+        :return: The API response to the request.
+        :rtype: Union[models.CompanyList, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _COMPANIES3_LIST_COMPANIES_RESPONSES,
+            pagination_info=_COMPANIES3_LIST_COMPANIES_PAGINATION_INFO,
+            param_types=_COMPANIES3_LIST_COMPANIES_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/companies"
+
+
+class _CompaniesMethods:
+    """
+    This class declares and implements the `companies()` method.
+    """
+
+    @overload
+    def companies(self, company_id: str, number: int) -> Companies1: ...
+
+    @overload
+    def companies(self, company_id: str) -> Companies2: ...
+
+    @overload
+    def companies(self) -> Companies3: ...
+
+    def companies(self, company_id: str = None, number: int = None):
+        if company_id is not None and number is not None:
+            return Companies1(company_id, number)._child_of(self)
+
+        if company_id is not None:
+            return Companies2(company_id)._child_of(self)
+
+        if company_id is None and number is None:
+            return Companies3()._child_of(self)
+
+        raise ValueError("Invalid parameters")
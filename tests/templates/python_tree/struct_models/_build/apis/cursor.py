@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_CURSOR1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PageCursor),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_CURSOR1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.next",
+                "value": "$response.body#/cursors/next",
+            }
+        ],
+        "result": "#data",
+        "has_more": "$response.body#/cursors/next",
+        "total_pages": "",
+    }
+)
+
+_CURSOR1_GET_PARAM_TYPES = {
+    "query": {
+        "next": str,
+        "limit": int,
+    },
+}
+
+
+@dataclass
+class Cursor1(APIResource):
+
+    def get(self, **kwargs) -> Union[models.PageCursor, models.ErrorResponse]:
+        """
+        Returns a cursor-paginated list of responses.
+
+        Query parameters:
+         - `next` _(str)_:
+         - `limit` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PageCursor, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _CURSOR1_GET_RESPONSES,
+            pagination_info=_CURSOR1_GET_PAGINATION_INFO,
+            param_types=_CURSOR1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/cursor"
+
+
+class _CursorMethods:
+    """
+    This class declares and implements the `cursor()` method.
+    """
+
+    @overload
+    def cursor(self) -> Cursor1: ...
+
+    def cursor(self):
+        return Cursor1()._child_of(self)
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_CURSOR_TOTAL1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PageCursorTotal),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_CURSOR_TOTAL1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.next",
+                "value": "$response.body#/cursors/next",
+            }
+        ],
+        "result": "#data",
+        "has_more": "$response.body#/cursors/next",
+        "total_pages": "$eval(ceil({$response.body#/total} / {$request.query.limit}))",
+    }
+)
+
+_CURSOR_TOTAL1_GET_PARAM_TYPES = {
+    "query": {
+        "next": str,
+        "limit": int,
+    },
+}
+
+
+@dataclass
+class CursorTotal1(APIResource):
+
+    def get(self, **kwargs) -> Union[models.PageCursorTotal, models.ErrorResponse]:
+        """
+        Returns a cursor-paginated list of responses including the total
+        number of results.
+
+        Query parameters:
+         - `next` _(str)_:
+         - `limit` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PageCursorTotal, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _CURSOR_TOTAL1_GET_RESPONSES,
+            pagination_info=_CURSOR_TOTAL1_GET_PAGINATION_INFO,
+            param_types=_CURSOR_TOTAL1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/cursor_total"
+
+
+class _CursorTotalMethods:
+    """
+    This class declares and implements the `cursor_total()` method.
+    """
+
+    @overload
+    def cursor_total(self) -> CursorTotal1: ...
+
+    def cursor_total(self):
+        return CursorTotal1()._child_of(self)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ECHO_OBJECT1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.GetObjectResponseResponse200),
+    ]
+)
+
+
+@dataclass
+class EchoObject1(APIResource):
+
+    def get(self, **kwargs) -> models.GetObjectResponseResponse200:
+        """
+        Returns an object response
+
+        :return: The API response to the request.
+        :rtype: models.GetObjectResponseResponse200
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _ECHO_OBJECT1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/echo_object"
+
+
+class _EchoObjectMethods:
+    """
+    This class declares and implements the `echo_object()` method.
+    """
+
+    @overload
+    def echo_object(self) -> EchoObject1: ...
+
+    def echo_object(self):
+        return EchoObject1()._child_of(self)
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_ECHO_STRING1_POST_REQ_CONTENT_TYPES = [
+    ("text/plain", models.GetTextResponseRequest),
+]
+
+_ECHO_STRING1_POST_RESPONSES = ExpectedResponses(
+    [
+        (200, "text/plain", models.GetTextResponseResponse200),
+    ]
+)
+
+
+@dataclass
+class EchoString1(APIResource):
+
+    def post(
+        self, req: Union[models.GetTextResponseRequest, str], **kwargs
+    ) -> models.GetTextResponseResponse200:
+        """
+        Returns a text response (string)
+
+        :param req: Request payload.
+        :type req: Union[models.GetTextResponseRequest, str]
+        :return: The API response to the request.
+        :rtype: models.GetTextResponseResponse200
+        """
+        resp = self._make_request(
+            "POST",
+            req,
+            req_content_types=_ECHO_STRING1_POST_REQ_CONTENT_TYPES,
+            **kwargs
+        )
+        return self._handle_response(resp, _ECHO_STRING1_POST_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/echo_string"
+
+
+class _EchoStringMethods:
+    """
+    This class declares and implements the `echo_string()` method.
+    """
+
+    @overload
+    def echo_string(self) -> EchoString1: ...
+
+    def echo_string(self):
+        return EchoString1()._child_of(self)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Union, overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+from ..models.extensions.pagination import PaginationDescription
+
+_OFFSET1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.PageOffset),
+        (500, "application/json", models.ErrorResponse),
+    ]
+)
+
+_OFFSET1_GET_PAGINATION_INFO = PaginationDescription.parse_obj(
+    {
+        "reuse_previous_request": True,
+        "method": "",
+        "url": "",
+        "modifiers": [
+            {
+                "op": "set",
+                "param": "$request.query.offset",
+                "value": "$eval({$request.query.offset ?? 0} + len({#results}))",
+            }
+        ],
+        "result": "#results",
+        "has_more": "$eval(len({$response.body#/results}) >= {$request.query.limit})",
+        "total_pages": "",
+    }
+)
+
+_OFFSET1_GET_PARAM_TYPES = {
+    "query": {
+        "offset": int,
+        "limit": int,
+    },
+}
+
+
+@dataclass
+class Offset1(APIResource):
+
+    def get(self, **kwargs) -> Union[models.PageOffset, models.ErrorResponse]:
+        """
+        Returns an offset-paginated list of responses.
+
+        Query parameters:
+         - `offset` _(int)_:
+         - `limit` _(int)_:
+
+        :return: The API response to the request.
+        :rtype: Union[models.PageOffset, models.ErrorResponse]
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(
+            resp,
+            _OFFSET1_GET_RESPONSES,
+            pagination_info=_OFFSET1_GET_PAGINATION_INFO,
+            param_types=_OFFSET1_GET_PARAM_TYPES,
+        )
+
+    def _build_partial_path(self):
+        return "/offset"
+
+
+class _OffsetMethods:
+    """
+    This class declares and implements the `offset()` method.
+    """
+
+    @overload
+    def offset(self) -> Offset1: ...
+
+    def offset(self):
+        return Offset1()._child_of(self)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, overload
+
+from ..internal.lazy import lazy_methods
+from ..internal.resource import APIResource
+
+if TYPE_CHECKING:
+    from .echo_array import _EchoArrayMethods
+    from .echo_bool import _EchoBoolMethods
+    from .echo_object import _EchoObjectMethods
+    from .echo_string import _EchoStringMethods
+    from .echo_xml import _EchoXmlMethods
+    from .employees1 import _Employees1Methods
+    from .one_of import _OneOfMethods
+    from .tests1 import _Tests1Methods
+else:
+    _Employees1Methods = lazy_methods(
+        __package__, ".employees1", "_Employees1Methods", "employees"
+    )
+    _EchoArrayMethods = lazy_methods(
+        __package__, ".echo_array", "_EchoArrayMethods", "echo_array"
+    )
+    _EchoBoolMethods = lazy_methods(
+        __package__, ".echo_bool", "_EchoBoolMethods", "echo_bool"
+    )
+    _EchoObjectMethods = lazy_methods(
+        __package__, ".echo_object", "_EchoObjectMethods", "echo_object"
+    )
+    _EchoStringMethods = lazy_methods(
+        __package__, ".echo_string", "_EchoStringMethods", "echo_string"
+    )
+    _EchoXmlMethods = lazy_methods(
+        __package__, ".echo_xml", "_EchoXmlMethods", "echo_xml"
+    )
+    _OneOfMethods = lazy_methods(__package__, ".one_of", "_OneOfMethods", "one_of")
+    _Tests1Methods = lazy_methods(__package__, ".tests1", "_Tests1Methods", "tests")
+
+
+@dataclass
+class Tests1(APIResource, _Employees1Methods):
+    company_id: str
+
+    def _build_partial_path(self):
+        return f"/tests/{self.company_id}"
+
+
+@dataclass
+class Tests2(
+    APIResource,
+    _EchoArrayMethods,
+    _EchoBoolMethods,
+    _EchoObjectMethods,
+    _EchoStringMethods,
+    _EchoXmlMethods,
+    _OneOfMethods,
+    _Tests1Methods,
+):
+
+    def _build_partial_path(self):
+        return "/tests"
+
+
+class _TestsMethods:
+    """
+    This class declares and implements the `tests()` method.
+    """
+
+    @overload
+    def tests(self, company_id: str) -> Tests1: ...
+
+    @overload
+    def tests(self) -> Tests2: ...
+
+    def tests(self, company_id: str = None):
+        if company_id is not None:
+            return Tests1(company_id)._child_of(self)
+
+        if company_id is None:
+            return Tests2()._child_of(self)
+
+        raise ValueError("Invalid parameters")
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import overload
+
+from ..internal.expected_responses import ExpectedResponses
+from ..internal.resource import APIResource
+from ..models import models
+
+_TESTS1_GET_RESPONSES = ExpectedResponses(
+    [
+        (200, "application/json", models.GetTestTestResponse200),
+    ]
+)
+
+
+@dataclass
+class Tests1(APIResource):
+
+    def get(self, **kwargs) -> models.GetTestTestResponse200:
+        """
+        Endpoint with duplicated layer names
+
+        :return: The API response to the request.
+        :rtype: models.GetTestTestResponse200
+        """
+        resp = self._make_request("GET", **kwargs)
+        return self._handle_response(resp, _TESTS1_GET_RESPONSES)
+
+    def _build_partial_path(self):
+        return "/tests"
+
+
+class _Tests1Methods:
+    """
+    This class declares and implements the `tests()` method.
+    """
+
+    @overload
+    def tests(self) -> Tests1: ...
+
+    def tests(self):
+        return Tests1()._child_of(self)
@@ -0,0 +1,135 @@
+"""
+This module defines the JSON codec used by the client to decode the bodies of
+responses and to encode the bodies of requests. orjson is used if it is
+installed, and the standard json module otherwise. A different codec can be
+set with `set_json_codec()`.
+"""
+
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+from requests.exceptions import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONLoads = Callable[[Union[str, bytes]], Any]
+"""Decodes a JSON document given as a string or UTF-8 bytes."""
+
+JSONDumps = Callable[..., bytes]
+"""
+Encodes an object as UTF-8 JSON bytes. It receives the object and the keyword
+argument `default`, a function called for objects that cannot be serialized
+otherwise (or None).
+"""
+
+
+def stdlib_loads(s: Union[str, bytes]) -> Any:
+    return json.loads(s)
+
+
+def stdlib_dumps(obj, default: Optional[Callable] = None) -> bytes:
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+# Values accepted by the json module but rejected by orjson. Documents are
+# only decoded again by the json module if orjson fails on one of them, or if
+# they are not strings, so the json module raises its error
+_STDLIB_ONLY_VALUES = ("NaN", "Infinity", "-Infinity")
+_STDLIB_ONLY_ERRORS = ("infinity", "surrogate")
+
+
+def orjson_loads(s: Union[str, bytes]) -> Any:
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError as e:
+        if isinstance(s, (str, bytes)) and not (
+            e.doc.startswith(_STDLIB_ONLY_VALUES, e.pos)
+            or any(error in e.msg for error in _STDLIB_ONLY_ERRORS)
+        ):
+            raise
+        return json.loads(s)
+
+
+def orjson_dumps(obj, default: Optional[Callable] = None) -> bytes:
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # E.g., integers larger than 64 bits
+        return stdlib_dumps(obj, default=default)
+
+
+def default_json_codec() -> Tuple[JSONLoads, JSONDumps]:
+    """
+    Returns the default JSON codec as a tuple with its decoding and encoding
+    functions: orjson if it is installed, and the json module otherwise.
+    """
+    if orjson is not None:
+        return orjson_loads, orjson_dumps
+    return stdlib_loads, stdlib_dumps
+
+
+_loads, _dumps = default_json_codec()
+
+
+def set_json_codec(loads: JSONLoads = None, dumps: JSONDumps = None):
+    """
+    Sets the JSON codec used by the client. It applies to all the API
+    instances.
+
+    :param loads: The function used to decode JSON documents given as a
+                  string or UTF-8 bytes. If None, the default one is used.
+    :param dumps: The function used to encode objects as UTF-8 JSON bytes. It
+                  must accept the keyword argument `default`, which is a
+                  function called for objects that cannot be serialized
+                  otherwise (or None). If None, the default one is used.
+    """
+    global _loads, _dumps
+
+    default_loads, default_dumps = default_json_codec()
+    _loads = loads or default_loads
+    _dumps = dumps or default_dumps
+
+
+def get_json_codec() -> Tuple[JSONLoads, JSONDumps]:
+    """
+    Returns the JSON codec used by the client as a tuple with its decoding and
+    encoding functions.
+    """
+    return _loads, _dumps
+
+
+def loads(s: Union[str, bytes]) -> Any:
+    """
+    Decodes the given JSON document using the current codec.
+
+    :raises requests.exceptions.JSONDecodeError: If the document is not
+        valid JSON, whatever the codec.
+    """
+    try:
+        return _loads(s)
+    except JSONDecodeError:
+        raise
+    except ValueError as e:
+        raise _decode_error(e, s) from e
+
+
+def _decode_error(error: ValueError, s: Union[str, bytes]) -> JSONDecodeError:
+    """
+    Returns the error raised for a JSON document that the codec failed to
+    decode with the given error, as `Response.json()` does.
+    """
+    if isinstance(error, json.JSONDecodeError):
+        return JSONDecodeError(error.msg, error.doc, error.pos)
+    if isinstance(s, bytes):
+        s = s.decode("utf-8", errors="replace")
+    return JSONDecodeError(str(error), s, 0)
+
+
+def dumps(obj, default: Optional[Callable] = None) -> bytes:
+    """
+    Encodes the given object as UTF-8 JSON bytes using the current codec.
+    """
+    return _dumps(obj, default=default)
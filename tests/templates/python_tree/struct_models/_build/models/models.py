@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional, Union
+
+from pydantic import Extra
+
+from .struct import APIStruct, Field
+
+
+class AnyValue(APIStruct):
+    __root__: Optional[Any] = Field(
+        None,
+        description="Can be any value - string, number, boolean, array, object or null.",
+    )
+
+
+class Category(Enum):
+    food = "food"
+    clothing = "clothing"
+    technology = "technology"
+    evil = "evil"
+    stickers = "stickers"
+
+
+class CompanyBase(APIStruct):
+    category: Optional[Category] = Field(None, example="stickers")
+    id: Optional[str] = Field(
+        None, description="ID of the Company.", example="shiny_stickers"
+    )
+    name: Optional[str] = Field(
+        None, description="Name of the Company.", example="Shiny Stickers"
+    )
+
+
+class CompanyCreate(CompanyBase):
+    pass
+
+
+class Cursors(APIStruct):
+    next: Optional[str] = Field(None, example="")
+    previous: Optional[str] = Field(None, example="")
+
+
+class CompanyUpdate(CompanyBase):
+    pass
+
+
+class EmployeeBase(APIStruct):
+    name: Optional[str] = Field(
+        None, description="Name of the employee.", example="Billy"
+    )
+    number: Optional[int] = Field(
+        None, description="ID number of the employee.", example=17
+    )
+
+
+class EmployeeCreate(EmployeeBase):
+    pass
+
+
+class ErrorResponse(APIStruct):
+    message: str = Field(..., example="Oh, no!")
+    status: int = Field(..., example=400)
+
+
+class GetArrayResponseResponse200(APIStruct):
+    __root__: List[int]
+
+
+class GetBooleanResponseResponse200(APIStruct):
+    __root__: bool
+
+
+class GetObjectResponseResponse200(APIStruct):
+    pass
+
+    class Config:
+        extra = Extra.allow
+
+
+class GetTestTestResponse200(APIStruct):
+    pass
+
+
+class GetTextResponseRequest(APIStruct):
+    __root__: str
+
+
+class GetTextResponseResponse200(APIStruct):
+    __root__: str
+
+
+class Cursors2(APIStruct):
+    next: Optional[str] = None
+    previous: Optional[str] = None
+
+
+class PageCursor(APIStruct):
+    cursors: Optional[Cursors2] = None
+    data: Optional[List] = None
+
+
+class Cursors3(APIStruct):
+    next: Optional[str] = None
+
+
+class PageCursorTotal(APIStruct):
+    cursors: Optional[Cursors3] = None
+    data: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PageNextUrl(APIStruct):
+    next_page_url: Optional[str] = None
+    results: Optional[List] = None
+
+
+class PageOffset(APIStruct):
+    results: Optional[List] = None
+
+
+class PageOffsetTotal(APIStruct):
+    results: Optional[List] = None
+    total: Optional[int] = None
+
+
+class PagePage(APIStruct):
+    results: Optional[List] = None
+
+
+class Op(Enum):
+    add = "add"
+    remove = "remove"
+    replace = "replace"
+    move = "move"
+    copy = "copy"
+    test = "test"
+
+
+class PatchCompanyRequestItem(APIStruct):
+    from_: Optional[str] = Field(
+        None, alias="from", description="Used with 'move' and 'copy' operations."
+    )
+    op: Op
+    path: str = Field(
+        ..., description="The path to the property to modify, e.g. '/name'."
+    )
+    value: Optional[Any] = Field(
+        None, description="The value to apply in operations like add/replace/test."
+    )
+
+
+class PatchCompanyRequest(APIStruct):
+    __root__: List[PatchCompanyRequestItem]
+
+
+class PostTestsOneOfResponse200(APIStruct):
+    __root__: str
+
+
+class Result(APIStruct):
+    value: Optional[Any] = Field(None, description="Value.")
+
+
+class Company(CompanyBase):
+    created: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
+    modified: Optional[datetime] = Field(None, example="2023-06-19T21:00:00Z")
+
+
+class CompanyList(APIStruct):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Company]] = None
+
+
+class Employee(EmployeeBase):
+    pass
+
+
+class EmployeeList(APIStruct):
+    cursors: Optional[Cursors] = None
+    results: Optional[List[Employee]] = None
+
+
+class PostTestsOneOfRequest(APIStruct):
+    __root__: Union[Company, Employee]
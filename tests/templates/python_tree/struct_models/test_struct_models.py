@@ -0,0 +1,181 @@
+import json
+from unittest import mock
+
+import pytest
+from pydantic import ValidationError
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from tests.templates.setup import build_client
+from ..common import json_request_args, make_response
+
+build_client(
+    "python-tree",
+    ["companies_api.yaml", "pagination_api.yaml", "struct_models.yaml"],
+)
+
+pkg_name = __name__.rsplit(".", 1)[0]
+request_mock_pkg = f"{pkg_name}._build.api.requests.Session.request"
+
+if True:
+    from ._build.api import API
+    from ._build.security import BearerToken
+    from ._build.models.construct import construct_model
+    from ._build.models.exceptions import ResponseError
+    from ._build.models.models import (
+        Category,
+        Company,
+        CompanyCreate,
+        CompanyList,
+        ErrorResponse,
+        Op,
+        PatchCompanyRequest,
+        PatchCompanyRequestItem,
+    )
+    from ._build.models.struct import APIStruct
+
+test_company = {
+    "id": "shiny_stickers",
+    "name": "Shiny Stickers Corporation",
+    "category": "stickers",
+    "created": "2023-06-19T21:00:00+00:00",
+    "modified": None,
+}
+
+
+def test_struct_models():
+    """
+    Tests that the models are slotted structs that are parsed and serialized
+    like pydantic models.
+    """
+    company = Company.parse_obj(test_company)
+
+    assert isinstance(company, APIStruct)
+    assert not hasattr(company, "__dict__")
+    assert company.category is Category.stickers
+    assert company.created.year == 2023
+    assert company == Company(**test_company)
+    assert company == test_company | {
+        "category": Category.stickers,
+        "created": company.created,
+    }
+    assert json.loads(company.json(by_alias=True)) == test_company
+
+    company.name = "Stickers"
+    assert company.name == "Stickers"
+    with pytest.raises(AttributeError):
+        company.foo = "bar"
+
+    companies = CompanyList.parse_obj({"results": [test_company]})
+    assert companies.results == [Company.parse_obj(test_company)]
+    assert companies.cursors is None
+
+
+def test_struct_models_root():
+    """
+    Tests models with a custom root type and field aliases.
+    """
+    patch = PatchCompanyRequest.parse_obj(
+        [{"op": "copy", "from": "/name", "path": "/id"}]
+    )
+
+    item = PatchCompanyRequestItem(op=Op.copy, path="/id", **{"from": "/name"})
+    assert patch[0] == item
+    assert patch[0].from_ == "/name"
+    assert len(patch) == 1
+    assert patch.dict(by_alias=True, exclude_none=True) == [
+        {"op": Op.copy, "from": "/name", "path": "/id"}
+    ]
+
+
+@pytest.mark.parametrize(
+    "data, error_locs",
+    [
+        ({"message": "Oh, no!"}, [("status",)]),
+        ({"message": 1, "status": "400"}, [("message",), ("status",)]),
+        ([{"message": "Oh, no!", "status": 400}], [("__root__",)]),
+    ],
+)
+def test_struct_models_validation(data, error_locs):
+    """
+    Tests that invalid values raise pydantic validation errors.
+    """
+    with pytest.raises(ValidationError) as e:
+        ErrorResponse.parse_obj(data)
+
+    assert [err["loc"] for err in e.value.errors()] == error_locs
+
+
+def test_struct_models_construct():
+    """
+    Tests that models are built from trusted data with the decoder that does
+    not check the JSON types.
+    """
+    data = {"results": [test_company], "cursors": {"next": "abc"}}
+
+    companies = construct_model(CompanyList, data)
+
+    assert companies == CompanyList.parse_obj(data)
+    assert companies.results[0].category is Category.stickers
+    assert companies.cursors.next == "abc"
+
+
+def test_struct_models_request():
+    """
+    Tests that models are sent serialized as JSON, and that responses are
+    parsed as structs that keep their HTTP response.
+    """
+    req = CompanyCreate(id="shiny_stickers", category="stickers")
+    expected_raw_resp = make_response(201, test_company)
+
+    with mock.patch(request_mock_pkg, return_value=expected_raw_resp) as m:
+        resp = (
+            API(host="test-api.com")
+            .with_security(BearerToken("token"))
+            .companies()
+            .create(req)
+        )
+
+    assert m.call_args.kwargs["data"] == json_request_args(req, {})["data"]
+    assert isinstance(resp, Company)
+    assert resp.http_response() is expected_raw_resp
+    assert resp.id == "shiny_stickers"
+
+
+def test_struct_models_error_response():
+    """
+    Tests that error responses are raised with their parsed struct.
+    """
+    error = {"message": "Company not found!", "status": 404}
+    expected_raw_resp = make_response(404, error)
+
+    with mock.patch(request_mock_pkg, return_value=expected_raw_resp):
+        with pytest.raises(ResponseError) as e:
+            API(host="test-api.com").companies("shiny_stickers").get()
+
+    assert e.value.error == ErrorResponse.parse_obj(error)
+    assert e.value.error.http_response() is expected_raw_resp
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_struct_models_pagination(httpserver: HTTPServer, prefetch: int):
+    """
+    Tests that responses of struct models can be paginated.
+    """
+    expected_results = [{"value": i} for i in range(5)]
+
+    def handler(request: Request) -> Response:
+        offset = int(request.args.get("offset", 0))
+        limit = int(request.args["limit"])
+        resp = {"results": expected_results[offset : offset + limit]}
+        return Response(json.dumps(resp), content_type="application/json")
+
+    httpserver.expect_request("/pagination/offset").respond_with_handler(handler)
+
+    resp = (
+        API(host=httpserver.url_for("")).pagination().offset().get(params={"limit": 2})
+    )
+
+    assert list(resp.paginate(prefetch=prefetch)) == expected_results
+    assert list(resp) == expected_results
+    assert len(httpserver.log) == 3
@@ -1,13 +1,16 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 import pytest
 
 from tests.templates.setup import build_client
-from .common import make_response, to_dict
+from .common import json_request_args, make_response
 
 build_client("python-tree", "companies_api.yaml")
 if True:
     from ._build.api import API
+    from ._build.models.models import CompanyCreate
     from ._build.security import BearerToken
 
 
@@ -27,7 +30,7 @@ def test_make_request(verify):
 
     expected_resp = make_response(200, expected_resp_payload)
 
-    with mock.patch("requests.request", return_value=expected_resp) as m:
+    with mock.patch("requests.Session.request", return_value=expected_resp) as m:
         resp = API(host="test-api.com", verify=verify).make_request(
             "POST", "/info", json=req_payload, auth=False
         )
@@ -36,10 +39,8 @@ def test_make_request(verify):
         "POST",
         "https://test-api.com/info",
         params={},
-        headers={},
-        data=[],
+        **json_request_args(req_payload, {}),
         files=None,
-        json=to_dict(req_payload),
         timeout=3,
         verify=verify,
     )
@@ -48,6 +49,31 @@ def test_make_request(verify):
     assert resp.json() == expected_resp_payload
 
 
+@pytest.mark.parametrize("payload_arg", ["data", "json"])
+def test_make_request_model(payload_arg):
+    """
+    Makes a request to the API sending a model, which is encoded with the JSON
+    codec.
+    """
+    req_payload = CompanyCreate(name="Shiny Stickers")
+    expected_resp = make_response(200, {})
+
+    with mock.patch("requests.Session.request", return_value=expected_resp) as m:
+        API(host="test-api.com").make_request(
+            "POST", "/companies", auth=False, **{payload_arg: req_payload}
+        )
+
+    m.assert_called_once_with(
+        "POST",
+        "https://test-api.com/companies",
+        params={},
+        **json_request_args(req_payload, {}),
+        files=None,
+        timeout=3,
+        verify=True,
+    )
+
+
 @pytest.mark.parametrize("verify", [True, False])
 def test_make_request_with_security(verify):
     """
@@ -60,17 +86,15 @@ def test_make_request_with_security(verify):
 
     api = API(host="test-api.com", verify=verify).with_security(BearerToken("my_token"))
 
-    with mock.patch("requests.request", return_value=expected_resp) as m:
+    with mock.patch("requests.Session.request", return_value=expected_resp) as m:
         resp = api.make_request("POST", "/info", json=req_payload)
 
     m.assert_called_once_with(
         "POST",
         "https://test-api.com/info",
         params={},
-        headers={"Authorization": "Bearer my_token"},
-        data=[],
+        **json_request_args(req_payload, {"Authorization": "Bearer my_token"}),
         files=None,
-        json=to_dict(req_payload),
         timeout=3,
         verify=verify,
     )
@@ -91,7 +115,7 @@ def test_make_request_form_data(verify):
 
     api = API(host="test-api.com", verify=verify).with_security(BearerToken("my_token"))
 
-    with mock.patch("requests.request", return_value=expected_resp) as m:
+    with mock.patch("requests.Session.request", return_value=expected_resp) as m:
         resp = api.make_request("POST", "/info", data=req_payload)
 
     m.assert_called_once_with(
@@ -122,7 +146,7 @@ def test_make_request_xml(verify):
 
     api = API(host="test-api.com", verify=verify).with_security(BearerToken("my_token"))
 
-    with mock.patch("requests.request", return_value=expected_resp) as m:
+    with mock.patch("requests.Session.request", return_value=expected_resp) as m:
         resp = api.make_request(
             "POST",
             "/info",
@@ -165,17 +189,115 @@ def test_make_request_url_join(host, url):
     """
     req_payload = {"foo": "bar"}
 
-    with mock.patch("requests.request") as m:
+    with mock.patch("requests.Session.request") as m:
         API(host=host).make_request("POST", url, json=req_payload, auth=False)
 
     m.assert_called_once_with(
         "POST",
         "https://test-api.com/info",
         params={},
-        headers={},
-        data=[],
+        **json_request_args(req_payload, {}),
         files=None,
-        json=to_dict(req_payload),
         timeout=3,
         verify=True,
     )
+
+
+def test_session_pool_size():
+    """
+    Ensures that the connection pool size of the API session can be configured.
+    """
+    api = API(host="test-api.com", pool_connections=2, pool_maxsize=32)
+
+    adapter = api._session.get_adapter("https://test-api.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that keeps connections alive between requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"foo": "bar"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_reused():
+    """
+    Ensures that consecutive requests reuse the same session and its pooled
+    connections.
+    """
+    server = ThreadingHTTPServer(("localhost", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://localhost:{server.server_address[1]}"
+
+    try:
+        with mock.patch("requests.Session.close") as m:
+            with API(host=host) as api:
+                session = api._session
+                for _ in range(3):
+                    resp = api.make_request("GET", "/info", auth=False)
+                    assert resp.status_code == 200
+                    assert api._session is session
+
+                stats = api.connection_stats()
+                assert stats.requests == 3
+                assert stats.connections == 1
+                assert stats.reused == 2
+
+            # The session is closed when the context is exited
+            m.assert_called_once()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_session_reused_proxy():
+    """
+    Ensures that the connections opened to a proxy are counted.
+    """
+    proxy = ThreadingHTTPServer(("localhost", 0), _KeepAliveHandler)
+    threading.Thread(target=proxy.serve_forever, daemon=True).start()
+    proxy_url = f"http://localhost:{proxy.server_address[1]}"
+
+    try:
+        api = API(host="http://test-api.com")
+        for _ in range(3):
+            resp = api.make_request(
+                "GET", "/info", auth=False, proxies={"http": proxy_url}
+            )
+            assert resp.status_code == 200
+
+        stats = api.connection_stats()
+        assert stats.requests == 3
+        assert stats.connections == 1
+        assert stats.reused == 2
+    finally:
+        proxy.shutdown()
+        proxy.server_close()
+
+
+def test_session_not_reused(httpserver):
+    """
+    Ensures that the connection stats count every connection opened when the
+    server does not keep connections alive.
+    """
+    httpserver.expect_request("/info").respond_with_json({"foo": "bar"})
+
+    api = API(host=httpserver.url_for(""))
+    for _ in range(3):
+        api.make_request("GET", "/info", auth=False)
+
+    stats = api.connection_stats()
+    assert stats.requests == 3
+    assert stats.connections == 3
+    assert stats.reused == 0
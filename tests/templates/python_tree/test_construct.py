@@ -0,0 +1,154 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+from pydantic import Extra, Field, ValidationError, constr
+
+from apier.templates.python_tree.base.models.basemodel import APIBaseModel
+from apier.templates.python_tree.base.models.construct import construct_model
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Item(APIBaseModel):
+    name: str
+    price: float
+    color: Optional[Color] = None
+
+
+class Order(APIBaseModel):
+    id: int
+    created_at: datetime
+    items: List[Item]
+    items_by_name: Dict[str, Item] = {}
+    main_item: Optional[Item] = None
+    tags: List[str] = []
+    code: constr(max_length=3) = ""
+    total_count: int = Field(0, alias="totalCount")
+    extra_info: Any = None
+    metadata: dict = {}
+    value: Union[int, str] = 0
+    paid: bool = False
+
+
+class Orders(APIBaseModel):
+    __root__: List[Order]
+
+
+class Labels(APIBaseModel):
+    __root__: Dict[str, str]
+
+
+class Extensible(APIBaseModel):
+    name: str
+
+    class Config:
+        extra = Extra.allow
+
+
+order_data = {
+    "id": 7,
+    "created_at": "2024-05-01T10:00:00",
+    "items": [
+        {"name": "pen", "price": 2, "color": "blue"},
+        {"name": "book", "price": 12.5},
+    ],
+    "items_by_name": {"pen": {"name": "pen", "price": 2.5}},
+    "main_item": {"name": "book", "price": 12.5, "color": "red"},
+    "tags": ["a", "b"],
+    "code": "ABC",
+    "totalCount": 2,
+    "extra_info": {"foo": [1, 2]},
+    "metadata": {"source": "web"},
+    "value": "x",
+    "paid": True,
+}
+
+
+@pytest.mark.parametrize(
+    "model_class, data",
+    [
+        (Order, order_data),
+        (Order, {**order_data, "main_item": None, "value": 3}),
+        (Order, {"id": 1, "created_at": "2024-05-01T10:00:00", "items": []}),
+        (Orders, [order_data, order_data]),
+        (Labels, {"a": "b"}),
+        (Item, {"name": "pen", "price": "2.5"}),
+    ],
+)
+def test_construct_model(model_class, data):
+    """
+    Tests that models built from trusted data are equal to the models built
+    validating the same data.
+    """
+    model = construct_model(model_class, data)
+    assert isinstance(model, model_class)
+    assert model == model_class.parse_obj(data)
+    assert model.__fields_set__ == model_class.parse_obj(data).__fields_set__
+
+
+def test_construct_model_types():
+    """
+    Tests that nested models are built and values without a JSON type are
+    validated.
+    """
+    order = construct_model(Order, order_data)
+
+    assert all(isinstance(item, Item) for item in order.items)
+    assert isinstance(order.items_by_name["pen"], Item)
+    assert isinstance(order.main_item, Item)
+    assert isinstance(order.created_at, datetime)
+    assert order.items[0].color is Color.BLUE
+    assert isinstance(order.items[0].price, float)
+    assert order.total_count == 2
+
+    labels = construct_model(Labels, {"a": "b"})
+    assert dict(labels.items()) == {"a": "b"}
+
+
+def test_construct_model_not_validated():
+    """
+    Tests that the constraints of the values with the expected type are not
+    checked, while other values are still validated.
+    """
+    order = construct_model(Order, {**order_data, "code": "ABCDEF"})
+    assert order.code == "ABCDEF"
+
+    with pytest.raises(ValidationError):
+        construct_model(Order, {**order_data, "created_at": "yesterday"})
+    with pytest.raises(ValidationError):
+        construct_model(Order, {"id": 1, "items": []})
+    with pytest.raises(ValidationError):
+        construct_model(Item, {"name": "pen", "price": 1, "color": "green"})
+
+
+def test_construct_model_not_shared():
+    """
+    Tests that the lists and dictionaries of the models are not shared with
+    the data they were built from.
+    """
+    data = {**order_data, "extra_info": [1, 2], "metadata": {"source": "web"}}
+    order = construct_model(Order, data)
+
+    order.extra_info.append(3)
+    order.metadata["source"] = "app"
+    order.tags.append("c")
+
+    assert data["extra_info"] == [1, 2]
+    assert data["metadata"] == {"source": "web"}
+    assert data["tags"] == ["a", "b"]
+
+
+def test_construct_model_extra():
+    """
+    Tests that extra values are only kept if the model allows them.
+    """
+    model = construct_model(Extensible, {"name": "a", "other": 1})
+    assert model.other == 1
+
+    item = construct_model(Item, {"name": "pen", "price": 1.0, "other": 1})
+    assert not hasattr(item, "other")
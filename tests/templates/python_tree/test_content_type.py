@@ -1,5 +1,6 @@
 import pytest
 from apier.templates.python_tree.base.internal.content_type import (
+    get_content_type,
     parse_content_type,
     content_types_compatible,
 )
@@ -58,6 +59,16 @@ from apier.templates.python_tree.base.internal.content_type import (
                 "parameters": {"version": "1", "charset": "utf-8"},
             },
         ),
+        (
+            "multipart/form-data; boundary=a+b=c; empty=",
+            {
+                "media_type": "multipart/form-data",
+                "type": "multipart",
+                "subtype": "form-data",
+                "suffix": None,
+                "parameters": {"boundary": "a+b=c"},
+            },
+        ),
     ],
 )
 def test_parse_content_type(content_type, expected):
@@ -97,3 +108,11 @@ def test_parse_content_type(content_type, expected):
 )
 def test_content_types_are_compatible(type1, type2, expected):
     assert content_types_compatible(type1, type2) == expected
+
+
+def test_get_content_type():
+    content_type = get_content_type("application/vnd.api+json; charset=utf-8")
+    assert get_content_type("application/vnd.api+json; charset=utf-8") is content_type
+    assert content_type.media_type == "application/vnd.api+json"
+    assert content_type.format == "json"
+    assert content_type.parameters == {"charset": "utf-8"}
@@ -0,0 +1,68 @@
+import pytest
+
+from apier.templates.python_tree.base.internal.expected_responses import (
+    ExpectedResponses,
+)
+
+
+class Company:
+    pass
+
+
+class CompanyXML:
+    pass
+
+
+class Error:
+    pass
+
+
+class Empty:
+    pass
+
+
+expected_responses = ExpectedResponses(
+    [
+        (200, "application/json", Company),
+        (200, "application/xml", CompanyXML),
+        (204, "", Empty),
+        (0, "application/json", Error),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "status_code, content_type, expected",
+    [
+        (200, "application/json", ("application/json", Company)),
+        (200, "Application/JSON; charset=utf-8", ("application/json", Company)),
+        (200, "application/xml", ("application/xml", CompanyXML)),
+        (200, "*/*", ("application/json", Company)),
+        (204, "", ("", Empty)),
+        (204, "text/plain", ("", Empty)),
+        (404, "application/json", ("application/json", Error)),
+        (500, "application/json;charset=utf-8", ("application/json", Error)),
+        (200, "text/plain", None),
+        (404, "application/xml", None),
+    ],
+)
+def test_find(status_code: int, content_type: str, expected):
+    assert expected_responses.find(status_code, content_type) == expected
+
+
+def test_find_any_media_type():
+    responses = ExpectedResponses(
+        [(200, "application/json", Company), (200, "*/*", CompanyXML)]
+    )
+    assert responses.find(200, "application/json") == ("application/json", Company)
+    assert responses.find(200, "text/csv") == ("*/*", CompanyXML)
+
+
+def test_is_expected():
+    responses = ExpectedResponses(
+        [(200, "application/json", Company), (204, "", Empty)]
+    )
+    assert responses.is_expected(200)
+    assert responses.is_expected(204)
+    assert not responses.is_expected(404)
+    assert expected_responses.is_expected(404)
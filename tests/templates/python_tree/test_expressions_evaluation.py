@@ -1,6 +1,9 @@
 import pytest
 
-from apier.templates.python_tree.base.internal.expressions.evaluation import eval_expr
+from apier.templates.python_tree.base.internal.expressions.evaluation import (
+    compile_expr,
+    eval_expr,
+)
 
 
 @pytest.mark.parametrize(
@@ -65,3 +68,9 @@ def test_eval_expr_errors(expression, error):
     with pytest.raises(type(error)) as exc_info:
         eval_expr(expression)
     assert str(error) in str(exc_info.value)
+
+
+def test_compile_expr():
+    compiled = compile_expr("var0 * 2 + len(var1)")
+    assert compiled({"var0": 1, "var1": [1]}) == 3
+    assert compiled({"var0": 5, "var1": []}) == 10
@@ -4,6 +4,7 @@ import pytest
 from requests import Request, Response
 
 from apier.templates.python_tree.base.internal.expressions.runtime import (
+    compile_expression,
     evaluate,
     RuntimeExpressionError,
 )
@@ -294,3 +295,28 @@ def test_evaluate_with_errors(
     assert e.value.caused_by is not None
     assert type(e.value.caused_by) is type(expected_cause_error)
     assert str(e.value.caused_by) == str(expected_cause_error)
+
+
+def test_compile_expression():
+    """
+    Tests that a compiled expression is cached and can be evaluated on
+    different responses.
+    """
+    expression = "$eval({$request.query.offset ?? 0} + len({#users}))"
+    compiled = compile_expression(expression)
+    assert compile_expression(expression) is compiled
+
+    next_request = test_request.copy()
+    next_request.prepare_url(test_request.url, {"offset": 2})
+    next_response = make_response(200, test_dict, next_request)
+
+    assert compiled.evaluate(test_response) == 2
+    assert compiled.evaluate(next_response, query_param_types={"offset": int}) == 4
+
+
+def test_compile_expression_with_errors():
+    with pytest.raises(RuntimeExpressionError) as e:
+        compile_expression("$my_request.body")
+
+    assert type(e.value.caused_by) is ValueError
+    assert str(e.value.caused_by) == "Invalid runtime expression"
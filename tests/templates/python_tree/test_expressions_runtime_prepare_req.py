@@ -1,9 +1,9 @@
 import copy
-import json
 
 import pytest
 from requests import Request, Response, PreparedRequest
 
+from apier.templates.python_tree.base.internal import json_codec
 from apier.templates.python_tree.base.internal.expressions.runtime import (
     RuntimeExpressionError,
     prepare_request,
@@ -32,14 +32,14 @@ def test_prepare_request_set_payload_dotted():
     req.json = None
     result = prepare_request(req, "", {"foo": 123})
     assert isinstance(result, PreparedRequest)
-    assert result.body == json.dumps({"foo": 123}).encode("utf-8")
+    assert result.body == json_codec.dumps({"foo": 123})
 
     # Set attribute in empty payload
     req = copy.deepcopy(test_request)
     req.json = None
     result = prepare_request(req, "id", 123)
     assert isinstance(result, PreparedRequest)
-    assert result.body == json.dumps({"id": 123}).encode("utf-8")
+    assert result.body == json_codec.dumps({"id": 123})
 
     # Override array value
     req = copy.deepcopy(test_request)
@@ -47,7 +47,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"][1] = 123
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
     # Insert value in array
     req = copy.deepcopy(test_request)
@@ -55,7 +55,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"].append({"id": 3, "name": "Charlie"})
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
     # Insert nested dict in array
     req = copy.deepcopy(test_request)
@@ -63,7 +63,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"].append({"foo": {"bar": 123}})
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
     # Replace value
     req = copy.deepcopy(test_request)
@@ -71,7 +71,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"] = [1, 2, 3]
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
     # Convert non-dict value into a dict
     req = copy.deepcopy(test_request)
@@ -79,7 +79,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["next_offset"] = {"value": 2}
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
     # Override value inside list
     req = copy.deepcopy(test_request)
@@ -87,7 +87,7 @@ def test_prepare_request_set_payload_dotted():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"][1]["name"] = "Bobby"
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
 
 def test_prepare_request_set_payload():
@@ -96,14 +96,14 @@ def test_prepare_request_set_payload():
     req.json = None
     result = prepare_request(req, "$request.body", {"foo": 123})
     assert isinstance(result, PreparedRequest)
-    assert result.body == json.dumps({"foo": 123}).encode("utf-8")
+    assert result.body == json_codec.dumps({"foo": 123})
 
     # Set attribute in empty payload
     req = copy.deepcopy(test_request)
     req.json = None
     result = prepare_request(req, "$request.body#/id", 123)
     assert isinstance(result, PreparedRequest)
-    assert result.body == json.dumps({"id": 123}).encode("utf-8")
+    assert result.body == json_codec.dumps({"id": 123})
 
     # Override array value
     req = copy.deepcopy(test_request)
@@ -111,7 +111,7 @@ def test_prepare_request_set_payload():
     assert isinstance(result, PreparedRequest)
     expected_body = copy.deepcopy(test_payload)
     expected_body["users"][1] = 123
-    assert result.body == json.dumps(expected_body).encode("utf-8")
+    assert result.body == json_codec.dumps(expected_body)
 
 
 def test_prepare_query_params():
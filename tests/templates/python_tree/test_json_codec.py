@@ -0,0 +1,175 @@
+import json
+from unittest import mock
+
+import pytest
+from requests.exceptions import JSONDecodeError
+from requests.structures import CaseInsensitiveDict
+
+from apier.templates.python_tree.base.internal import json_codec
+from apier.templates.python_tree.base.internal.content_type import encode_json
+from apier.templates.python_tree.base.internal.response_body import json_body
+from apier.templates.python_tree.base.models.basemodel import APIBaseModel
+from .common import make_response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Person(APIBaseModel):
+    name: str
+    age: int
+
+
+@pytest.fixture
+def custom_codec():
+    loads = mock.Mock(side_effect=json.loads)
+    dumps = mock.Mock(
+        side_effect=lambda obj, default=None: json.dumps(
+            obj, default=default, separators=(",", ":")
+        ).encode("utf-8")
+    )
+    json_codec.set_json_codec(loads, dumps)
+    yield loads, dumps
+    json_codec.set_json_codec()
+
+
+def test_default_json_codec():
+    """
+    Tests that orjson is used by default if it is installed, and the json
+    module otherwise.
+    """
+    orjson = pytest.importorskip("orjson")
+    assert json_codec.default_json_codec() == (
+        json_codec.orjson_loads,
+        json_codec.orjson_dumps,
+    )
+    assert json_codec.get_json_codec() == json_codec.default_json_codec()
+
+    with mock.patch.object(json_codec, "orjson", None):
+        assert json_codec.default_json_codec() == (
+            json_codec.stdlib_loads,
+            json_codec.stdlib_dumps,
+        )
+
+    assert orjson.loads(json_codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        (json_codec.stdlib_loads, json_codec.stdlib_dumps),
+        (json_codec.orjson_loads, json_codec.orjson_dumps),
+    ],
+)
+def test_json_codecs(codec):
+    """
+    Tests that the built-in codecs encode and decode the same documents as the
+    json module.
+    """
+    if codec[0] is json_codec.orjson_loads:
+        pytest.importorskip("orjson")
+
+    loads, dumps = codec
+    values = [
+        {"name": "Alice", "tags": ["a", "ñ"], "age": 24, "score": 1.5},
+        {1: "a"},
+        2**70,
+        None,
+    ]
+    for value in values:
+        assert isinstance(dumps(value), bytes)
+        assert loads(dumps(value)) == json.loads(json.dumps(value))
+
+    assert dumps({"value": {1, 2}}, default=sorted) == dumps({"value": [1, 2]})
+    assert loads('{"value": NaN}')["value"] != 0
+    assert loads(b'{"a": 1}') == loads('{"a": 1}') == {"a": 1}
+
+
+def test_set_json_codec(custom_codec):
+    """
+    Tests that a custom JSON codec is used to decode responses, to parse
+    models and to encode request payloads.
+    """
+    loads, dumps = custom_codec
+
+    resp = make_response(200, {"name": "Alice", "age": 24})
+    assert json_body(resp) == {"name": "Alice", "age": 24}
+    assert loads.call_count == 1
+
+    person = Person.parse_raw('{"name": "Bob", "age": 30}')
+    assert person == Person(name="Bob", age=30)
+    assert loads.call_count == 2
+
+    assert encode_json(person) == b'{"name":"Bob","age":30}'
+    assert encode_json([1, 2]) == b"[1,2]"
+    assert dumps.call_count == 2
+
+
+def test_model_json():
+    """
+    Tests that models are serialized by the json module, as pydantic does.
+    """
+    person = Person.construct(name="Bob", age=float("nan"))
+
+    assert person.json() == json.dumps({"name": "Bob", "age": float("nan")})
+    assert person.json(indent=2) == json.dumps(
+        {"name": "Bob", "age": float("nan")}, indent=2
+    )
+
+
+@pytest.mark.parametrize(
+    "loads",
+    [
+        json.loads,
+        pytest.param(
+            lambda s: __import__("orjson").loads(s),
+            marks=pytest.mark.skipif(orjson is None, reason="orjson not installed"),
+        ),
+        mock.Mock(side_effect=ValueError("Invalid document")),
+    ],
+)
+def test_json_decode_error(loads):
+    """
+    Tests that documents that cannot be decoded raise the JSON decode error of
+    requests, whatever the codec.
+    """
+    json_codec.set_json_codec(loads=loads)
+    try:
+        with pytest.raises(JSONDecodeError):
+            json_codec.loads(b'{"name": ')
+    finally:
+        json_codec.set_json_codec()
+
+
+def test_orjson_loads_invalid_document():
+    """
+    Tests that invalid documents are only decoded once, by orjson, and that
+    documents that only the json module accepts are still decoded.
+    """
+    pytest.importorskip("orjson")
+
+    with mock.patch.object(json, "loads", wraps=json.loads) as stdlib_loads:
+        with pytest.raises(ValueError):
+            json_codec.orjson_loads('{"name": ')
+        assert stdlib_loads.call_count == 0
+
+        assert json_codec.orjson_loads('{"value": -Infinity}') == {
+            "value": float("-inf")
+        }
+        assert stdlib_loads.call_count == 1
+
+
+def test_json_body_encoding():
+    """
+    Tests that bodies using an encoding other than UTF-8 are decoded.
+    """
+    resp = make_response(
+        200,
+        headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
+    )
+    resp._content = '{"name": "Jürgen"}'.encode("latin-1")
+    resp.encoding = "latin-1"
+
+    assert json_body(resp) == {"name": "Jürgen"}
@@ -0,0 +1,111 @@
+import subprocess
+import sys
+
+import yaml
+
+from apier.core.build import build
+from apier.core.output import MANIFEST_FILENAME, STAGING_DIRNAME
+from apier.utils.path import abs_path_from_current_script
+
+
+def test_render_api_components_jobs(tmp_path):
+    """
+    Tests that the API tree rendered by several processes is the same as the
+    one rendered sequentially.
+    """
+    filename = abs_path_from_current_script("../../definitions/companies_api.yaml")
+
+    for jobs in (1, 2):
+        build({"jobs": jobs}, "python-tree", filename, str(tmp_path / f"jobs_{jobs}"))
+
+    sequential = {
+        p.name: p.read_text() for p in (tmp_path / "jobs_1" / "apis").glob("*.py")
+    }
+    parallel = {
+        p.name: p.read_text() for p in (tmp_path / "jobs_2" / "apis").glob("*.py")
+    }
+    assert len(sequential) > 1
+    assert parallel == sequential
+
+
+def test_render_template_cache(tmp_path):
+    """
+    Tests that the compiled templates are stored in the cache directory and
+    reused by the next builds.
+    """
+    filename = abs_path_from_current_script("../../definitions/companies_api.yaml")
+    ctx = {"cache_dir": str(tmp_path / "cache")}
+
+    build(ctx, "python-tree", filename, str(tmp_path / "build_1"))
+    cached = sorted((tmp_path / "cache" / "templates").iterdir())
+    assert len(cached) >= 3
+
+    build(ctx, "python-tree", filename, str(tmp_path / "build_2"))
+    assert sorted((tmp_path / "cache" / "templates").iterdir()) == cached
+    assert (tmp_path / "build_2" / "api.py").read_text() == (
+        tmp_path / "build_1" / "api.py"
+    ).read_text()
+
+
+def test_render_incremental(tmp_path):
+    """
+    Tests that incremental builds only write the files whose inputs have
+    changed, and remove the files that are no longer generated.
+    """
+    with open(
+        abs_path_from_current_script("../../definitions/companies_api.yaml")
+    ) as f:
+        spec = yaml.safe_load(f)
+
+    filename = str(tmp_path / "openapi.yaml")
+    output_path = tmp_path / "client"
+
+    def build_incremental():
+        with open(filename, "w") as f:
+            yaml.dump(spec, f)
+        build({"incremental": True}, "python-tree", filename, str(output_path))
+        return {
+            str(p.relative_to(output_path)): p.stat().st_mtime_ns
+            for p in output_path.rglob("*")
+            if p.is_file() and p.name != MANIFEST_FILENAME
+        }
+
+    mtimes = build_incremental()
+    assert "apis/echo_xml.py" in mtimes
+    assert not (output_path / STAGING_DIRNAME).exists()
+
+    # Nothing changes if the definition is the same
+    assert build_incremental() == mtimes
+
+    spec["paths"]["/tests/tests"]["get"]["description"] = "Duplicated layer names"
+    del spec["paths"]["/tests/echo_xml"]
+    new_mtimes = build_incremental()
+
+    assert "apis/echo_xml.py" not in new_mtimes
+    changed = {p for p in new_mtimes if new_mtimes[p] != mtimes[p]}
+    assert changed == {"apis/tests.py", "apis/tests1.py"}
+    assert "Duplicated layer names" in (output_path / "apis/tests1.py").read_text()
+
+    # The result is the same as a full build
+    full_output_path = tmp_path / "full"
+    build({}, "python-tree", filename, str(full_output_path))
+    for p in new_mtimes:
+        if p != "models/models.py":  # It has a timestamp
+            assert (output_path / p).read_text() == (full_output_path / p).read_text()
+    assert sorted(new_mtimes) == sorted(
+        str(p.relative_to(full_output_path))
+        for p in full_output_path.rglob("*")
+        if p.is_file() and p.name != MANIFEST_FILENAME
+    )
+
+
+def test_render_no_format(tmp_path):
+    """
+    Tests that the generated client can be imported if its code is not
+    formatted.
+    """
+    filename = abs_path_from_current_script("../../definitions/companies_api.yaml")
+    build({"no_format": True}, "python-tree", str(filename), str(tmp_path / "client"))
+
+    code = "from client import API; API().companies('acme').employees"
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True)
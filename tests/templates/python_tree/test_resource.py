@@ -5,6 +5,7 @@ import pytest
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from apier.templates.python_tree.base.internal import json_codec
 from apier.templates.python_tree.base.internal.resource import (
     ContentTypeValidationResult,
 )
@@ -71,8 +72,8 @@ class String(APIBaseModel):
             },
             ContentTypeValidationResult(
                 type="application/json",
-                data=None,
-                json={"name": "Alice", "age": 24},
+                data=json_codec.dumps({"name": "Alice", "age": 24}),
+                json=None,
                 headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
             ),
         ),
@@ -88,8 +89,8 @@ class String(APIBaseModel):
             },
             ContentTypeValidationResult(
                 type="application/json",
-                data=None,
-                json={"name": "Alice", "age": 24},
+                data=json_codec.dumps({"name": "Alice", "age": 24}),
+                json=None,
                 headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
             ),
         ),
@@ -105,8 +106,8 @@ class String(APIBaseModel):
             },
             ContentTypeValidationResult(
                 type="application/json",
-                data=None,
-                json={"name": "Alice", "age": 24},
+                data=json_codec.dumps({"name": "Alice", "age": 24}),
+                json=None,
                 headers=CaseInsensitiveDict({"Content-Type": "application/json"}),
             ),
         ),
@@ -194,8 +195,10 @@ class String(APIBaseModel):
             },
             ContentTypeValidationResult(
                 type="application/json-patch+json",
-                data=None,
-                json=[{"op": "replace", "path": "/name", "value": "Alice"}],
+                data=json_codec.dumps(
+                    [{"op": "replace", "path": "/name", "value": "Alice"}]
+                ),
+                json=None,
                 headers=CaseInsensitiveDict(
                     {"Content-Type": "application/json-patch+json"}
                 ),
@@ -0,0 +1,23 @@
+from unittest import mock
+
+from apier.templates.python_tree.base.internal import json_codec
+from apier.templates.python_tree.base.internal.expressions.runtime import evaluate
+from apier.templates.python_tree.base.internal.response_body import json_body
+from .common import make_response
+
+
+def test_json_body():
+    """
+    Tests that the body of a response is decoded only once, no matter how many
+    times it is used.
+    """
+    body = {"results": [{"value": 1}, {"value": 2}], "total": 2}
+    resp = make_response(200, body)
+
+    with mock.patch.object(json_codec, "loads", side_effect=json_codec.loads) as m:
+        assert json_body(resp) == body
+        assert json_body(resp) is json_body(resp)
+        assert evaluate(resp, "#results") == body["results"]
+        assert evaluate(resp, "$response.body#/total") == 2
+
+    assert m.call_count == 1
@@ -1,5 +1,6 @@
 import inspect
 import os
+from typing import List, Union
 
 from apier.core.build import build
 from apier.utils.path import abs_path_from_current_script
@@ -7,9 +8,15 @@ from apier.utils.path import abs_path_from_current_script
 build_cache = {}
 
 
-def build_client(template: str, definition_file: str):
+def build_client(template: str, definition_file: Union[str, List[str]]):
     ctx = {}
-    filename = abs_path_from_current_script(f"../definitions/{definition_file}")
+    if isinstance(definition_file, str):
+        filename = abs_path_from_current_script(f"../definitions/{definition_file}")
+    else:
+        # Multiple definitions are merged before building the client
+        filename = [
+            abs_path_from_current_script(f"../definitions/{f}") for f in definition_file
+        ]
 
     # Get the parent directory of the script that calls this function
     caller_path = os.path.dirname(inspect.stack()[1].filename)
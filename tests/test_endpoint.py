@@ -2,6 +2,7 @@ import copy
 
 import pytest
 
+from apier.core.api import endpoints as endpoints_module
 from apier.core.consts import NO_RESPONSE_ID
 from apier.core.api.endpoints import (
     EndpointsParser,
@@ -1085,3 +1086,148 @@ def test_process_endpoint_config(endpoint, expected_methods):
 
     parser.parse_content_schemas(endpoint)
     assert endpoint.operations == expected_methods
+
+
+def test_parse_endpoint_parameters_index():
+    """
+    Tests that the path parameters of an endpoint are described by the first
+    definition found in its path item, either shared or from an operation.
+    """
+    definition = Definition(
+        {
+            "paths": {
+                "/stores/{store_id}/{code}": {
+                    "get": {
+                        "parameters": [
+                            {
+                                "name": "store_id",
+                                "in": "path",
+                                "description": "From get",
+                                "schema": {"type": "integer"},
+                            }
+                        ],
+                        "responses": {},
+                    },
+                    "parameters": [
+                        {
+                            "name": "store_id",
+                            "in": "path",
+                            "description": "Shared",
+                            "schema": {"type": "string"},
+                        },
+                        {"$ref": "#/components/parameters/Code"},
+                    ],
+                }
+            },
+            "components": {
+                "parameters": {
+                    "Code": {"name": "code", "in": "path", "description": "Code"}
+                }
+            },
+        }
+    )
+
+    endpoint = EndpointsParser(definition).parse_endpoint("/stores/{store_id}/{code}")
+
+    assert endpoint.layers[0].parameters == [
+        EndpointParameter(
+            name="store_id",
+            in_location="path",
+            type="integer",
+            required=True,
+            description="From get",
+        ),
+        EndpointParameter(
+            name="code",
+            in_location="path",
+            type="string",
+            required=True,
+            description="Code",
+        ),
+    ]
+    assert [p.description for p in endpoint.operations[0].parameters] == [
+        "From get",
+        "Code",
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_parse_schema_name_taken(jobs, monkeypatch):
+    """
+    Tests that inline schemas whose names are already taken are given the
+    next free numeric suffix.
+    """
+    monkeypatch.setattr(endpoints_module, "_MIN_PATHS_PER_JOB", 1)
+    monkeypatch.setattr(endpoints_module.os, "cpu_count", lambda: 2)
+    operation = {
+        "requestBody": {"content": {"application/json": {"schema": {}}}},
+        "responses": {},
+    }
+    definition = Definition(
+        {
+            "paths": {
+                f"/items{i}": {"post": {**operation, "operationId": "addItem"}}
+                for i in range(4)
+            },
+            "components": {"schemas": {"AddItemRequest3": {"type": "object"}}},
+        }
+    )
+
+    endpoints = EndpointsParser(definition).parse_endpoints(jobs=jobs)
+    names = [e.operations[0].request_schemas[0].name for e in endpoints]
+
+    assert names == [
+        "AddItemRequest",
+        "AddItemRequest2",
+        "AddItemRequest4",
+        "AddItemRequest5",
+    ]
+
+
+def test_parse_endpoints_jobs_cpu_count(monkeypatch):
+    """
+    Tests that the endpoints are parsed sequentially if there is a single
+    CPU, regardless of the number of jobs.
+    """
+    monkeypatch.setattr(endpoints_module, "_MIN_PATHS_PER_JOB", 1)
+    monkeypatch.setattr(endpoints_module.os, "cpu_count", lambda: 1)
+
+    def parse_endpoints_parallel(*args):
+        raise AssertionError("endpoints parsed in parallel")
+
+    monkeypatch.setattr(
+        endpoints_module, "_parse_endpoints_parallel", parse_endpoints_parallel
+    )
+    definition = Definition.load("tests/definitions/companies_api.yaml")
+
+    endpoints = EndpointsParser(definition).parse_endpoints(jobs=4)
+
+    assert len(endpoints) == len(definition.paths)
+
+
+def test_parse_endpoints_jobs(monkeypatch):
+    """
+    Tests that the endpoints parsed by several processes are the same as the
+    ones parsed sequentially, including the names of the schemas.
+    """
+    monkeypatch.setattr(endpoints_module, "_MIN_PATHS_PER_JOB", 1)
+    monkeypatch.setattr(endpoints_module.os, "cpu_count", lambda: 2)
+    definition = Definition.load("tests/definitions/companies_api.yaml")
+
+    sequential_parser = EndpointsParser(definition)
+    sequential = sequential_parser.parse_endpoints()
+
+    parallel_parser = EndpointsParser(definition)
+    parallel = parallel_parser.parse_endpoints(jobs=2)
+
+    assert parallel == sequential
+    assert list(parallel_parser.schemas.items()) == list(
+        sequential_parser.schemas.items()
+    )
+
+    # The parsed endpoints reference the same definition objects
+    for endpoint in parallel:
+        assert endpoint.definition is definition
+        for operation in endpoint.operations:
+            path_item = definition.paths[endpoint.path]
+            assert operation.definition is path_item[operation.name]
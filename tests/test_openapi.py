@@ -0,0 +1,46 @@
+import pytest
+
+from apier.core.api.openapi import Definition
+
+definition_dict = {
+    "components": {
+        "schemas": {
+            "Store": {"type": "object"},
+            "Stores": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/Store"},
+            },
+        },
+    },
+}
+
+
+def test_solve_ref():
+    """
+    Tests that references are solved, and that the same reference always
+    returns the same object.
+    """
+    definition = Definition(definition_dict)
+
+    store = definition.solve_ref("#/components/schemas/Store")
+    assert store == {"type": "object"}
+    assert definition.solve_ref("#/components/schemas/Store") is store
+
+    with pytest.raises(KeyError, match="Reference '#/components/schemas/Pet'"):
+        definition.solve_ref("#/components/schemas/Pet")
+
+
+def test_solve_ref_definition_changed():
+    """
+    Tests that references are solved again if the definition is replaced or
+    its cache is cleared.
+    """
+    definition = Definition(definition_dict)
+    assert definition.solve_ref("#/components/schemas/Store") == {"type": "object"}
+
+    definition.definition = {"components": {"schemas": {"Store": {"type": "string"}}}}
+    assert definition.solve_ref("#/components/schemas/Store") == {"type": "string"}
+
+    definition.definition["components"]["schemas"]["Store"] = {"type": "integer"}
+    definition.clear_refs()
+    assert definition.solve_ref("#/components/schemas/Store") == {"type": "integer"}
@@ -0,0 +1,98 @@
+import os
+
+from apier.core.output import MANIFEST_FILENAME, OutputWriter
+
+
+def write_files(output_path, files: dict, incremental=True, fingerprint=""):
+    output = OutputWriter(str(output_path), fingerprint, incremental=incremental)
+    output.open()
+    for rel_path, content in files.items():
+        output.write(rel_path, content)
+    output.format(lambda path: None)
+    output.close()
+
+
+def test_output_writer_incremental(tmp_path):
+    """
+    Tests that incremental writes only update the changed files and remove
+    the files that are no longer written.
+    """
+    write_files(tmp_path, {"a.py": "a", "b.py": "b", "pkg/c.py": "c"})
+    assert (tmp_path / MANIFEST_FILENAME).exists()
+    os.utime(tmp_path / "a.py", ns=(0, 0))
+    os.utime(tmp_path / "b.py", ns=(0, 0))
+
+    write_files(tmp_path, {"a.py": "a", "b.py": "b2"})
+
+    assert (tmp_path / "a.py").stat().st_mtime_ns == 0
+    assert (tmp_path / "b.py").read_text() == "b2"
+    assert not (tmp_path / "pkg").exists()
+
+
+def test_output_writer_modified_file(tmp_path):
+    """
+    Tests that files modified after being written are written again.
+    """
+    write_files(tmp_path, {"a.py": "a", "b.py": "b"}, fingerprint="1")
+    (tmp_path / "a.py").write_text("modified")
+    os.utime(tmp_path / "b.py", ns=(0, 0))
+
+    write_files(tmp_path, {"a.py": "a", "b.py": "b"}, fingerprint="1")
+    assert (tmp_path / "a.py").read_text() == "a"
+    assert (tmp_path / "b.py").stat().st_mtime_ns == 0
+
+    # If the fingerprint changes, all the files are generated again, but only
+    # those whose content differs are written
+    (tmp_path / "a.py").write_text("modified")
+    write_files(tmp_path, {"a.py": "a", "b.py": "b"}, fingerprint="2")
+    assert (tmp_path / "a.py").read_text() == "a"
+    assert (tmp_path / "b.py").stat().st_mtime_ns == 0
+
+
+def test_output_writer_generate(tmp_path):
+    """
+    Tests that the generator of a group of files is only called if its inputs
+    have changed.
+    """
+    calls = []
+
+    def generator(path):
+        calls.append(path)
+        os.makedirs(os.path.join(path, "models"), exist_ok=True)
+        with open(os.path.join(path, "models", "models.py"), "w") as f:
+            f.write(str(len(calls)))
+
+    for input_hash in ("1", "1", "2"):
+        output = OutputWriter(str(tmp_path), incremental=True)
+        output.open()
+        output.generate("models", input_hash, generator)
+        output.close()
+
+    assert len(calls) == 2
+    assert (tmp_path / "models" / "models.py").read_text() == "2"
+
+
+def test_output_writer_not_incremental(tmp_path):
+    """
+    Tests that the output directory is replaced if the writes are not
+    incremental.
+    """
+    (tmp_path / "other.py").write_text("other")
+    write_files(tmp_path, {"a.py": "a"}, incremental=False)
+
+    assert (tmp_path / "a.py").read_text() == "a"
+    assert not (tmp_path / "other.py").exists()
+    assert not (tmp_path / MANIFEST_FILENAME).exists()
+
+
+def test_output_writer_incremental_without_manifest(tmp_path):
+    """
+    Tests that incremental writes replace an output directory that was not
+    written by a previous incremental build.
+    """
+    (tmp_path / "other.py").write_text("other")
+    write_files(tmp_path, {"a.py": "a"})
+
+    assert (tmp_path / "a.py").read_text() == "a"
+    assert not (tmp_path / "other.py").exists()
+    assert (tmp_path / MANIFEST_FILENAME).exists()
@@ -1,3 +1,4 @@
+import copy
 import random
 from typing import List
 
@@ -5,7 +6,7 @@ import pytest
 
 from apier.core.api.endpoints import Endpoint, EndpointsParser, EndpointLayer
 from apier.core.api.openapi import Definition
-from apier.core.api.tree import build_endpoints_tree
+from apier.core.api.tree import PathNotFoundException, build_endpoints_tree
 
 openapi_definition = Definition.load("tests/definitions/companies_api.yaml")
 
@@ -90,3 +91,99 @@ def test_build_endpoints_tree_order():
         assert tree.branches[0].api == "bar"
         assert tree.branches[1].api == "foo"
         assert tree.branches[0].next.branches[0] == tree.branches[1]
+
+
+def test_build_endpoints_tree_does_not_modify_endpoints(endpoints):
+    """
+    Tests that building an API tree does not modify the given endpoints, and
+    that the tree shares their operations instead of copying them.
+    """
+
+    def layers_state():
+        return [
+            [{k: copy.copy(v) for k, v in vars(layer).items()} for layer in e.layers]
+            for e in endpoints
+        ]
+
+    original_order = list(endpoints)
+    original_layers = layers_state()
+    tree = build_endpoints_tree(endpoints)
+
+    assert endpoints == original_order
+    assert layers_state() == original_layers
+    assert all(len(layer.next) == 0 for e in endpoints for layer in e.layers)
+
+    companies_layer = tree.branches[0].layers[1]
+    endpoint = next(e for e in endpoints if e.path == "/companies")
+    assert companies_layer is not endpoint.layers[0]
+    assert companies_layer.operations[0] is endpoint.operations[0]
+
+
+@pytest.mark.parametrize(
+    "path, expected_api, expected_layers",
+    [
+        ("/companies", "companies", ["/companies"]),
+        (
+            "/companies/{company_id}/employees",
+            "employees",
+            ["/companies/{company_id}", "/employees"],
+        ),
+        (
+            "/companies/{company_id}/departments/{department-name}/employees/{employee-num}",
+            "employees",
+            [
+                "/companies/{company_id}",
+                "/departments/{department-name}",
+                "/employees/{employee-num}",
+            ],
+        ),
+    ],
+)
+def test_search_path(endpoints, path, expected_api, expected_layers):
+    """
+    Tests searching the branch of an API tree that matches a path.
+    """
+    tree = build_endpoints_tree(endpoints)
+
+    _, node, layers = tree.search_path(path)
+    assert node.api == expected_api
+    assert [layer.path for layer in layers] == expected_layers
+
+    with pytest.raises(PathNotFoundException):
+        tree.search_path("/unknown")
+
+
+def test_build_endpoints_tree_equivalent_paths_order():
+    """
+    Tests that the first equivalent path whose source is a prefix of a path
+    is used, even if a later one has a longer source.
+    """
+    definition = Definition(
+        {
+            "info": {
+                "x-apier": {
+                    "equivalent_paths": [
+                        {"source": "/foo", "target": "/bar/foo"},
+                        {"source": "/foo/baz", "target": "/qux/baz"},
+                    ]
+                }
+            }
+        }
+    )
+    endpoints = [
+        Endpoint(
+            path=path,
+            layers=[
+                EndpointLayer(path=f"/{level}", api_levels=[level])
+                for level in path.split("/")[1:]
+            ],
+            definition=definition,
+        )
+        for path in ["/bar/foo/baz", "/qux/baz", "/foo/baz"]
+    ]
+
+    tree = build_endpoints_tree(endpoints)
+
+    bar_foo_node = tree.node("bar").next.node("foo")
+    assert tree.node("foo") is bar_foo_node
+    assert bar_foo_node.next.node("baz") is not tree.node("qux").next.node("baz")